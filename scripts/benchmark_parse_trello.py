@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: conversão card do Trello → ordem de serviço
+Compara a conversão original (card a card, tabelas remontadas a cada label,
+custom fields sempre processados) com o transformador pré-compilado de
+migrate_trello_to_supabase.py. Antes de medir, confere que as duas geram as
+mesmas OS.
+
+Execute: python benchmark_parse_trello.py [--cards N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from migrate_trello_to_supabase import (
+    CUSTOM_FIELD_PARA_CAMPO,
+    LABEL_PARA_PRIORIDADE,
+    LISTA_PARA_POSICAO,
+    parse_trello_cards_to_os,
+)
+
+# ========== CONVERSÃO ORIGINAL (referência) ==========
+
+def parse_trello_card_to_os_original(card: Dict[str, Any], list_name: str,
+                                     custom_fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """parse_trello_card_to_os como era antes do transformador pré-compilado"""
+    card_name = card.get("name", "")
+    card_desc = card.get("desc", "")
+    card_url = card.get("url", "")
+    card_id = card.get("id", "")
+
+    placa = ""
+    veiculo = ""
+    if " - " in card_name:
+        parts = card_name.split(" - ", 1)
+        placa = parts[0].strip()
+        veiculo = parts[1].strip() if len(parts) > 1 else ""
+    else:
+        veiculo = card_name
+
+    posicao_patio = LISTA_PARA_POSICAO.get(list_name, "entrada")
+
+    prioridade = "media"
+    cor_card = "#3b82f6"
+    tags = []
+
+    for label in card.get("labels", []):
+        label_name = label.get("name", "").upper()
+        label_color = label.get("color", "")
+
+        if label_name in LABEL_PARA_PRIORIDADE:
+            prioridade = LABEL_PARA_PRIORIDADE[label_name]
+
+        color_map = {
+            "red": "#ef4444",
+            "orange": "#f97316",
+            "yellow": "#eab308",
+            "green": "#22c55e",
+            "blue": "#3b82f6",
+            "purple": "#a855f7",
+        }
+        if label_color in color_map:
+            cor_card = color_map[label_color]
+
+        if label_name:
+            tags.append(label_name.lower())
+
+    mecanico_responsavel = None
+    if card.get("members"):
+        mecanico_responsavel = card["members"][0].get("fullName")
+
+    extras = {}
+    for name, value in (custom_fields or {}).items():
+        campo = CUSTOM_FIELD_PARA_CAMPO.get(name)
+        if campo and value not in (None, ""):
+            extras[campo] = value.strip() if isinstance(value, str) else value
+    placa = extras.get("vehicle_plate", placa)
+    veiculo = extras.get("vehicle_model", veiculo)
+    km_entrada = extras.get("km_entrada")
+    if isinstance(km_entrada, str):
+        digitos = re.sub(r"\D", "", km_entrada)
+        km_entrada = int(digitos) if digitos else None
+    elif km_entrada is not None:
+        km_entrada = int(km_entrada)
+
+    return {
+        "client_name": extras.get("client_name", veiculo),
+        "client_phone": extras.get("client_phone", ""),
+        "vehicle_plate": placa,
+        "vehicle_model": veiculo,
+        "km_entrada": km_entrada,
+        "service_description": card_desc or "Migrado do Trello",
+        "status": "em_andamento",
+        "posicao_patio": posicao_patio,
+        "prioridade": prioridade,
+        "cor_card": cor_card,
+        "tags": tags,
+        "mecanico_responsavel": mecanico_responsavel,
+        "observacoes_patio": f"Migrado do Trello\nCard ID: {card_id}\nURL: {card_url}",
+        "data_entrada": card.get("dateLastActivity") or datetime.now().isoformat(),
+        "trello_card_id": card_id,
+        "trello_card_url": card_url,
+    }
+
+
+# ========== DADOS SINTÉTICOS ==========
+
+LABELS = [
+    {"name": "URGENTE", "color": "red"},
+    {"name": "Alta", "color": "orange"},
+    {"name": "garantia", "color": "green"},
+    {"name": "cliente vip", "color": "purple"},
+    {"name": "", "color": "blue"},
+]
+MODELOS = ["Gol G5", "Onix LT", "Civic EXL", "HB20 Comfort", "Corolla XEi"]
+
+
+def fake_board(n_cards: int, seed: int = 42):
+    """Board sintético: (listas {id: nome}, cards) no formato da API do Trello"""
+    rng = random.Random(seed)
+    lists = {f"lista{i}": name for i, name in enumerate(LISTA_PARA_POSICAO)}
+    list_ids = list(lists)
+    cards = []
+    for i in range(n_cards):
+        if i % 2:
+            placa = f"{''.join(rng.choices('ABCDEFGHIJ', k=3))}{rng.randint(0, 9)}{rng.choice('ABCDEFGHIJ')}{rng.randint(10, 99)}"
+        else:
+            placa = f"{''.join(rng.choices('ABCDEFGHIJ', k=3))}-{rng.randint(1000, 9999)}"
+        cards.append({
+            "id": f"{i:024x}",
+            "name": f"{placa} - {rng.choice(MODELOS)}",
+            "desc": "Revisão completa" if i % 3 else "",
+            "url": f"https://trello.com/c/{i:08x}",
+            "idList": rng.choice(list_ids),
+            "dateLastActivity": "2026-01-20T12:00:00.000Z",
+            "labels": rng.sample(LABELS, rng.randint(0, 3)),
+            "members": [{"fullName": "Carlos Mecânico"}] if i % 4 else [],
+        })
+    return lists, cards
+
+
+# ========== MEDIÇÃO ==========
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Melhor tempo (s) entre `repeat` execuções"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da conversão card → OS")
+    parser.add_argument("--cards", type=int, default=50000, metavar="N", help="cards sintéticos (padrão: 50000)")
+    parser.add_argument("--repeat", type=int, default=5, metavar="N", help="repetições, vale a melhor (padrão: 5)")
+    args = parser.parse_args()
+
+    lists, cards = fake_board(args.cards)
+
+    def original() -> List[Dict[str, Any]]:
+        return [parse_trello_card_to_os_original(card, lists.get(card["idList"], "DESCONHECIDO")) for card in cards]
+
+    def compilado() -> List[Dict[str, Any]]:
+        return list(parse_trello_cards_to_os(cards, lists))
+
+    if original() != compilado():
+        print("❌ As duas conversões não geram as mesmas OS: a comparação não vale")
+        return
+    print(f"⏱️  Convertendo {len(cards)} cards (melhor de {args.repeat})")
+    print("=" * 50)
+    antes = best_time(original, args.repeat)
+    depois = best_time(compilado, args.repeat)
+    print(f"Original:        {len(cards) / antes:>12,.0f} cards/s")
+    print(f"Pré-compilado:   {len(cards) / depois:>12,.0f} cards/s")
+    print(f"Ganho:           {antes / depois:>12.2f}x")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
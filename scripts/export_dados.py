@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Exportação: Supabase → public/exports/dados
+Regenera os CSVs de public/exports/dados e o índice 00_INDICE_TABELAS.csv
+(registros e SHA-256 de cada arquivo) direto do banco
+
+Cada tabela é lida em páginas por keyset (id > último id da página anterior,
+ORDER BY id), e não por OFFSET: toda página custa o mesmo, mesmo com o banco
+em uso, e a memória fica em uma página por tabela. As linhas vão direto para
+o CSV (num .tmp, trocado pelo arquivo definitivo só no fim) e várias tabelas
+são exportadas em paralelo: pelo PostgREST, numa sessão HTTP com pool de
+conexões, ou direto no Postgres (--dsn, psycopg 3), com um pool e um COPY
+por página.
+
+Os dois caminhos gravam os mesmos bytes para o mesmo banco: cada coluna sai
+convertida para texto pelo próprio Postgres (col::text, em UTC), e o CSV segue
+as regras do COPY (nulo = campo vazio, texto vazio = ""). O separador de cada
+arquivo é mantido (01_companies.csv usa ";").
+
+Execute:
+    python export_dados.py                                  # via PostgREST do Supabase
+    python export_dados.py --dsn "$DATABASE_URL"            # direto no Postgres
+    python export_dados.py --tables profiles,vehicles --workers 8
+    python export_dados.py --dsn "$DATABASE_URL" --snapshot # + snapshots colunares (snapshot_dados.py)
+"""
+
+import argparse
+import csv
+import functools
+import hashlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limit import request, SUPABASE_LIMITER
+from snapshot_dados import SNAPSHOT_DIR, detect_delimiter, snapshot_path_for, write_snapshot
+from test_connections import SUPABASE_KEY, SUPABASE_URL
+
+# ========== CONFIGURAÇÕES ==========
+EXPORT_DIR = Path(__file__).resolve().parent.parent / "public" / "exports" / "dados"
+INDEX_FILE = "00_INDICE_TABELAS.csv"
+
+# Linhas por página: o PostgREST do Supabase devolve no máximo 1000 por requisição
+REST_PAGE_SIZE = 1000
+POSTGRES_PAGE_SIZE = 10000
+
+# Tabelas exportadas ao mesmo tempo (= conexões do pool)
+MAX_WORKERS = 4
+
+
+class ExportTable(NamedTuple):
+    arquivo: str
+    tabela: str
+    observacoes: str
+    enum: Optional[str] = None   # tipo enum do Postgres exportado no lugar de uma tabela
+
+
+# Na ordem do índice (a coluna "numero" é a posição)
+EXPORT_TABLES = [
+    ExportTable("01_companies.csv", "companies", "Empresas do grupo"),
+    ExportTable("02_roles_enum.csv", "app_role (enum)", "Papéis do sistema", enum="app_role"),
+    ExportTable("03_profiles.csv", "profiles", "Perfis de usuários"),
+    ExportTable("04_user_roles.csv", "user_roles", "Vínculo usuário-role"),
+    ExportTable("05_mechanics.csv", "mechanics", "Mecânicos cadastrados"),
+    ExportTable("06_recursos.csv", "recursos", "Elevadores/boxes/equipamentos"),
+    ExportTable("07_vehicles.csv", "vehicles", "Veículos de clientes"),
+    ExportTable("08_workflow_etapas.csv", "workflow_etapas", "Status da OS (Kanban)"),
+    ExportTable("09_services.csv", "services", "Catálogo de serviços"),
+    ExportTable("10_appointments.csv", "appointments", "Agendamentos"),
+    ExportTable("11_ordens_servico.csv", "ordens_servico", "Ordens de serviço"),
+    ExportTable("12_ordens_servico_itens.csv", "ordens_servico_itens", "Itens das OS"),
+    ExportTable("13_promotions.csv", "promotions", "Promoções ativas"),
+    ExportTable("14_events.csv", "events", "Eventos programados"),
+    ExportTable("15_oficina_config.csv", "oficina_config", "Configurações da oficina"),
+    ExportTable("16_invites.csv", "invites", "Convites de acesso"),
+    ExportTable("17_referral_campaigns.csv", "referral_campaigns", "Campanhas de indicação"),
+    ExportTable("18_gestao_dashboards.csv", "gestao_dashboards", "Dashboards personalizados"),
+    ExportTable("19_promo_clicks.csv", "promo_clicks", "Cliques em promoções"),
+    ExportTable("20_waitlist_interests.csv", "waitlist_interests", "Lista de espera"),
+]
+
+
+# ========== ARQUIVOS ==========
+
+class ExportFile:
+    """
+    CSV gravado num .tmp, com o SHA-256 calculado durante a escrita.
+    Só substitui o arquivo definitivo se a exportação terminar sem erro.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.delimiter = detect_delimiter(path)
+        self.tmp = path.with_name(path.name + ".tmp")
+        self.digest = hashlib.sha256()
+        self.file = None
+
+    def __enter__(self) -> "ExportFile":
+        self.file = open(self.tmp, "wb")
+        return self
+
+    def write(self, data) -> None:
+        self.digest.update(data)
+        self.file.write(data)
+
+    def write_rows(self, rows: List[List[Any]]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter=self.delimiter, lineterminator="\n").writerows(rows)
+        self.write(buffer.getvalue().encode("utf-8"))
+
+    def write_records(self, rows: List[List[Optional[str]]]) -> None:
+        """Linhas de dados com a grafia do COPY ... (FORMAT csv)"""
+        self.write("".join(copy_csv_line(row, self.delimiter) for row in rows).encode("utf-8"))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.tmp, self.path)
+        else:
+            self.tmp.unlink(missing_ok=True)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_csv_header(path: Path) -> Optional[List[str]]:
+    """Cabeçalho do CSV atual (usado quando a tabela vem vazia pelo REST)"""
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return next(csv.reader(f, delimiter=detect_delimiter(path)), None)
+
+
+def count_records(path: Path) -> int:
+    """Registros do CSV (sem o cabeçalho), contando campos com quebra de linha como um só"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return max(sum(1 for _ in csv.reader(f, delimiter=detect_delimiter(path))) - 1, 0)
+
+
+def enum_descriptions(path: Path) -> Dict[str, str]:
+    """{valor: descricao} do CSV atual do enum: as descrições são escritas à mão"""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f, delimiter=detect_delimiter(path))
+        return {row["valor"]: row.get("descricao") or "" for row in reader}
+
+
+def copy_csv_line(values: List[Optional[str]], delimiter: str) -> str:
+    """
+    Linha no formato csv do COPY: nulo é o campo vazio, e o texto vazio vai
+    entre aspas (o csv.writer grava os dois iguais); aspas só quando o valor
+    tem separador, aspas ou quebra de linha.
+    """
+    fields = []
+    for value in values:
+        if value is None:
+            fields.append("")
+        elif value == "" or delimiter in value or any(c in value for c in '"\n\r'):
+            fields.append('"' + value.replace('"', '""') + '"')
+        else:
+            fields.append(value)
+    return delimiter.join(fields) + "\n"
+
+
+# ========== POSTGREST ==========
+
+def create_rest_session(key: str, pool_size: int = MAX_WORKERS) -> requests.Session:
+    """Sessão HTTP compartilhada pelas tabelas (uma conexão do pool por tabela em andamento)"""
+    session = requests.Session()
+    # Datas com fuso em UTC, como no --dsn (PostgREST 12+; as versões anteriores ignoram)
+    session.headers["Prefer"] = "timezone=UTC"
+    if key:
+        session.headers.update({"apikey": key, "Authorization": f"Bearer {key}"})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_rows(session: requests.Session, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    response = request("GET", url, SUPABASE_LIMITER, session, params=params, timeout=60)
+    response.raise_for_status()
+    return response.json()
+
+
+def export_rest(session: requests.Session, rest_url: str, table: ExportTable, out: ExportFile,
+                page_size: int = REST_PAGE_SIZE) -> int:
+    """
+    Grava a tabela página a página (id=gt.<último id>); retorna o total de
+    registros. As colunas vêm da primeira linha e as páginas pedem cada uma
+    como col::text: o JSON traria datas ISO com "T", números como float e
+    arrays como listas, diferentes do COPY do --dsn.
+    """
+    url = f"{rest_url.rstrip('/')}/{table.tabela}"
+    first = get_rows(session, url, {"select": "*", "order": "id.asc", "limit": 1})
+    columns = list(first[0]) if first else read_csv_header(out.path)
+    if columns:
+        out.write_rows([columns])
+    if not first:
+        return 0
+    select = ",".join('"{}"::text'.format(column.replace('"', '""')) for column in columns)
+
+    last_id = None
+    total = 0
+    while True:
+        params = {"select": select, "order": "id.asc", "limit": page_size}
+        if last_id is not None:
+            params["id"] = f"gt.{last_id}"
+        rows = get_rows(session, url, params)
+        if not rows:
+            break
+        out.write_records([[row.get(column) for column in columns] for row in rows])
+        total += len(rows)
+        last_id = rows[-1]["id"]
+        if len(rows) < page_size:
+            break
+    return total
+
+
+# ========== POSTGRES ==========
+
+def export_postgres(pool, table: ExportTable, out: ExportFile,
+                    page_size: int = POSTGRES_PAGE_SIZE) -> int:
+    """
+    Grava a tabela página a página com COPY ... TO STDOUT (formato csv do
+    próprio Postgres). O fim de cada página sai do índice da PK (OFFSET sobre
+    os ids, sem ler as linhas); o COPY pega o intervalo (último id, fim].
+    Cada coluna sai como col::text, em UTC, como no REST (booleanos como
+    true/false em vez do t/f do COPY).
+    """
+    from psycopg import sql
+
+    with pool.connection() as conn, conn.cursor() as cur:
+        cur.execute("SET LOCAL TimeZone TO 'UTC'")
+        cur.execute("SET LOCAL DateStyle TO 'ISO, YMD'")
+        if table.enum:
+            descricoes = enum_descriptions(out.path)
+            cur.execute(sql.SQL("SELECT unnest(enum_range(NULL::{}))::text").format(
+                sql.Identifier("public", table.enum)))
+            valores = [valor for (valor,) in cur]
+            out.write_rows([["valor", "descricao"]] + [[v, descricoes.get(v, "")] for v in valores])
+            return len(valores)
+
+        name = sql.Identifier("public", table.tabela)
+        cur.execute(sql.SQL("SELECT * FROM {} LIMIT 0").format(name))
+        columns = [column.name for column in cur.description]
+        out.write_rows([columns])
+        select = sql.SQL(", ").join(
+            sql.SQL("{}::text AS {}").format(sql.Identifier(c), sql.Identifier(c)) for c in columns)
+
+        last_id = None
+        total = 0
+        while True:
+            after = sql.SQL("") if last_id is None else sql.SQL("WHERE id > {}").format(sql.Literal(last_id))
+            cur.execute(sql.SQL("SELECT id FROM {} {} ORDER BY id OFFSET {} LIMIT 1").format(
+                name, after, sql.Literal(page_size - 1)))
+            end = cur.fetchone()
+
+            bounds = [] if last_id is None else [sql.SQL("id > {}").format(sql.Literal(last_id))]
+            if end is not None:
+                bounds.append(sql.SQL("id <= {}").format(sql.Literal(end[0])))
+            where = sql.SQL("WHERE ") + sql.SQL(" AND ").join(bounds) if bounds else sql.SQL("")
+            with cur.copy(sql.SQL("COPY (SELECT {} FROM {} {} ORDER BY id) TO STDOUT "
+                                  "(FORMAT csv, DELIMITER {})").format(
+                    select, name, where, sql.Literal(out.delimiter))) as copy:
+                for data in copy:
+                    out.write(data)
+            total += cur.rowcount
+
+            if end is None:
+                return total
+            last_id = end[0]
+
+
+# ========== EXPORTAÇÃO ==========
+
+def export_table(export, table: ExportTable, export_dir: Path,
+                 snapshot_dir: Optional[Path] = None) -> Tuple[int, str, float]:
+    """Exporta uma tabela (e o snapshot colunar, com snapshot_dir); retorna (registros, sha256, segundos)"""
+    start = time.perf_counter()
+    with ExportFile(export_dir / table.arquivo) as out:
+        total = export(table, out)
+    if snapshot_dir is not None:
+        write_snapshot(out.path, snapshot_path_for(snapshot_dir, table.arquivo))
+    return total, out.digest.hexdigest(), time.perf_counter() - start
+
+
+def write_index(export_dir: Path, exported: Dict[str, Tuple[int, str]]) -> None:
+    """
+    Regrava o índice com registros e SHA-256 de cada arquivo. As tabelas que
+    não foram exportadas agora (--tables, erro) são contadas no arquivo atual.
+    """
+    rows = [["numero", "arquivo", "tabela", "registros", "observacoes", "sha256"]]
+    for numero, table in enumerate(EXPORT_TABLES, start=1):
+        path = export_dir / table.arquivo
+        if table.arquivo in exported:
+            registros, sha256 = exported[table.arquivo]
+        elif path.exists():
+            registros, sha256 = count_records(path), file_sha256(path)
+        else:
+            registros, sha256 = "", ""
+        rows.append([numero, table.arquivo, table.tabela, registros, table.observacoes, sha256])
+    with ExportFile(export_dir / INDEX_FILE) as out:
+        out.write_rows(rows)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Regenera public/exports/dados a partir do banco")
+    parser.add_argument("--dsn", default=None,
+                        help="exporta direto do Postgres (ex: $DATABASE_URL) em vez do PostgREST")
+    parser.add_argument("--url", default=f"{SUPABASE_URL}/rest/v1",
+                        help="URL base do REST (padrão: Supabase; ex: http://localhost:3000 para PostgREST local)")
+    parser.add_argument("--key", default=os.getenv("SUPABASE_SERVICE_ROLE_KEY", SUPABASE_KEY),
+                        help="chave (apikey/Bearer); com a anon key, a RLS pode esconder linhas "
+                             "(padrão: $SUPABASE_SERVICE_ROLE_KEY, se definida)")
+    parser.add_argument("--tables", default=None,
+                        help="só estas tabelas, separadas por vírgula (padrão: todas do índice)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, metavar="N",
+                        help=f"tabelas exportadas em paralelo (padrão: {MAX_WORKERS})")
+    parser.add_argument("--page-size", type=int, default=None, metavar="N",
+                        help=f"linhas por página (padrão: {REST_PAGE_SIZE} no REST, {POSTGRES_PAGE_SIZE} no Postgres)")
+    parser.add_argument("--output", type=Path, default=EXPORT_DIR,
+                        help=f"pasta de destino (padrão: {EXPORT_DIR})")
+    parser.add_argument("--snapshot", action="store_true",
+                        help=f"grava também o snapshot colunar de cada tabela em {SNAPSHOT_DIR.name}/ "
+                             "dentro de --output")
+    args = parser.parse_args(argv)
+    if args.tables:
+        names = {name.strip() for name in args.tables.split(",") if name.strip()}
+        unknown = names - {t.tabela for t in EXPORT_TABLES} - {t.enum for t in EXPORT_TABLES if t.enum}
+        if unknown:
+            parser.error(f"tabela(s) fora do índice: {', '.join(sorted(unknown))}")
+        args.tables = names
+    return args
+
+
+def main(argv=None) -> bool:
+    args = parse_args(argv)
+    workers = max(args.workers, 1)
+    tables = [t for t in EXPORT_TABLES
+              if args.tables is None or t.tabela in args.tables or t.enum in args.tables]
+    args.output.mkdir(parents=True, exist_ok=True)
+    snapshot_dir = args.output / SNAPSHOT_DIR.name if args.snapshot else None
+    if snapshot_dir is not None:
+        snapshot_dir.mkdir(exist_ok=True)
+
+    pool = None
+    if args.dsn:
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            print('❌ --dsn precisa do psycopg 3 com o pool: pip install "psycopg[binary,pool]"')
+            return False
+        pool = ConnectionPool(args.dsn, min_size=1, max_size=workers, open=True)
+        page_size = args.page_size or POSTGRES_PAGE_SIZE
+        export = functools.partial(export_postgres, pool, page_size=page_size)
+        origem = "Postgres"
+    else:
+        session = create_rest_session(args.key, workers)
+        page_size = args.page_size or REST_PAGE_SIZE
+        export = functools.partial(export_rest, session, args.url, page_size=page_size)
+        origem = args.url
+        for table in [t for t in tables if t.enum]:
+            print(f"⏭️  {table.arquivo}: o PostgREST não expõe enums (use --dsn); mantido o arquivo atual")
+            tables.remove(table)
+
+    print(f"📤 Exportando {len(tables)} tabelas de {origem} para {args.output} "
+          f"({workers} em paralelo, páginas de {page_size})\n")
+    start = time.perf_counter()
+    exported = {}
+    falhas = 0
+    try:
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [(table, executor.submit(export_table, export, table, args.output, snapshot_dir))
+                       for table in tables]
+            for table, future in futures:
+                try:
+                    registros, sha256, elapsed = future.result()
+                except Exception as e:
+                    falhas += 1
+                    print(f"❌ {table.arquivo} ({table.tabela}): {str(e).strip()} — arquivo anterior mantido")
+                    continue
+                exported[table.arquivo] = (registros, sha256)
+                print(f"✅ {table.arquivo}: {registros} registros em {elapsed:.2f} s")
+    finally:
+        if pool is not None:
+            pool.close()
+
+    write_index(args.output, exported)
+    print(f"\n🗂️  Índice {INDEX_FILE} atualizado")
+    print(f"⏱️  {len(exported)} tabelas em {time.perf_counter() - start:.2f} s"
+          + (f", {falhas} com erro" if falhas else ""))
+    return not falhas
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
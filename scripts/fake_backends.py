@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Backends locais no lugar do Trello e do Supabase, para medir a migração offline
+
+- FakeTrelloBoard: board sintético e determinístico (mesma semente = mesmos
+  cards), com listas, labels, membros e custom fields, gerado sob demanda:
+  100 mil cards não ocupam memória até serem pedidos.
+- FakePostgREST: destino no formato do PostgREST (upsert por on_conflict,
+  filtros eq./gt., Prefer return=representation) gravando num SQLite em memória.
+- FakeAdapter: adaptador do requests que atende as chamadas dentro do processo
+  e conta requisições e bytes enviados/recebidos por rota.
+
+Uso:
+    board, sink = FakeTrelloBoard(100000), FakePostgREST()
+    install(board, sink)          # antes de migrate_trello_to_supabase.main()
+"""
+
+import json
+import random
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import migrate_trello_to_supabase as migracao
+from rate_limit import TRELLO_LIMITER, SUPABASE_LIMITER
+
+STATUS_TEXTO = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request",
+                404: "Not Found", 409: "Conflict"}
+
+
+# ========== ADAPTADOR ==========
+
+class FakeAdapter(BaseAdapter):
+    """
+    Atende as requisições chamando backend.handle(method, path, query, body, headers),
+    que devolve (rota, status, corpo, cabeçalhos). Conta requisições e bytes por rota.
+    """
+
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+        self.lock = threading.Lock()
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.bytes_sent: Dict[str, int] = defaultdict(int)
+        self.bytes_received: Dict[str, int] = defaultdict(int)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        start = time.perf_counter()
+        parts = urlsplit(request.url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        route, status, payload, headers = self.backend.handle(
+            request.method, parts.path, query, body, request.headers)
+        content = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        with self.lock:
+            self.requests[route] += 1
+            self.bytes_sent[route] += len(body)
+            self.bytes_received[route] += len(content)
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = STATUS_TEXTO.get(status, "")
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json; charset=utf-8",
+                                                "Content-Length": str(len(content)), **headers})
+        response._content = content
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=time.perf_counter() - start)
+        return response
+
+    def close(self):
+        pass
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """{rota: {requisicoes, bytes_enviados, bytes_recebidos}}"""
+        with self.lock:
+            return {
+                route: {
+                    "requisicoes": count,
+                    "bytes_enviados": self.bytes_sent[route],
+                    "bytes_recebidos": self.bytes_received[route],
+                }
+                for route, count in sorted(self.requests.items())
+            }
+
+
+# ========== TRELLO ==========
+
+MODELOS = ["Gol G5", "Onix LT", "Civic EXL", "HB20 Comfort", "Corolla XEi", "Strada Freedom", "Kwid Zen"]
+CLIENTES = ["Ana Souza", "Bruno Lima", "Carla Dias", "Diego Alves", "Elisa Rocha", "Fábio Nunes"]
+MECANICOS = ["Carlos Mecânico", "João Elétrica", "Marcos Funilaria"]
+LABELS = [
+    {"id": "label-urgente", "name": "URGENTE", "color": "red"},
+    {"id": "label-alta", "name": "Alta", "color": "orange"},
+    {"id": "label-baixa", "name": "Baixa", "color": "yellow"},
+    {"id": "label-garantia", "name": "garantia", "color": "green"},
+    {"id": "label-vip", "name": "cliente vip", "color": "purple"},
+    {"id": "label-azul", "name": "", "color": "blue"},
+]
+CUSTOM_FIELDS = [
+    {"id": "cf-cliente", "name": "Cliente", "type": "text"},
+    {"id": "cf-telefone", "name": "Telefone", "type": "text"},
+    {"id": "cf-km", "name": "KM", "type": "number"},
+    {"id": "cf-modelo", "name": "Modelo", "type": "list",
+     "options": [{"id": f"cf-modelo-{i}", "value": {"text": modelo}} for i, modelo in enumerate(MODELOS)]},
+]
+
+# Um card fechado a cada CLOSED_EVERY (não aparece em cards/open)
+CLOSED_EVERY = 20
+
+
+class FakeTrelloBoard:
+    """Board sintético com `n_cards` cards; o card i tem ID f"{i + 1:024x}" (cresce com a criação)"""
+
+    def __init__(self, n_cards: int, seed: int = 42, board_id: str = migracao.TRELLO_BOARD_ID):
+        self.n_cards = n_cards
+        self.seed = seed
+        self.board_id = board_id
+        self.lists = [{"id": f"lista{i:020x}", "name": name} for i, name in enumerate(migracao.LISTA_PARA_POSICAO)]
+        self.created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.revisions: Dict[int, int] = {}   # card → nº de alterações feitas com touch()
+        self.actions: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+
+    def card(self, index: int) -> Dict[str, Any]:
+        """Card de número `index`, sempre igual para a mesma semente (e revisão)"""
+        rng = random.Random(self.seed * 1_000_003 + index)
+        revision = self.revisions.get(index, 0)
+        letras = "".join(rng.choices("ABCDEFGHJKLMNPRSTUVWXYZ", k=3))
+        if index % 2:
+            placa = f"{letras}{rng.randint(0, 9)}{rng.choice('ABCDEFGHIJ')}{rng.randint(10, 99)}"
+        else:
+            placa = f"{letras}-{rng.randint(1000, 9999)}"
+        modelo = rng.randrange(len(MODELOS))
+        mecanico = rng.randrange(len(MECANICOS))
+
+        custom_fields = []
+        if index % 3:
+            custom_fields.append({"idCustomField": "cf-cliente", "value": {"text": rng.choice(CLIENTES)}})
+            custom_fields.append({"idCustomField": "cf-telefone", "value": {"text": f"119{rng.randint(10000000, 99999999)}"}})
+        if index % 4:
+            custom_fields.append({"idCustomField": "cf-km", "value": {"number": str(rng.randint(1000, 250000))}})
+        if index % 5 == 1:
+            custom_fields.append({"idCustomField": "cf-modelo", "idValue": f"cf-modelo-{modelo}"})
+
+        return {
+            "id": f"{index + 1:024x}",
+            "name": f"{placa} - {MODELOS[modelo]}",
+            "desc": "Revisão completa, troca de óleo e filtros" if index % 3 else "",
+            "url": f"https://trello.com/c/{index + 1:08x}",
+            "idList": self.lists[(rng.randrange(len(self.lists)) + revision) % len(self.lists)]["id"],
+            "closed": index % CLOSED_EVERY == 0,
+            "dateLastActivity": (self.created_at + timedelta(minutes=index + revision)).isoformat().replace("+00:00", "Z"),
+            "labels": rng.sample(LABELS, rng.randint(0, 3)),
+            "members": [{"id": f"membro{mecanico}", "fullName": MECANICOS[mecanico]}] if index % 4 else [],
+            "customFieldItems": custom_fields,
+        }
+
+    def touch(self, count: int, seed: int = 0) -> List[str]:
+        """Simula atividade em `count` cards abertos (muda a lista); devolve os IDs alterados"""
+        rng = random.Random(seed)
+        indexes = [i for i in rng.sample(range(self.n_cards), min(count, self.n_cards)) if i % CLOSED_EVERY]
+        now = datetime.now(timezone.utc)
+        with self.lock:
+            for index in indexes:
+                self.revisions[index] = self.revisions.get(index, 0) + 1
+                self.actions.append({
+                    "id": f"{len(self.actions) + 1:024x}",
+                    "type": "updateCard",
+                    "date": now.isoformat().replace("+00:00", "Z"),
+                    "data": {"card": {"id": f"{index + 1:024x}"}},
+                })
+        return [f"{index + 1:024x}" for index in indexes]
+
+    def open_cards(self, limit: int, before: Optional[str], since: Optional[str]) -> List[Dict[str, Any]]:
+        """Os `limit` cards abertos mais novos entre `since` e `before` (IDs exclusivos)"""
+        upper = int(before, 16) - 1 if before else self.n_cards
+        lower = int(since, 16) if since else 0
+        cards = []
+        for index in range(min(upper, self.n_cards) - 1, lower - 1, -1):
+            if index % CLOSED_EVERY:
+                cards.append(self.card(index))
+                if len(cards) == limit:
+                    break
+        return cards
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: bytes, headers) -> Tuple[str, int, Any, Dict[str, str]]:
+        parts = path.strip("/").split("/")[1:]   # sem o "1" da versão da API
+        if method != "GET" or len(parts) < 2:
+            return f"{method} {path}", 404, {"message": "not found"}, {}
+
+        if parts[0] == "cards":
+            index = int(parts[1], 16) - 1 if all(c in "0123456789abcdef" for c in parts[1]) else -1
+            if not 0 <= index < self.n_cards:
+                return "GET /cards/:id", 404, {"message": "The requested resource was not found."}, {}
+            return "GET /cards/:id", 200, self.card(index), {}
+
+        if parts[0] != "boards" or parts[1] != self.board_id:
+            return f"GET {path}", 404, {"message": "invalid id"}, {}
+        resource = "/".join(parts[2:])
+        route = f"GET /boards/:id/{resource}".rstrip("/")
+        limit = int(query.get("limit") or 1000)
+
+        if resource == "":
+            return route, 200, {"id": self.board_id, "name": "Board sintético"}, {}
+        if resource == "lists":
+            return route, 200, self.lists, {}
+        if resource == "customFields":
+            return route, 200, CUSTOM_FIELDS, {}
+        if resource in ("cards", "cards/open"):
+            return route, 200, self.open_cards(limit, query.get("before"), query.get("since")), {}
+        if resource == "actions":
+            since = query.get("since") or ""
+            before = query.get("before")
+            with self.lock:
+                actions = [a for a in reversed(self.actions)
+                           if a["date"] > since and (before is None or a["id"] < before)]
+            return route, 200, actions[:limit], {}
+        return route, 404, {"message": "not found"}, {}
+
+
+# ========== POSTGREST ==========
+
+class FakePostgREST:
+    """
+    Destino PostgREST em SQLite (em memória): cada tabela guarda as linhas em
+    JSON, com id sequencial e a coluna de on_conflict como chave única
+    (indexada: filtros eq. nessa coluna não varrem a tabela).
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.tables = set()
+        self.keys: Dict[str, str] = {}   # tabela → coluna do on_conflict
+
+    def table(self, name: str) -> str:
+        if name not in self.tables:
+            self.db.execute(f'CREATE TABLE IF NOT EXISTS "{name}" '
+                            "(id INTEGER PRIMARY KEY, chave TEXT UNIQUE, data TEXT NOT NULL)")
+            self.tables.add(name)
+        return f'"{name}"'
+
+    def count(self, name: str) -> int:
+        """Linhas gravadas na tabela"""
+        with self.lock:
+            return self.db.execute(f"SELECT count(*) FROM {self.table(name)}").fetchone()[0]
+
+    def rows(self, name: str) -> List[Dict[str, Any]]:
+        """Todas as linhas da tabela, em ordem de inserção"""
+        with self.lock:
+            return [dict(json.loads(data), id=row_id) for row_id, data in
+                    self.db.execute(f"SELECT id, data FROM {self.table(name)} ORDER BY id")]
+
+    def where(self, tabela: str, query: Dict[str, str]) -> Tuple[str, List[Any]]:
+        """Filtros coluna=eq.valor e id=gt.valor (os demais parâmetros do PostgREST são ignorados aqui)"""
+        clauses, params = [], []
+        for column, value in query.items():
+            if column in ("select", "order", "limit", "offset", "on_conflict", "columns"):
+                continue
+            if column == "id" and value.startswith("gt."):
+                clauses.append("id > ?")
+                params.append(int(value[3:]))
+                continue
+            if not value.startswith("eq."):
+                raise ValueError(f"filtro não suportado: {column}={value}")
+            if column == "id":
+                clauses.append("CAST(id AS TEXT) = ?")
+            elif column == self.keys.get(tabela):
+                clauses.append("chave = ?")
+            else:
+                clauses.append("CAST(json_extract(data, ?) AS TEXT) = ?")
+                params.append(f"$.{column}")
+            params.append(value[3:])
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def project(rows: Iterable[Tuple[int, str]], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        columns = [c for c in query.get("select", "*").split(",") if c and c != "*"]
+        result = []
+        for row_id, data in rows:
+            row = dict(json.loads(data), id=row_id)
+            result.append({c: row.get(c) for c in columns} if columns else row)
+        return result
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: bytes, headers) -> Tuple[str, int, Any, Dict[str, str]]:
+        parts = path.strip("/").split("/")
+        if parts[:2] != ["rest", "v1"]:
+            return f"{method} {path}", 404, {"message": "not found"}, {}
+        if len(parts) == 2:
+            return "GET /rest/v1/", 200, {"swagger": "2.0", "paths": {f"/{t}": {} for t in self.tables}}, {}
+
+        name = parts[2]
+        route = f"{method} /rest/v1/{name}"
+        prefer = headers.get("Prefer", "")
+        representation = "return=representation" in prefer
+        try:
+            with self.lock, self.db:
+                tabela = self.table(name)
+                if method == "GET":
+                    status, payload = 200, self.select(tabela, query)
+                elif method == "POST":
+                    status, payload = 201, self.insert(tabela, json.loads(body), query.get("on_conflict"),
+                                                       "merge-duplicates" in prefer)
+                elif method == "PATCH":
+                    status, payload = 200, self.update(tabela, json.loads(body), query)
+                elif method == "DELETE":
+                    status, payload = 200, self.delete(tabela, query)
+                else:
+                    return route, 405, {"message": "method not allowed"}, {}
+        except sqlite3.IntegrityError as e:
+            return route, 409, {"code": "23505", "message": str(e)}, {}
+        except ValueError as e:
+            return route, 400, {"message": str(e)}, {}
+
+        if method != "GET" and not representation:
+            return route, 201 if method == "POST" else 204, None, {}
+        return route, status, payload, {}
+
+    def select(self, tabela: str, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        where, params = self.where(tabela, query)
+        order = ""
+        if query.get("order"):
+            column, _, direction = query["order"].partition(".")
+            order = (" ORDER BY " + ("id" if column == "id" else f"json_extract(data, '$.{column}')")
+                     + (" DESC" if direction.startswith("desc") else ""))
+        limit = f" LIMIT {int(query['limit'])}" if query.get("limit") else ""
+        offset = f" OFFSET {int(query['offset'])}" if query.get("offset") else ""
+        return self.project(self.db.execute(f"SELECT id, data FROM {tabela}{where}{order}{limit}{offset}", params), query)
+
+    def insert(self, tabela: str, payload: Any, on_conflict: Optional[str], merge: bool) -> List[Dict[str, Any]]:
+        rows = payload if isinstance(payload, list) else [payload]
+        if on_conflict:
+            self.keys.setdefault(tabela, on_conflict)
+        upsert = " ON CONFLICT(chave) DO UPDATE SET data = json_patch(data, excluded.data)" if on_conflict and merge else ""
+        result = []
+        for row in rows:
+            chave = row.get(on_conflict) if on_conflict else None
+            data = json.dumps(row, ensure_ascii=False)
+            self.db.execute(f"INSERT INTO {tabela} (chave, data) VALUES (?, ?){upsert}", (chave, data))
+            if chave is None:
+                row_id = self.db.execute("SELECT last_insert_rowid()").fetchone()[0]
+            else:
+                row_id = self.db.execute(f"SELECT id FROM {tabela} WHERE chave = ?", (chave,)).fetchone()[0]
+            result.append(dict(row, id=row_id))
+        return result
+
+    def update(self, tabela: str, changes: Dict[str, Any], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        where, params = self.where(tabela, query)
+        ids = [row_id for (row_id,) in self.db.execute(f"SELECT id FROM {tabela}{where}", params)]
+        self.db.executemany(f"UPDATE {tabela} SET data = json_patch(data, ?) WHERE id = ?",
+                            [(json.dumps(changes, ensure_ascii=False), row_id) for row_id in ids])
+        return self.project(self.db.execute(
+            f"SELECT id, data FROM {tabela} WHERE id IN ({','.join('?' * len(ids))})", ids), query)
+
+    def delete(self, tabela: str, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        where, params = self.where(tabela, query)
+        rows = self.project(self.db.execute(f"SELECT id, data FROM {tabela}{where}", params), query)
+        self.db.execute(f"DELETE FROM {tabela}{where}", params)
+        return rows
+
+
+# ========== INSTALAÇÃO ==========
+
+def install(board: FakeTrelloBoard, sink: FakePostgREST, sessions: Iterable[requests.Session] = (),
+            rate_limits: bool = False) -> Tuple[FakeAdapter, FakeAdapter]:
+    """
+    Registra os backends locais em migrate_trello_to_supabase.BACKEND_ADAPTERS
+    (valem para as sessões criadas depois, como as de main()) e monta também
+    nas `sessions` já existentes (ex: test_connections.http).
+    Sem rate_limits, os limitadores de taxa deixam de segurar as chamadas.
+    Devolve (adaptador do Trello, adaptador do Supabase), com as contagens.
+    """
+    trello = FakeAdapter(board)
+    supabase = FakeAdapter(sink)
+    migracao.BACKEND_ADAPTERS[migracao.TRELLO_API_URL] = trello
+    migracao.BACKEND_ADAPTERS[migracao.SUPABASE_URL] = supabase
+    for session in sessions:
+        migracao.mount_backends(session)
+    if not rate_limits:
+        for limiter in (TRELLO_LIMITER, SUPABASE_LIMITER):
+            limiter.rate = limiter.max_rate = limiter.capacity = limiter.tokens = 1e9
+    migracao.get_board_custom_fields.cache_clear()
+    return trello, supabase
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Relatórios financeiros das OS (NumPy) a partir de public/exports/dados
+
+Carrega 11_ordens_servico.csv e 12_ordens_servico_itens.csv em arrays
+tipados (só as colunas usadas; pelos snapshots colunares de snapshot_dados.py
+quando estão atualizados, senão direto do CSV) e agrega tudo com operações
+vetorizadas: cada agrupamento vira um código inteiro por linha e as
+somas/contagens saem de np.bincount, sem laço por linha.
+
+- OS, por mês (data_entrada, ou created_at), mecânico e/ou status:
+  valor_orcado × valor_aprovado × valor_final, taxa de aprovação, ticket médio
+- Itens, por tipo, status do item, mês e/ou mecânico da OS:
+  custo (valor_custo × quantidade), venda (valor_total), venda sugerida,
+  margem e margem_aplicada média
+
+O resultado fica em cache (colunar/relatorios/), pela soma de verificação
+dos CSVs usados e dos agrupamentos pedidos: rodar de novo sem exportação
+nova não recalcula nada.
+
+Execute:
+    python financeiro_dados.py                              # OS por mês, itens por tipo
+    python financeiro_dados.py --os-by mes,mecanico --itens-by tipo,mes
+    python financeiro_dados.py --json > relatorio.json
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # só main() avisa; o módulo continua importável
+    np = None
+
+from snapshot_dados import (DATE_RE, EXPORT_DIR, SNAPSHOT_DIR, SnapshotColumn, file_sha256, load_columns,
+                            read_csv_columns, snapshot_info, snapshot_path_for)
+
+# ========== CONFIGURAÇÕES ==========
+OS_FILE = "11_ordens_servico.csv"
+ITENS_FILE = "12_ordens_servico_itens.csv"
+MECHANICS_FILE = "05_mechanics.csv"
+
+OS_COLUMNS = ["id", "status", "mechanic_id", "valor_orcado", "valor_aprovado", "valor_final",
+              "data_entrada", "created_at"]
+ITENS_COLUMNS = ["ordem_servico_id", "tipo", "status", "quantidade", "valor_custo",
+                 "valor_venda_sugerido", "valor_total", "margem_aplicada"]
+
+OS_DIMENSIONS = ("mes", "mecanico", "status")
+ITENS_DIMENSIONS = ("tipo", "status", "mes", "mecanico")   # mes e mecanico vêm da OS do item
+
+# Muda quando o cálculo muda (invalida o cache)
+ENGINE_VERSION = 1
+CACHE_DIRNAME = "relatorios"
+
+SEM_VALOR = "(vazio)"
+SEM_OS = "(sem OS)"
+
+
+# ========== COLUNAS → NUMPY ==========
+# Os snapshots guardam cada coluna no tipo que ela comporta; colunas que não
+# couberam no tipo esperado (texto, exportações feitas à mão) são convertidas
+# pelo dicionário de valores distintos, sem laço por linha no caso comum.
+
+def valid_mask(column: SnapshotColumn) -> "np.ndarray":
+    if column.valid is None:
+        return np.ones(len(column), dtype=bool)
+    return np.frombuffer(column.valid, dtype=np.uint8).astype(bool)
+
+
+def distinct_codes(column: SnapshotColumn) -> Tuple["np.ndarray", List[str]]:
+    """(código por linha, valores distintos) de uma coluna dict ou text"""
+    if column.kind == "dict":
+        return np.frombuffer(column.values, dtype=column.values.typecode).astype(np.intp), column.dictionary
+    mapping: Dict[str, int] = {}
+    codes = np.fromiter((mapping.setdefault(v, len(mapping)) for v in column.to_strings()),
+                        dtype=np.intp, count=len(column))
+    return codes, list(mapping)
+
+
+def parse_float(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+
+def parse_datetime(text: str) -> "np.datetime64":
+    text = text.strip()
+    if not DATE_RE.match(text):
+        return np.datetime64("NaT", "us")
+    try:
+        return np.datetime64(text[:19].replace(" ", "T"), "us")
+    except ValueError:
+        return np.datetime64("NaT", "us")
+
+
+def to_float(column: Optional[SnapshotColumn], n: int) -> "np.ndarray":
+    """float64, NaN nos nulos e nos valores que não são número"""
+    if column is None:
+        return np.full(n, np.nan)
+    if column.kind in ("int", "decimal"):
+        values = np.frombuffer(column.values, dtype=column.values.typecode).astype(np.float64)
+        values[~valid_mask(column)] = np.nan
+        return values
+    if column.kind in ("dict", "text"):
+        codes, labels = distinct_codes(column)
+        return np.array([parse_float(label) for label in labels], dtype=np.float64)[codes]
+    return np.full(n, np.nan)
+
+
+def to_datetime(column: Optional[SnapshotColumn], n: int) -> "np.ndarray":
+    """datetime64[us], NaT nos nulos e nos valores que não são data"""
+    if column is None:
+        return np.full(n, np.datetime64("NaT", "us"))
+    if column.kind == "timestamp":
+        values = np.frombuffer(column.values, dtype=np.int64).view("datetime64[us]").copy()
+    elif column.kind == "date":
+        values = np.frombuffer(column.values, dtype=np.int32).astype("datetime64[D]").astype("datetime64[us]")
+    elif column.kind in ("dict", "text"):
+        codes, labels = distinct_codes(column)
+        return np.array([parse_datetime(label) for label in labels], dtype="datetime64[us]")[codes]
+    else:
+        return np.full(n, np.datetime64("NaT", "us"))
+    values[~valid_mask(column)] = np.datetime64("NaT")
+    return values
+
+
+def to_keys(column: Optional[SnapshotColumn], n: int, as_text: bool = False) -> "np.ndarray":
+    """Chaves comparáveis (ids): uuid em 16 bytes (ou texto, com as_text), o resto como texto"""
+    if column is None:
+        return np.zeros(n, dtype=str if as_text else "S16")
+    if column.kind == "uuid" and not as_text:
+        keys = np.frombuffer(column.values, dtype="S16").copy()
+        keys[~valid_mask(column)] = b""
+        return keys
+    return np.array(column.to_strings(), dtype=str)
+
+
+def key_label(key) -> str:
+    if isinstance(key, bytes):
+        return str(uuid.UUID(bytes=key.ljust(16, b"\0"))) if key else ""
+    return str(key)
+
+
+# ========== DIMENSÕES ==========
+# Cada dimensão é (código por linha, rótulos); o rótulo vazio vira SEM_VALOR
+
+def category_dimension(column: Optional[SnapshotColumn], n: int) -> Tuple["np.ndarray", List[str]]:
+    if column is None:
+        return np.zeros(n, dtype=np.intp), [SEM_VALOR]
+    if column.kind in ("dict", "text"):
+        codes, labels = distinct_codes(column)
+    else:
+        uniques, codes = np.unique(to_keys(column, n), return_inverse=True)
+        labels = [key_label(key) for key in uniques]
+    return codes, [label or SEM_VALOR for label in labels]
+
+
+def month_dimension(moments: "np.ndarray") -> Tuple["np.ndarray", List[str]]:
+    months = moments.astype("datetime64[M]")
+    uniques, codes = np.unique(months, return_inverse=True)   # NaT fica por último
+    return codes, [SEM_VALOR if np.isnat(month) else str(month) for month in uniques]
+
+
+def mechanic_dimension(column: Optional[SnapshotColumn], n: int,
+                       names: Dict[str, str]) -> Tuple["np.ndarray", List[str]]:
+    """Mecânico da OS, com o nome de 05_mechanics.csv quando o id é conhecido"""
+    codes, labels = category_dimension(column, n)
+    return codes, [names.get(label, label) for label in labels]
+
+
+def through_os(dimension: Tuple["np.ndarray", List[str]], os_index: "np.ndarray") -> Tuple["np.ndarray", List[str]]:
+    """Dimensão da OS levada para os itens (os_index = linha da OS de cada item, -1 sem OS)"""
+    codes, labels = dimension
+    return np.where(os_index >= 0, codes[os_index], len(labels)), labels + [SEM_OS]
+
+
+def group_codes(dimensions: Sequence[Tuple["np.ndarray", List[str]]], n: int) -> Tuple["np.ndarray", List[Tuple[str, ...]]]:
+    """
+    Combina as dimensões num código de grupo por linha.
+    Retorna (grupo de cada linha, rótulos de cada grupo, na ordem dos grupos).
+    """
+    combined = np.zeros(n, dtype=np.int64)
+    for codes, labels in dimensions:
+        combined = combined * len(labels) + codes
+    uniques, groups = np.unique(combined, return_inverse=True)
+
+    parts = []
+    rest = uniques
+    for codes, labels in reversed(dimensions):
+        rest, code = np.divmod(rest, len(labels))
+        parts.append([labels[c] for c in code])
+    return groups, list(zip(*reversed(parts))) if parts else [()] * len(uniques)
+
+
+# ========== AGREGAÇÕES ==========
+
+def ratio(num: float, den: float) -> Optional[float]:
+    return num / den if den else None
+
+
+def grouped_sum(groups: "np.ndarray", size: int, values: "np.ndarray") -> "np.ndarray":
+    return np.bincount(groups, weights=np.nan_to_num(values), minlength=size)
+
+
+def grouped_count(groups: "np.ndarray", size: int, mask: "np.ndarray") -> "np.ndarray":
+    return np.bincount(groups[mask], minlength=size)
+
+
+def aggregate(names: Sequence[str], labels: List[Tuple[str, ...]], metrics: Dict[str, "np.ndarray"]) -> List[Dict[str, Any]]:
+    rows = []
+    for i, key in enumerate(labels):
+        row = dict(zip(names, key))
+        for metric, values in metrics.items():
+            value = values[i]
+            if values.dtype.kind in "iu":
+                row[metric] = int(value)
+            else:
+                row[metric] = None if np.isnan(value) else round(float(value), 4)
+        rows.append(row)
+    return rows
+
+
+def os_report(os_data: Dict[str, SnapshotColumn], n: int, by: Sequence[str],
+              mechanic_names: Dict[str, str]) -> List[Dict[str, Any]]:
+    dimensions = {
+        "mes": lambda: month_dimension(os_moments(os_data, n)),
+        "mecanico": lambda: mechanic_dimension(os_data.get("mechanic_id"), n, mechanic_names),
+        "status": lambda: category_dimension(os_data.get("status"), n),
+    }
+    groups, labels = group_codes([dimensions[name]() for name in by], n)
+    size = len(labels)
+
+    orcado = to_float(os_data.get("valor_orcado"), n)
+    aprovado = to_float(os_data.get("valor_aprovado"), n)
+    final = to_float(os_data.get("valor_final"), n)
+
+    soma_orcado = grouped_sum(groups, size, orcado)
+    soma_aprovado = grouped_sum(groups, size, aprovado)
+    soma_final = grouped_sum(groups, size, final)
+    orcadas = grouped_count(groups, size, orcado > 0)
+    # só as orçadas: uma OS aprovada sem orçamento não pode passar a taxa de 1
+    aprovadas = grouped_count(groups, size, (orcado > 0) & (aprovado > 0))
+    finalizadas = grouped_count(groups, size, final > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = {
+            "os": np.bincount(groups, minlength=size),
+            "valor_orcado": soma_orcado,
+            "valor_aprovado": soma_aprovado,
+            "valor_final": soma_final,
+            "taxa_aprovacao": np.where(orcadas > 0, aprovadas / orcadas, np.nan),
+            "aprovado_sobre_orcado": np.where(soma_orcado > 0, soma_aprovado / soma_orcado, np.nan),
+            "ticket_medio": np.where(finalizadas > 0, soma_final / finalizadas, np.nan),
+        }
+    return aggregate(by, labels, metrics)
+
+
+def os_moments(os_data: Dict[str, SnapshotColumn], n: int) -> "np.ndarray":
+    """data_entrada da OS, ou created_at quando ela está vazia"""
+    entrada = to_datetime(os_data.get("data_entrada"), n)
+    return np.where(np.isnat(entrada), to_datetime(os_data.get("created_at"), n), entrada)
+
+
+def itens_report(itens: Dict[str, SnapshotColumn], n_itens: int, os_data: Dict[str, SnapshotColumn],
+                 n_os: int, by: Sequence[str], mechanic_names: Dict[str, str]) -> List[Dict[str, Any]]:
+    os_index = None
+    if "mes" in by or "mecanico" in by:
+        os_index = join_os(itens.get("ordem_servico_id"), n_itens, os_data.get("id"), n_os)
+    dimensions = {
+        "tipo": lambda: category_dimension(itens.get("tipo"), n_itens),
+        "status": lambda: category_dimension(itens.get("status"), n_itens),
+        "mes": lambda: through_os(month_dimension(os_moments(os_data, n_os)), os_index),
+        "mecanico": lambda: through_os(mechanic_dimension(os_data.get("mechanic_id"), n_os, mechanic_names),
+                                       os_index),
+    }
+    groups, labels = group_codes([dimensions[name]() for name in by], n_itens)
+    size = len(labels)
+
+    # Sem quantidade, o item conta como 1 (o padrão da coluna no banco)
+    quantidade = to_float(itens.get("quantidade"), n_itens)
+    quantidade = np.where(np.isnan(quantidade), 1.0, quantidade)
+    custo = to_float(itens.get("valor_custo"), n_itens) * quantidade
+    venda = to_float(itens.get("valor_total"), n_itens)
+    sugerida = to_float(itens.get("valor_venda_sugerido"), n_itens) * quantidade
+    margem_aplicada = to_float(itens.get("margem_aplicada"), n_itens)
+
+    soma_custo = grouped_sum(groups, size, custo)
+    soma_venda = grouped_sum(groups, size, venda)
+    com_margem = ~np.isnan(margem_aplicada)
+    margens = grouped_count(groups, size, com_margem)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = {
+            "itens": np.bincount(groups, minlength=size),
+            "quantidade": grouped_sum(groups, size, quantidade),
+            "custo": soma_custo,
+            "venda": soma_venda,
+            "venda_sugerida": grouped_sum(groups, size, sugerida),
+            "margem": soma_venda - soma_custo,
+            "margem_pct": np.where(soma_venda > 0, (soma_venda - soma_custo) / soma_venda, np.nan),
+            "margem_aplicada_media": np.where(
+                margens > 0, grouped_sum(groups, size, np.where(com_margem, margem_aplicada, 0)) / margens, np.nan),
+        }
+    return aggregate(by, labels, metrics)
+
+
+def join_os(item_os_ids: Optional[SnapshotColumn], n_itens: int,
+            os_ids: Optional[SnapshotColumn], n_os: int) -> "np.ndarray":
+    """Linha da OS de cada item (busca binária nos ids ordenados); -1 se a OS não existe"""
+    # uuid binário dos dois lados; se um deles não coube em uuid, os dois como texto
+    as_text = any(column is not None and column.kind != "uuid" for column in (os_ids, item_os_ids))
+    keys = to_keys(os_ids, n_os, as_text)
+    wanted = to_keys(item_os_ids, n_itens, as_text)
+    if not n_os:
+        return np.full(n_itens, -1, dtype=np.intp)
+    order = np.argsort(keys, kind="stable")
+    positions = np.minimum(np.searchsorted(keys[order], wanted), n_os - 1)
+    found = (keys[order][positions] == wanted) & (wanted != keys.dtype.type())
+    return np.where(found, order[positions], -1)
+
+
+# ========== ENTRADA E CACHE ==========
+
+def load_table(csv_path: Path, snapshot_dir: Path, sha256: str,
+               columns: Sequence[str], sources: Dict[str, str]) -> Tuple[Dict[str, SnapshotColumn], int]:
+    """
+    Colunas pedidas (as que existem no CSV) e número de linhas: do snapshot
+    colunar, se ele é deste CSV; senão, do próprio CSV (só essas colunas).
+    """
+    snapshot_path = snapshot_path_for(snapshot_dir, csv_path.name)
+    info = snapshot_info(snapshot_path) if snapshot_path.exists() else None
+    if info is None or info["csv_sha256"] != sha256:
+        sources[csv_path.name] = "csv"
+        return read_csv_columns(csv_path, columns)
+    sources[csv_path.name] = "snapshot"
+    if "csv" in info:   # snapshot de tabela pequena: é o próprio CSV, comprimido
+        return read_csv_columns(csv_path, columns)
+    available = {column["nome"] for column in info["colunas"]}
+    return load_columns(snapshot_path, [c for c in columns if c in available]), info["linhas"]
+
+
+def mechanic_names(export_dir: Path, snapshot_dir: Path, sha256: Optional[str],
+                   sources: Dict[str, str]) -> Dict[str, str]:
+    if sha256 is None:
+        return {}
+    data, _ = load_table(export_dir / MECHANICS_FILE, snapshot_dir, sha256, ["id", "name"], sources)
+    if "id" not in data or "name" not in data:
+        return {}
+    return {id_: name for id_, name in zip(data["id"].to_strings(), data["name"].to_strings()) if id_ and name}
+
+
+def build_report(export_dir: Path, os_by: Sequence[str], itens_by: Sequence[str],
+                 use_cache: bool = True) -> Tuple[Dict[str, Any], bool]:
+    """Relatório (OS e itens); retorna (relatório, veio do cache)"""
+    snapshot_dir = export_dir / SNAPSHOT_DIR.name
+    checksums = {name: file_sha256(export_dir / name) if (export_dir / name).exists() else None
+                 for name in (OS_FILE, ITENS_FILE, MECHANICS_FILE)}
+    key = hashlib.sha256(json.dumps(
+        {"versao": ENGINE_VERSION, "arquivos": checksums, "os_by": list(os_by), "itens_by": list(itens_by)},
+        sort_keys=True).encode("utf-8")).hexdigest()
+    cache_file = snapshot_dir / CACHE_DIRNAME / f"{key}.json"
+    if use_cache and cache_file.exists():
+        return json.loads(cache_file.read_text(encoding="utf-8")), True
+
+    if checksums[OS_FILE] is None or checksums[ITENS_FILE] is None:
+        raise FileNotFoundError(f"{OS_FILE} e {ITENS_FILE} precisam existir em {export_dir}")
+    needs_os = bool(os_by) or "mes" in itens_by or "mecanico" in itens_by
+    sources: Dict[str, str] = {}
+    os_data, n_os = (load_table(export_dir / OS_FILE, snapshot_dir, checksums[OS_FILE], OS_COLUMNS, sources)
+                     if needs_os else ({}, 0))
+    names = (mechanic_names(export_dir, snapshot_dir, checksums[MECHANICS_FILE], sources)
+             if "mecanico" in os_by or "mecanico" in itens_by else {})
+
+    report = {"chave": key, "arquivos": checksums, "fontes": sources, "ordens_servico": [], "itens": []}
+    if os_by:
+        report["ordens_servico"] = os_report(os_data, n_os, os_by, names)
+    if itens_by:
+        itens, n_itens = load_table(export_dir / ITENS_FILE, snapshot_dir, checksums[ITENS_FILE], ITENS_COLUMNS,
+                                    sources)
+        report["itens"] = itens_report(itens, n_itens, os_data, n_os, itens_by, names)
+
+    if use_cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(cache_file.name + ".tmp")
+        tmp.write_text(json.dumps(report, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(cache_file)
+    return report, False
+
+
+# ========== CLI ==========
+
+def format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def print_table(title: str, dimensions: Sequence[str], rows: List[Dict[str, Any]]) -> None:
+    """Tabela alinhada: dimensões à esquerda, métricas à direita"""
+    print(f"\n📊 {title}")
+    if not rows:
+        print("   (nenhuma linha)")
+        return
+    columns = list(rows[0])
+    cells = [[format_cell(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(line[i]) for line in cells)) for i, c in enumerate(columns)]
+    for line in [columns] + cells:
+        print("  ".join(cell.ljust(w) if c in dimensions else cell.rjust(w)
+                        for c, cell, w in zip(columns, line, widths)))
+
+
+def dimensions_arg(allowed: Sequence[str]):
+    def parse(text: str) -> List[str]:
+        names = [name.strip() for name in text.split(",") if name.strip()]
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"use {', '.join(allowed)} (recebido: {', '.join(unknown)})")
+        return names
+    return parse
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Relatórios financeiros das OS e dos itens (NumPy)")
+    parser.add_argument("--input", type=Path, default=EXPORT_DIR,
+                        help=f"pasta dos CSVs exportados (padrão: {EXPORT_DIR})")
+    parser.add_argument("--os-by", type=dimensions_arg(OS_DIMENSIONS), default=["mes"],
+                        help=f"agrupamento das OS, separado por vírgula: {', '.join(OS_DIMENSIONS)} "
+                             "(padrão: mes; vazio para pular)")
+    parser.add_argument("--itens-by", type=dimensions_arg(ITENS_DIMENSIONS), default=["tipo"],
+                        help=f"agrupamento dos itens: {', '.join(ITENS_DIMENSIONS)} (padrão: tipo; vazio para pular)")
+    parser.add_argument("--no-cache", action="store_true", help="recalcula mesmo com o resultado em cache")
+    parser.add_argument("--json", action="store_true", help="imprime o relatório em JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> bool:
+    args = parse_args(argv)
+    if np is None:
+        print("❌ Os relatórios precisam do NumPy: pip install numpy")
+        return False
+
+    start = time.perf_counter()
+    try:
+        report, cached = build_report(args.input, args.os_by, args.itens_by, use_cache=not args.no_cache)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return False
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return True
+    if args.os_by:
+        print_table(f"Ordens de serviço por {', '.join(args.os_by)}", args.os_by, report["ordens_servico"])
+    if args.itens_by:
+        print_table(f"Itens por {', '.join(args.itens_by)}", args.itens_by, report["itens"])
+    print(f"\n⏱️  {elapsed:.2f} s" + (" (♻️  do cache)" if cached else ""))
+    lidos_do_csv = [arquivo for arquivo, fonte in report.get("fontes", {}).items() if fonte == "csv"]
+    if lidos_do_csv and not cached:
+        print(f"ℹ️  Sem snapshot colunar atualizado para {', '.join(lidos_do_csv)}: lidos do CSV. "
+              "Gere com snapshot_dados.py (ou export_dados.py --snapshot) para carregar mais rápido.")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Teste de Carga: ordens_servico via REST (Supabase / PostgREST)
+Mede quantas operações por segundo a tabela aguenta, com RLS e triggers reais
+
+Cada worker sorteia uma operação da mistura (leitura, inserção em lote,
+atualização) até o fim do tempo. No fim, mostra vazão e histograma de latência
+por operação e apaga todas as linhas que criou (marcadas em client_name).
+
+Execute:
+    python load_test_ordens_servico.py --concurrency 8 --duration 30 --batch-size 10
+    python load_test_ordens_servico.py --url http://localhost:3000   # PostgREST local
+    python load_test_ordens_servico.py --offline --duration 5        # sem rede (fake_backends)
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from test_connections import SUPABASE_KEY, SUPABASE_URL, summarize
+
+# Mistura padrão de operações (pesos)
+DEFAULT_MIX = "read=60,insert=30,patch=10"
+
+# Destino do --offline: PostgREST falso de fake_backends.py, dentro do processo
+OFFLINE_URL = "http://postgrest.offline/rest/v1"
+
+# Faixas do histograma de latência (ms)
+HISTOGRAM_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+POSICOES = ["entrada", "aguardando_orcamento", "aguardando_aprovacao", "aguardando_pecas", "em_execucao", "pronto"]
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """'read=60,insert=30,patch=10' → {'read': 60, 'insert': 30, 'patch': 10} (type do argparse)"""
+    mix = {}
+    for part in text.split(","):
+        name, sep, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("read", "insert", "patch"):
+            raise argparse.ArgumentTypeError(f"operação desconhecida: {name}")
+        try:
+            mix[name] = int(weight) if sep else -1
+        except ValueError:
+            mix[name] = -1
+        if mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"peso inválido em '{part.strip()}' (use operação=peso, ex: read=60)")
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("todos os pesos são zero")
+    return mix
+
+
+class LoadTest:
+    """Estado compartilhado entre os workers de uma rodada"""
+
+    def __init__(self, rest_url: str, key: str, batch_size: int, concurrency: int):
+        self.url = f"{rest_url.rstrip('/')}/ordens_servico"
+        self.batch_size = batch_size
+        self.marker = f"LOADTEST {uuid.uuid4().hex[:8]}"
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=concurrency))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=concurrency))
+        if key:
+            self.session.headers.update({"apikey": key, "Authorization": f"Bearer {key}"})
+        self.lock = threading.Lock()
+        self.created: List[Any] = []
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.rows: Dict[str, int] = defaultdict(int)
+        self.first_error: Dict[str, str] = {}
+        self.stop = threading.Event()
+
+    def row(self) -> Dict[str, Any]:
+        """Linha de teste, no mesmo formato do test_supabase_insert"""
+        return {
+            "client_name": self.marker,
+            "client_phone": "00000000000",
+            "vehicle_plate": "TST-0000",
+            "vehicle_model": "Teste de carga",
+            "service_description": "Teste de carga - será deletado",
+            "status": "orcamento",
+            "posicao_patio": "entrada",
+        }
+
+    def read(self) -> int:
+        response = self.session.get(self.url, params={
+            "select": "id,status,posicao_patio", "order": "data_entrada.desc", "limit": 20,
+        }, timeout=30)
+        response.raise_for_status()
+        return len(response.json())
+
+    def insert(self) -> int:
+        response = self.session.post(
+            self.url, params={"select": "id"}, json=[self.row() for _ in range(self.batch_size)],
+            headers={"Prefer": "return=representation"}, timeout=30,
+        )
+        response.raise_for_status()
+        ids = [row["id"] for row in response.json()]
+        with self.lock:
+            self.created.extend(ids)
+        return len(ids)
+
+    def patch(self) -> int:
+        with self.lock:
+            row_id = random.choice(self.created)
+        response = self.session.patch(
+            self.url, params={"id": f"eq.{row_id}"},
+            json={"posicao_patio": random.choice(POSICOES)}, timeout=30,
+        )
+        response.raise_for_status()
+        return 1
+
+    def worker(self, ops: List[str], weights: List[int], deadline: float) -> None:
+        while time.monotonic() < deadline and not self.stop.is_set():
+            op = random.choices(ops, weights)[0]
+            if op == "patch" and not self.created:
+                op = "insert"   # ainda não há linha para atualizar: a medida vai para insert
+            start = time.perf_counter()
+            try:
+                rows = getattr(self, op)()
+                ok = True
+            except Exception as e:
+                ok = False
+                error = f"{e.response.status_code} - {e.response.text[:200]}" if getattr(e, "response", None) is not None else str(e)
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.samples[op].append(elapsed)
+                if ok:
+                    self.rows[op] += rows
+                else:
+                    self.errors[op] += 1
+                    self.first_error.setdefault(op, error)
+
+    def cleanup(self) -> int:
+        """Apaga todas as linhas desta rodada (pelo marcador em client_name)"""
+        response = self.session.delete(
+            self.url, params={"client_name": f"eq.{self.marker}", "select": "id"},
+            headers={"Prefer": "return=representation"}, timeout=120,
+        )
+        response.raise_for_status()
+        return len(response.json())
+
+
+def histogram(values: List[float]) -> List[Dict[str, Any]]:
+    """Contagem por faixa de latência (ms); a última faixa é '> maior limite'"""
+    counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    for value in values:
+        ms = value * 1000
+        index = next((i for i, limit in enumerate(HISTOGRAM_BUCKETS) if ms <= limit), len(HISTOGRAM_BUCKETS))
+        counts[index] += 1
+    labels = [f"<= {limit} ms" for limit in HISTOGRAM_BUCKETS] + [f"> {HISTOGRAM_BUCKETS[-1]} ms"]
+    return [{"faixa": label, "total": count} for label, count in zip(labels, counts)]
+
+
+def build_report(test: LoadTest, duration: float, args) -> Dict[str, Any]:
+    operacoes = {}
+    for op, values in sorted(test.samples.items()):
+        operacoes[op] = {
+            "total": len(values),
+            "erros": test.errors[op],
+            "primeiro_erro": test.first_error.get(op),
+            "por_s": round(len(values) / duration, 1),
+            "linhas_por_s": round(test.rows[op] / duration, 1),
+            "latencia_ms": summarize(values),
+            "histograma": histogram(values),
+        }
+    total = sum(len(values) for values in test.samples.values())
+    return {
+        "url": test.url,
+        "concorrencia": args.concurrency,
+        "duracao_s": round(duration, 1),
+        "lote": args.batch_size,
+        "mistura": args.mix,
+        "total_por_s": round(total / duration, 1) if duration else 0,
+        "operacoes": operacoes,
+    }
+
+
+def print_report(report: Dict[str, Any], removidas: int, criadas: int) -> None:
+    print("=" * 60)
+    print(f"📊 {report['total_por_s']} operações/s ({report['concorrencia']} workers, "
+          f"{report['duracao_s']} s, lotes de {report['lote']})")
+    print("=" * 60)
+    for op, data in report["operacoes"].items():
+        latencia = data["latencia_ms"]
+        print(f"\n{op}: {data['total']} ({data['por_s']}/s, {data['linhas_por_s']} linhas/s), {data['erros']} erros")
+        print(f"   p50 {latencia['p50']} ms | p95 {latencia['p95']} ms | p99 {latencia['p99']} ms | máx {latencia['max']} ms")
+        if data["primeiro_erro"]:
+            print(f"   ❌ {data['primeiro_erro']}")
+        biggest = max(bucket["total"] for bucket in data["histograma"]) or 1
+        for bucket in data["histograma"]:
+            if bucket["total"]:
+                print(f"   {bucket['faixa']:>10} {'█' * max(1, bucket['total'] * 40 // biggest)} {bucket['total']}")
+    print(f"\n🧹 Limpeza: {removidas} de {criadas} linhas criadas removidas")
+
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="Teste de carga da tabela ordens_servico via REST")
+    parser.add_argument("--url", default=f"{SUPABASE_URL}/rest/v1",
+                        help="URL base do REST (padrão: Supabase; ex: http://localhost:3000 para PostgREST local)")
+    parser.add_argument("--key", default=SUPABASE_KEY, help="chave (apikey/Bearer); vazio para PostgREST sem autenticação")
+    parser.add_argument("--concurrency", type=int, default=8, metavar="N", help="workers simultâneos (padrão: 8)")
+    parser.add_argument("--duration", type=float, default=30, metavar="S", help="duração em segundos (padrão: 30)")
+    parser.add_argument("--batch-size", type=int, default=1, metavar="N", help="linhas por inserção (padrão: 1)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, type=parse_mix,
+                        help=f"pesos das operações (padrão: {DEFAULT_MIX})")
+    parser.add_argument("--offline", action="store_true",
+                        help="roda contra o PostgREST falso de fake_backends.py, sem rede "
+                             "(confere o script; não mede o banco)")
+    parser.add_argument("--json", action="store_true", help="imprime o relatório em JSON")
+    args = parser.parse_args()
+    mix = args.mix
+    args.mix = ",".join(f"{name}={weight}" for name, weight in mix.items())
+
+    url = OFFLINE_URL if args.offline else args.url
+    test = LoadTest(url, args.key, max(args.batch_size, 1), max(args.concurrency, 1))
+    if args.offline:
+        from fake_backends import FakeAdapter, FakePostgREST
+        test.session.mount(OFFLINE_URL, FakeAdapter(FakePostgREST()))
+    if not args.json:
+        print(f"🔥 Teste de carga em {test.url} por {args.duration:g} s ({args.mix})...\n")
+
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(max(args.concurrency, 1))
+    try:
+        futures = [executor.submit(test.worker, list(mix), list(mix.values()), start + args.duration)
+                   for _ in range(max(args.concurrency, 1))]
+        wait(futures)
+    except KeyboardInterrupt:
+        print("\n⏹️  Interrompido: esperando os workers terminarem a operação em andamento...")
+    finally:
+        # A limpeza só roda com todos os workers parados: nenhuma inserção chega depois do DELETE
+        test.stop.set()
+        executor.shutdown(wait=True)
+        duration = time.monotonic() - start
+        removidas = test.cleanup()
+
+    report = build_report(test, duration, args)
+    report["limpeza"] = {"criadas": len(test.created), "removidas": removidas}
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report, removidas, len(test.created))
+    return not any(test.errors.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Espelho local (SQLite) de public/exports/dados para consultas offline
+
+Carrega os CSVs listados em 00_INDICE_TABELAS.csv num banco SQLite local,
+para os relatórios não disputarem o Supabase com o app. Cada tabela entra
+numa única transação (executemany), com os índices criados depois da carga:
+um para cada chave estrangeira (colunas *_id: ordem_servico_id, vehicle_id,
+user_id, mechanic_id...). Colunas só com inteiros ou só com números viram
+INTEGER/REAL e o campo vazio vira NULL.
+
+Rodando de novo (ou com --input apontando para uma exportação mais nova),
+o espelho é atualizado de forma incremental: tabelas cujo CSV não mudou
+(mesmo SHA-256) são puladas; nas outras, cada linha é comparada pelo hash
+com a da carga anterior (guardado no espelho, por id) e só as linhas novas,
+alteradas ou removidas são gravadas. Se as colunas mudaram, a tabela é
+recriada.
+
+Execute:
+    python mirror_dados.py                           # cria/atualiza o espelho
+    python mirror_dados.py --input /caminho/exportacao_nova
+    python mirror_dados.py --query "SELECT status, count(*) FROM ordens_servico GROUP BY status"
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from snapshot_dados import (DECIMAL_COLUMN_RE, EXPORT_DIR, INDEX_FILE, INT_COLUMN_RE, column_matches,
+                            header_delimiter)
+
+# ========== CONFIGURAÇÕES ==========
+MIRROR_FILE = Path(__file__).with_name("espelho_dados.sqlite3")
+META_TABLE = "_espelho"
+ROWS_TABLE = "_espelho_linhas"   # hash de cada linha carregada, por id
+
+# Parâmetro do INSERT: o campo vazio do CSV vira NULL no próprio SQLite
+NULL_IF_EMPTY = "NULLIF(?, '')"
+
+
+class MirrorTable(NamedTuple):
+    arquivo: str
+    tabela: str        # nome no SQLite ("app_role (enum)" → "app_role")
+
+
+class TableData(NamedTuple):
+    columns: List[Tuple[str, str]]   # [(nome, tipo SQLite)]
+    primary_key: bool                # a coluna id é única e sem nulos
+    rows: List[List[str]]            # como no CSV; o campo vazio vira NULL no INSERT
+    delimiter: str                   # separador do CSV (01_companies.csv usa ";")
+
+
+# ========== LEITURA DOS CSVs ==========
+
+def index_tables(export_dir: Path) -> List[MirrorTable]:
+    """Tabelas na ordem do índice"""
+    with open(export_dir / INDEX_FILE, "r", encoding="utf-8", newline="") as f:
+        return [MirrorTable(row["arquivo"], row["tabela"].split(" ")[0]) for row in csv.DictReader(f)]
+
+
+def column_type(values: Sequence[str]) -> str:
+    if column_matches(INT_COLUMN_RE, values):
+        return "INTEGER"
+    if column_matches(DECIMAL_COLUMN_RE, values):
+        return "REAL"
+    return "TEXT"
+
+
+def read_table(data: bytes) -> TableData:
+    """Colunas (com o tipo inferido) e linhas do CSV, no separador do cabeçalho"""
+    text = data.decode("utf-8")
+    delimiter = header_delimiter(text.partition("\n")[0])
+    rows = list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+    header, rows = (rows[0], rows[1:]) if rows else ([], [])
+
+    # Linhas com campos a mais que o cabeçalho ganham colunas "coluna_N" (como no snapshot)
+    width = max([len(header)] + [len(row) for row in rows])
+    names = []
+    for i, name in enumerate(header + [f"coluna_{i + 1}" for i in range(len(header), width)]):
+        name = name or f"coluna_{i + 1}"
+        while name in names:
+            name += "_"
+        names.append(name)
+
+    rows = [row if len(row) == width else row + [""] * (width - len(row)) for row in rows if row]
+    columns = list(zip(*rows)) if rows else [()] * width
+    types = [column_type(values) for values in columns]
+
+    primary_key = False
+    if "id" in names:
+        ids = columns[names.index("id")]
+        primary_key = "" not in ids and len(set(ids)) == len(ids)
+    return TableData(list(zip(names, types)), primary_key, rows, delimiter)
+
+
+def row_hash(row: List[str]) -> bytes:
+    return hashlib.blake2b("\x1f".join(row).encode("utf-8"), digest_size=8).digest()
+
+
+# ========== SQLITE ==========
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def open_mirror(path: Path) -> sqlite3.Connection:
+    """Abre (ou cria) o espelho; as transações são explícitas (BEGIN/COMMIT)"""
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {META_TABLE} (
+            tabela TEXT PRIMARY KEY,
+            arquivo TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            registros INTEGER NOT NULL,
+            esquema TEXT NOT NULL,
+            atualizado_em TEXT NOT NULL
+        )
+    """)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {ROWS_TABLE} (
+            tabela TEXT NOT NULL,
+            id TEXT NOT NULL,
+            hash BLOB NOT NULL,
+            PRIMARY KEY (tabela, id)
+        ) WITHOUT ROWID
+    """)
+    return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def column_defs(table: TableData, primary_key: bool) -> str:
+    return ", ".join(
+        f"{quote(name)} {kind}" + (" PRIMARY KEY" if primary_key and name == "id" else "")
+        for name, kind in table.columns)
+
+
+def insert_sql(name: str, table: TableData, verb: str = "INSERT") -> str:
+    return f"{verb} INTO {name} VALUES ({', '.join([NULL_IF_EMPTY] * len(table.columns))})"
+
+
+def foreign_keys(table: TableData) -> List[str]:
+    return [name for name, _ in table.columns if name.endswith("_id")]
+
+
+def id_position(table: TableData) -> int:
+    return [name for name, _ in table.columns].index("id")
+
+
+def load_full(conn: sqlite3.Connection, tabela: str, table: TableData) -> None:
+    """(Re)cria a tabela: carga em massa e depois os índices das chaves estrangeiras"""
+    name = quote(tabela)
+    conn.execute(f"DROP TABLE IF EXISTS {name}")
+    conn.execute(f"CREATE TABLE {name} ({column_defs(table, table.primary_key)})")
+    conn.executemany(insert_sql(name, table), table.rows)
+    for column in foreign_keys(table):
+        conn.execute(f"CREATE INDEX {quote(f'idx_{tabela}_{column}')} ON {name} ({quote(column)})")
+
+    conn.execute(f"DELETE FROM {ROWS_TABLE} WHERE tabela = ?", (tabela,))
+    if table.primary_key:
+        i = id_position(table)
+        conn.executemany(f"INSERT INTO {ROWS_TABLE} VALUES (?, ?, ?)",
+                         ((tabela, row[i], row_hash(row)) for row in table.rows))
+
+
+def load_incremental(conn: sqlite3.Connection, tabela: str, table: TableData) -> Tuple[int, int]:
+    """
+    Aplica a exportação nova sobre a tabela atual (mesmas colunas, com id):
+    compara o hash de cada linha com o da carga anterior, apaga os ids que
+    sumiram e regrava só as linhas diferentes. Retorna (gravadas, apagadas).
+    """
+    name = quote(tabela)
+    i = id_position(table)
+    anteriores = dict(conn.execute(f"SELECT id, hash FROM {ROWS_TABLE} WHERE tabela = ?", (tabela,)))
+    changed = []
+    hashes = []
+    for row in table.rows:
+        digest = row_hash(row)
+        if anteriores.pop(row[i], None) != digest:
+            changed.append(row)
+            hashes.append((tabela, row[i], digest))
+    removed = [(id_,) for id_ in anteriores]
+
+    conn.executemany(f"DELETE FROM {name} WHERE id = ?", removed)
+    conn.executemany(f"DELETE FROM {ROWS_TABLE} WHERE tabela = ? AND id = ?",
+                     [(tabela, id_) for (id_,) in removed])
+    conn.executemany(insert_sql(name, table, "INSERT OR REPLACE"), changed)
+    conn.executemany(f"INSERT OR REPLACE INTO {ROWS_TABLE} VALUES (?, ?, ?)", hashes)
+    return len(changed), len(removed)
+
+
+def refresh_table(conn: sqlite3.Connection, export_dir: Path, table: MirrorTable,
+                  rebuild: bool = False) -> Optional[str]:
+    """Atualiza uma tabela do espelho; retorna o que foi feito (None se o CSV não mudou)"""
+    data = (export_dir / table.arquivo).read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    current = conn.execute(f"SELECT sha256, esquema FROM {META_TABLE} WHERE tabela = ?",
+                           (table.tabela,)).fetchone()
+    if not rebuild and current is not None and current[0] == sha256:
+        return None
+
+    parsed = read_table(data)
+    esquema = json.dumps({"colunas": parsed.columns, "pk": parsed.primary_key,
+                          "delimitador": parsed.delimiter})
+    with transaction(conn):
+        if not rebuild and current is not None and current[1] == esquema and parsed.primary_key:
+            gravadas, apagadas = load_incremental(conn, table.tabela, parsed)
+            resultado = f"{gravadas} linhas novas/alteradas, {apagadas} removidas"
+        else:
+            load_full(conn, table.tabela, parsed)
+            resultado = f"{len(parsed.rows)} linhas carregadas"
+        conn.execute(f"INSERT OR REPLACE INTO {META_TABLE} VALUES (?, ?, ?, ?, ?, ?)",
+                     (table.tabela, table.arquivo, sha256, len(parsed.rows), esquema,
+                      datetime.now().isoformat()))
+    return resultado
+
+
+def run_query(conn: sqlite3.Connection, query: str) -> None:
+    start = time.perf_counter()
+    cursor = conn.execute(query)
+    rows = cursor.fetchall()
+    elapsed = time.perf_counter() - start
+    if cursor.description:
+        print("\t".join(column[0] for column in cursor.description))
+    for row in rows:
+        print("\t".join("" if v is None else str(v) for v in row))
+    print(f"\n⏱️  {len(rows)} linhas em {elapsed * 1000:.1f} ms")
+
+
+# ========== CLI ==========
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Espelho SQLite local de public/exports/dados")
+    parser.add_argument("--input", type=Path, default=EXPORT_DIR,
+                        help=f"pasta dos CSVs e do {INDEX_FILE} (padrão: {EXPORT_DIR})")
+    parser.add_argument("--db", type=Path, default=MIRROR_FILE, metavar="ARQUIVO",
+                        help=f"banco SQLite do espelho (padrão: {MIRROR_FILE.name})")
+    parser.add_argument("--tables", default=None,
+                        help="só estas tabelas, separadas por vírgula (padrão: todas do índice)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="recarrega as tabelas do zero, mesmo sem mudança no CSV")
+    parser.add_argument("--query", default=None, metavar="SQL",
+                        help="só consulta o espelho (criado antes, se não existir) e mostra o resultado")
+    args = parser.parse_args(argv)
+    if args.tables:
+        args.tables = {name.strip() for name in args.tables.split(",") if name.strip()}
+    return args
+
+
+def main(argv=None) -> bool:
+    args = parse_args(argv)
+    exists = args.db.exists()
+    conn = open_mirror(args.db)
+    try:
+        if args.query is not None and exists:
+            run_query(conn, args.query)
+            return True
+
+        tables = [t for t in index_tables(args.input) if args.tables is None or t.tabela in args.tables]
+        if args.tables is not None and not tables:
+            print(f"❌ Nenhuma tabela do índice em --tables: {', '.join(sorted(args.tables))}")
+            return False
+
+        print(f"🗂️  Espelho {args.db} ← {args.input}\n")
+        start = time.perf_counter()
+        alteradas = falhas = 0
+        for table in tables:
+            if not (args.input / table.arquivo).exists():
+                print(f"⚠️  {table.arquivo}: arquivo não encontrado")
+                continue
+            table_start = time.perf_counter()
+            try:
+                resultado = refresh_table(conn, args.input, table, args.rebuild)
+            except (sqlite3.Error, UnicodeDecodeError, csv.Error) as e:
+                falhas += 1
+                print(f"❌ {table.tabela}: {e} — tabela anterior mantida")
+                continue
+            if resultado is None:
+                print(f"⏭️  {table.tabela}: sem mudanças")
+            else:
+                alteradas += 1
+                print(f"✅ {table.tabela}: {resultado} em {time.perf_counter() - table_start:.2f} s")
+
+        if alteradas:
+            conn.execute("ANALYZE")
+        print(f"\n⏱️  {alteradas} tabelas atualizadas em {time.perf_counter() - start:.2f} s"
+              + (f", {falhas} com erro" if falhas else ""))
+
+        if args.query is not None:
+            print()
+            run_query(conn, args.query)
+        return not falhas
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
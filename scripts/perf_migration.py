@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Harness de desempenho da migração Trello → Supabase, sem rede
+Roda migrate_trello_to_supabase.main() contra os backends locais de
+fake_backends.py (board sintético + PostgREST em SQLite) e mede tempo,
+cards/s, requisições e bytes por rota. Mesma semente = mesma carga, então
+dá para comparar duas versões do código com números reproduzíveis.
+
+Execute:
+    python perf_migration.py --cards 100000 --batch-size 100 --workers 4
+    python perf_migration.py --cards 20000 --sync 500      # + sincronização de 500 cards alterados
+    python perf_migration.py --cards 20000 --profile       # + cProfile das funções mais caras
+"""
+
+import argparse
+import cProfile
+import contextlib
+import io
+import json
+import pstats
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import migrate_trello_to_supabase as migracao
+from fake_backends import CLOSED_EVERY, FakeAdapter, FakePostgREST, FakeTrelloBoard, install
+
+
+def run_main(argv: List[str], profiler=None) -> float:
+    """Roda main() com a saída descartada; devolve o tempo (s)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if profiler is not None:
+            profiler.runcall(migracao.main, argv)
+        else:
+            migracao.main(argv)
+    return time.perf_counter() - start
+
+
+def totals(adapter: FakeAdapter) -> Dict[str, int]:
+    stats = adapter.stats().values()
+    return {
+        "requisicoes": sum(s["requisicoes"] for s in stats),
+        "bytes_enviados": sum(s["bytes_enviados"] for s in stats),
+        "bytes_recebidos": sum(s["bytes_recebidos"] for s in stats),
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("=" * 60)
+    for fase in report["fases"]:
+        print(f"⏱️  {fase['nome']}: {fase['tempo_s']} s ({fase['cards_por_s']:,.0f} cards/s)")
+    print(f"🗄️  Linhas no destino: {report['linhas_destino']} (esperado: {report['cards_abertos']})")
+    print("=" * 60)
+    for backend in ("trello", "supabase"):
+        total = report[backend]["total"]
+        print(f"\n{backend}: {total['requisicoes']} requisições, "
+              f"{total['bytes_enviados'] / 1e6:.2f} MB enviados, {total['bytes_recebidos'] / 1e6:.2f} MB recebidos")
+        for route, stats in report[backend]["rotas"].items():
+            print(f"   {route:<40} {stats['requisicoes']:>7} req  "
+                  f"{stats['bytes_enviados'] / 1e6:>8.2f} MB ↑  {stats['bytes_recebidos'] / 1e6:>8.2f} MB ↓")
+
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="Mede a migração Trello → Supabase contra backends locais")
+    parser.add_argument("--cards", type=int, default=100000, metavar="N", help="cards no board sintético (padrão: 100000)")
+    parser.add_argument("--seed", type=int, default=42, help="semente do board (padrão: 42)")
+    parser.add_argument("--batch-size", type=int, default=migracao.BATCH_SIZE, metavar="N",
+                        help=f"repassado à migração (padrão: {migracao.BATCH_SIZE})")
+    parser.add_argument("--workers", type=int, default=migracao.MAX_WORKERS, metavar="N",
+                        help=f"repassado à migração (padrão: {migracao.MAX_WORKERS})")
+    parser.add_argument("--sync", type=int, default=0, metavar="N",
+                        help="depois da migração, altera N cards e mede a sincronização incremental")
+    parser.add_argument("--rate-limits", action="store_true",
+                        help="mantém os limites de taxa reais (por padrão são desligados)")
+    parser.add_argument("--profile", action="store_true", help="mostra as 25 funções mais caras (cProfile)")
+    parser.add_argument("--json", action="store_true", help="imprime o relatório em JSON")
+    args = parser.parse_args()
+
+    board = FakeTrelloBoard(args.cards, args.seed)
+    sink = FakePostgREST()
+    trello, supabase = install(board, sink, rate_limits=args.rate_limits)
+    profiler = cProfile.Profile() if args.profile else None
+    abertos = args.cards - len(range(0, args.cards, CLOSED_EVERY))
+
+    fases = []
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = str(Path(tmp) / "journal.sqlite3")
+        common = ["--journal", journal, "--batch-size", str(args.batch_size), "--workers", str(args.workers)]
+
+        tempo = run_main(common, profiler)
+        fases.append({"nome": "migração", "cards": abertos, "tempo_s": round(tempo, 2),
+                      "cards_por_s": round(abertos / tempo, 1)})
+
+        if args.sync:
+            alterados = board.touch(args.sync, seed=args.seed)
+            tempo = run_main(common + ["--sync"], profiler)
+            fases.append({"nome": "sincronização", "cards": len(alterados), "tempo_s": round(tempo, 2),
+                          "cards_por_s": round(len(alterados) / tempo, 1)})
+
+    report = {
+        "cards": args.cards,
+        "cards_abertos": abertos,
+        "semente": args.seed,
+        "lote": args.batch_size,
+        "workers": args.workers,
+        "fases": fases,
+        "linhas_destino": sink.count("ordens_servico"),
+        "trello": {"total": totals(trello), "rotas": trello.stats()},
+        "supabase": {"total": totals(supabase), "rotas": supabase.stats()},
+    }
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    if profiler is not None:
+        print()
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats("cumulative").print_stats(25)
+    return report["linhas_destino"] == abertos
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
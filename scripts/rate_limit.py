@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Limite de taxa e novas tentativas para as chamadas HTTP ao Trello e ao Supabase
+Usado por migrate_trello_to_supabase.py e test_connections.py
+
+- TokenBucket: balde de fichas compartilhado entre threads. A taxa se adapta:
+  cai pela metade a cada 429 e volta a subir aos poucos com as respostas ok.
+- request(): faz a chamada respeitando o balde e repete em 429/5xx/erro de
+  rede, com backoff exponencial com jitter ou o tempo pedido no Retry-After
+  (limitado a BACKOFF_MAX). Chamadas que não são idempotentes (POST/PATCH
+  sem upsert) só são repetidas em 429 ou quando a conexão nem abriu (timeout
+  de conexão, recusa, DNS): depois de um 5xx ou de um timeout de leitura, o
+  servidor pode já ter gravado.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# Status que valem nova tentativa; 429 (recusada antes de processar) vale
+# para qualquer método
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRY_STATUS_NOT_IDEMPOTENT = {429}
+
+# Métodos que podem ser repetidos sem duplicar nada
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Novas tentativas e backoff (segundos)
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+
+class TokenBucket:
+    """Balde de fichas thread-safe com taxa adaptativa (AIMD)"""
+
+    def __init__(self, rate: float, capacity: float, min_rate: float = 0.5):
+        self.max_rate = rate          # fichas por segundo no melhor caso
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Espera até haver uma ficha e a consome"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self) -> None:
+        """O servidor respondeu 429: reduz a taxa pela metade e esvazia o balde"""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0
+
+    def succeeded(self) -> None:
+        """Resposta ok: recupera a taxa aos poucos, até o máximo configurado"""
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+# Trello: 100 requisições a cada 10s por token (300 por chave)
+TRELLO_LIMITER = TokenBucket(rate=9, capacity=10)
+
+# Supabase (PostgREST): sem limite rígido, só evita rajadas
+SUPABASE_LIMITER = TokenBucket(rate=50, capacity=50)
+
+
+def retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Segundos pedidos no cabeçalho Retry-After (em segundos ou data HTTP),
+    no máximo BACKOFF_MAX: um valor enorme não pode travar a migração
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(BACKOFF_MAX, max(0.0, seconds))
+
+
+def backoff(attempt: int) -> float:
+    """Backoff exponencial com jitter completo"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def connection_not_opened(error: Exception) -> bool:
+    """
+    A requisição nem saiu? Timeout de conexão, conexão recusada ou falha de
+    DNS: repetir é seguro mesmo sem idempotência.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)   # MaxRetryError do urllib3
+    return isinstance(reason, NewConnectionError) or isinstance(error.__context__, NewConnectionError)
+
+
+def request(method: str, url: str, limiter: TokenBucket, session=requests,
+            max_retries: int = MAX_RETRIES, idempotent: Optional[bool] = None,
+            **kwargs) -> requests.Response:
+    """
+    Como session.request(method, url, **kwargs), passando pelo limitador e
+    repetindo em 429/5xx e erros de rede. Depois da última tentativa, devolve
+    a última resposta (ou relança o último erro de rede).
+
+    idempotent: None decide pelo método (IDEMPOTENT_METHODS); passe True num
+    POST que é upsert (on_conflict) ou num PATCH que só grava valores fixos.
+    Sem idempotência, só 429 e falha ao abrir a conexão (connection_not_opened)
+    são repetidos.
+    """
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    retry_status = RETRY_STATUS if idempotent else RETRY_STATUS_NOT_IDEMPOTENT
+
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == max_retries or not (idempotent or connection_not_opened(e)):
+                raise
+            time.sleep(backoff(attempt))
+            continue
+
+        if response.status_code not in retry_status or attempt == max_retries:
+            # só uma resposta boa sobe a taxa; um 5xx na última tentativa, não
+            if response.status_code not in RETRY_STATUS:
+                limiter.succeeded()
+            return response
+
+        if response.status_code == 429:
+            limiter.throttled()
+        wait = retry_after(response)
+        time.sleep(wait if wait is not None else backoff(attempt))
@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""
+Snapshot colunar comprimido dos CSVs de public/exports/dados
+
+Cada CSV vira um arquivo .col (em public/exports/dados/colunar/) com as
+colunas guardadas separadamente, cada uma no formato que ela comporta:
+
+- uuid:      16 bytes por valor
+- int:       int64
+- decimal:   float64 (valor_orcado, valor_custo, margem_aplicada...)
+- timestamp: int64, microssegundos desde 1970-01-01 (epoch)
+- date:      int32, dias desde 1970-01-01
+- dict:      dicionário + códigos de 1 ou 2 bytes (status, tipo, prioridade...)
+- text:      tamanhos + texto UTF-8
+
+Cada coluna é comprimida (zlib) à parte e o cabeçalho guarda onde ela está,
+então dá para carregar só as colunas pedidas direto em arrays (array.array,
+prontos para numpy.frombuffer), sem fazer o parse do CSV. Um tipo só é usado
+se todos os valores voltam exatamente ao texto original: o snapshot devolve
+as mesmas linhas que o csv.reader leria do CSV (--check confere). As aspas e
+o fim de linha (\r\n ou \n) do arquivo não são guardados.
+
+O separador de cada CSV (01_companies.csv usa ";") sai do cabeçalho
+(detect_delimiter, também usado por export_dados.py e mirror_dados.py) e fica
+no cabeçalho do snapshot, em "delimitador".
+
+CSVs pequenos (abaixo de INLINE_MAX_BYTES) não compensam o formato colunar:
+o cabeçalho e a compressão de cada coluna custariam mais que os dados. O
+snapshot guarda o próprio CSV, comprimido num buffer só, e as colunas são
+montadas na leitura (a mesma API de load_columns).
+
+Execute:
+    python snapshot_dados.py                                   # todos os CSVs do índice
+    python snapshot_dados.py --tables ordens_servico,ordens_servico_itens
+    python snapshot_dados.py --check                           # confere os snapshots contra os CSVs
+"""
+
+import argparse
+import array
+import csv
+import hashlib
+import io
+import json
+import re
+import struct
+import sys
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# ========== CONFIGURAÇÕES ==========
+EXPORT_DIR = Path(__file__).resolve().parent.parent / "public" / "exports" / "dados"
+SNAPSHOT_DIR = EXPORT_DIR / "colunar"
+INDEX_FILE = "00_INDICE_TABELAS.csv"
+SNAPSHOT_SUFFIX = ".col"
+
+MAGIC = b"DAPCOL1\n"
+COMPRESSION_LEVEL = 6
+# Abaixo disso o CSV vai inteiro (comprimido) para o snapshot
+INLINE_MAX_BYTES = 64 * 1024
+
+# Separadores reconhecidos no cabeçalho dos CSVs; sem arquivo, vírgula
+DELIMITERS = (",", ";")
+
+# Texto vira dicionário se tiver até 65535 valores distintos e cada um
+# se repetir, em média, pelo menos DICT_MIN_REPEAT vezes
+DICT_MAX_SIZE = 65535
+DICT_MIN_REPEAT = 2
+
+EPOCH = datetime(1970, 1, 1)
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+INT_RE = re.compile(r"0|-?[1-9][0-9]*")   # sem "-0", que voltaria como "0"
+DECIMAL_RE = re.compile(r"-?[0-9]+(?:\.([0-9]+))?")
+DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+TIMESTAMP_RE = re.compile(
+    r"([0-9]{4}-[0-9]{2}-[0-9]{2})([ T])([0-9]{2}:[0-9]{2}:[0-9]{2})(?:\.([0-9]{1,6}))?(Z|[+-][0-9]{2}(?::?[0-9]{2})?)?")
+PLAIN_TIMESTAMP = r"[0-9]{4}-[0-9]{2}-[0-9]{2}[ ][0-9]{2}:[0-9]{2}:[0-9]{2}"
+
+
+def column_pattern(pattern: str) -> "re.Pattern":
+    """Casa a coluna inteira ("\\n".join dos valores) num fullmatch só, sem laço em Python"""
+    return re.compile(rf"(?:(?:{pattern})\n)*(?:{pattern})")
+
+
+UUID_COLUMN_RE = column_pattern(UUID_RE.pattern)
+INT_COLUMN_RE = column_pattern(INT_RE.pattern)
+DECIMAL_COLUMN_RE = column_pattern(DECIMAL_RE.pattern)
+DATE_COLUMN_RE = column_pattern(DATE_RE.pattern)
+# Sem fração nem fuso ("2026-01-16 03:36:56", o caso comum), com espaço ou com T
+PLAIN_TIMESTAMP_COLUMN_RES = {sep: column_pattern(PLAIN_TIMESTAMP.replace("[ ]", f"[{sep}]")) for sep in " T"}
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+# ========== COLUNAS ==========
+
+class SnapshotColumn:
+    """
+    Coluna carregada de um snapshot.
+
+    values: array.array com os valores (uuid: bytes, 16 por linha; text: list de str;
+            dict: códigos no dicionário). valid: bytes com 1/0 por linha (None se
+            não há nulos); nos tipos numéricos e de data, o CSV vazio é nulo.
+    scales: casas decimais de cada valor, nas colunas decimal sem grafia única.
+    """
+
+    def __init__(self, name: str, kind: str, values, valid: Optional[bytes] = None,
+                 dictionary: Optional[List[str]] = None, meta: Optional[dict] = None,
+                 scales: Optional[bytes] = None):
+        self.name = name
+        self.kind = kind
+        self.values = values
+        self.valid = valid
+        self.dictionary = dictionary
+        self.meta = meta or {}
+        self.scales = scales
+
+    def __len__(self) -> int:
+        if self.kind == "uuid":
+            return len(self.values) // 16
+        return len(self.values)
+
+    def to_strings(self) -> List[str]:
+        """Os valores como estavam no CSV"""
+        kind = self.kind
+        if kind == "text":
+            return list(self.values)
+        if kind == "dict":
+            dictionary = self.dictionary
+            return [dictionary[code] for code in self.values]
+
+        if kind == "uuid":
+            data = self.values
+            strings = [str(uuid.UUID(bytes=data[i:i + 16])) for i in range(0, len(data), 16)]
+        elif kind == "int":
+            strings = [str(v) for v in self.values]
+        elif kind == "decimal" and self.scales is not None:
+            strings = [f"{v:.{scale}f}" for v, scale in zip(self.values, self.scales)]
+        elif kind == "decimal":
+            strings = [format_decimal(v, self.meta.get("scale")) for v in self.values]
+        elif kind == "timestamp":
+            strings = [format_timestamp(v, self.meta["sep"], self.meta["suffix"]) for v in self.values]
+        else:  # date
+            strings = [(EPOCH + timedelta(days=v)).strftime("%Y-%m-%d") for v in self.values]
+
+        if self.valid is not None:
+            strings = [s if ok else "" for s, ok in zip(strings, self.valid)]
+        return strings
+
+
+def format_decimal(value: float, scale: Optional[int]) -> str:
+    if scale is not None:
+        return f"{value:.{scale}f}"
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+def format_timestamp(micros: int, sep: str, suffix: str) -> str:
+    moment = EPOCH + timedelta(microseconds=micros)
+    text = f"{moment:%Y-%m-%d}{sep}{moment:%H:%M:%S}"
+    if moment.microsecond:
+        text += "." + f"{moment.microsecond:06d}".rstrip("0")
+    return text + suffix
+
+
+def little_endian(values: array.array) -> bytes:
+    if sys.byteorder == "big":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def from_little_endian(typecode: str, data: bytes) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+# ========== CODIFICAÇÃO ==========
+# Cada encode_* devolve (meta, buffers) ou None se algum valor não cabe no tipo
+# sem perder a grafia original
+
+def null_mask(values: Sequence[str]) -> Optional[bytes]:
+    if all(values):
+        return None
+    return bytes(1 if v else 0 for v in values)
+
+
+def column_matches(pattern: "re.Pattern", values: Sequence[str]) -> bool:
+    """Todos os valores não vazios (e há algum) casam com o *_COLUMN_RE"""
+    items = list(filter(None, values))
+    text = "\n".join(items)
+    # Um valor com quebra de linha não pode se passar por duas linhas da coluna
+    return text.count("\n") == len(items) - 1 and pattern.fullmatch(text) is not None
+
+
+def encode_uuid(values: Sequence[str]):
+    if not column_matches(UUID_COLUMN_RE, values):
+        return None
+    data = bytes.fromhex("".join(v or "0" * 32 for v in values).replace("-", ""))
+    return {}, {"values": data}
+
+
+def encode_int(values: Sequence[str]):
+    if not column_matches(INT_COLUMN_RE, values):
+        return None
+    numbers = [int(v) if v else 0 for v in values]
+    if numbers and (min(numbers) < INT64_MIN or max(numbers) > INT64_MAX):
+        return None
+    return {}, {"values": little_endian(array.array("q", numbers))}
+
+
+def decimal_scale(value: str) -> int:
+    point = value.find(".")
+    return 0 if point < 0 else len(value) - point - 1
+
+
+def encode_decimal(values: Sequence[str]):
+    if not column_matches(DECIMAL_COLUMN_RE, values):
+        return None
+    numbers = [float(v) if v else 0.0 for v in values]
+    buffers = {"values": little_endian(array.array("d", numbers))}
+
+    # A menor grafia ("351.4", "350")
+    if all(not v or format_decimal(n, None) == v for v, n in zip(values, numbers)):
+        return {"scale": None}, buffers
+
+    # Casas fixas (numeric(10,2) do Postgres: "350.00")
+    scale = decimal_scale(next(v for v in values if v))
+    fixed = f"{{:.{scale}f}}".format
+    if scale and all(not v or fixed(n) == v for v, n in zip(values, numbers)):
+        return {"scale": scale}, buffers
+
+    # Senão, as casas de cada valor ("4827.0" e "351.45" na mesma coluna)
+    row_scales = [decimal_scale(v) for v in values]
+    if max(row_scales) > 255 or any(v and f"{n:.{s}f}" != v for v, n, s in zip(values, numbers, row_scales)):
+        return None
+    buffers["scales"] = bytes(row_scales)
+    return {"scale": None}, buffers
+
+
+def encode_timestamp(values: Sequence[str]):
+    for sep, pattern in PLAIN_TIMESTAMP_COLUMN_RES.items():
+        if column_matches(pattern, values):
+            try:
+                micros = [(datetime.fromisoformat(v) - EPOCH) // ONE_MICROSECOND if v else 0 for v in values]
+            except ValueError:
+                return None
+            return {"sep": sep, "suffix": ""}, {"values": little_endian(array.array("q", micros))}
+
+    match = TIMESTAMP_RE.fullmatch
+    layout = None
+    micros = []
+    for v in values:
+        if not v:
+            micros.append(0)
+            continue
+        m = match(v)
+        if not m:
+            return None
+        data, sep, hora, fracao, suffix = m.groups()
+        # Separador e fuso precisam ser os mesmos na coluna toda
+        if layout is None:
+            layout = (sep, suffix or "")
+        elif layout != (sep, suffix or ""):
+            return None
+        try:
+            moment = datetime.fromisoformat(f"{data} {hora}")
+        except ValueError:
+            return None
+        if fracao:
+            if fracao.endswith("0"):
+                return None
+            moment = moment.replace(microsecond=int(fracao.ljust(6, "0")))
+        micros.append((moment - EPOCH) // ONE_MICROSECOND)
+    if layout is None:
+        return None
+    sep, suffix = layout
+    return {"sep": sep, "suffix": suffix}, {"values": little_endian(array.array("q", micros))}
+
+
+def encode_date(values: Sequence[str]):
+    if not column_matches(DATE_COLUMN_RE, values):
+        return None
+    try:
+        days = [(datetime.fromisoformat(v) - EPOCH).days if v else 0 for v in values]
+    except ValueError:
+        return None
+    return {}, {"values": little_endian(array.array("i", days))}
+
+
+def encode_dict(values: Sequence[str]):
+    codes_by_value = {}
+    codes = [codes_by_value.setdefault(v, len(codes_by_value)) for v in values]
+    if len(codes_by_value) > DICT_MAX_SIZE or len(codes_by_value) * DICT_MIN_REPEAT > len(values):
+        return None
+    typecode = "B" if len(codes_by_value) <= 256 else "H"
+    return ({"dictionary": list(codes_by_value), "typecode": typecode},
+            {"values": little_endian(array.array(typecode, codes))})
+
+
+def encode_text(values: Sequence[str]):
+    encoded = [v.encode("utf-8") for v in values]
+    return {}, {"lengths": little_endian(array.array("I", map(len, encoded))), "values": b"".join(encoded)}
+
+
+# Na ordem de preferência; o dicionário vem antes do texto
+ENCODERS = [
+    ("uuid", encode_uuid),
+    ("int", encode_int),
+    ("decimal", encode_decimal),
+    ("timestamp", encode_timestamp),
+    ("date", encode_date),
+    ("dict", encode_dict),
+    ("text", encode_text),
+]
+NULLABLE_KINDS = {"uuid", "int", "decimal", "timestamp", "date"}
+
+
+def encode_column(values: Sequence[str]) -> Tuple[str, dict, Dict[str, bytes]]:
+    has_values = any(values)
+    for kind, encoder in ENCODERS:
+        if kind in NULLABLE_KINDS and not has_values:
+            continue
+        encoded = encoder(values)
+        if encoded is not None:
+            meta, buffers = encoded
+            if kind in NULLABLE_KINDS:
+                valid = null_mask(values)
+                if valid is not None:
+                    buffers["valid"] = valid
+            return kind, meta, buffers
+    raise AssertionError("encode_text aceita qualquer coluna")
+
+
+# ========== ARQUIVO ==========
+# MAGIC | tamanho do cabeçalho (uint32 LE) | cabeçalho JSON | buffers zlib
+# O cabeçalho guarda, para cada buffer, [posição a partir do fim do cabeçalho,
+# tamanho gravado, tamanho original]; se os dois tamanhos são iguais, o buffer
+# não foi comprimido.
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def header_delimiter(line: str) -> str:
+    """Separador do CSV pela linha do cabeçalho: o de DELIMITERS que mais aparece (empate: vírgula)"""
+    return max(DELIMITERS, key=line.count)
+
+
+def detect_delimiter(path: Path) -> str:
+    """Separador do CSV em `path` (vírgula se o arquivo não existe)"""
+    if not path.exists():
+        return DELIMITERS[0]
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return header_delimiter(f.readline())
+
+
+def table_columns(header: List[str], rows: List[List[str]]) -> Tuple[List[str], List[int], List[Sequence[str]]]:
+    """
+    (nomes, campos por linha, valores por coluna). Linhas com mais ou menos
+    campos que o cabeçalho (exportações feitas à mão) são completadas com
+    vazios; as colunas a mais ganham o nome "coluna_N".
+    """
+    width = max([len(header)] + [len(row) for row in rows])
+    names = header + [f"coluna_{i + 1}" for i in range(len(header), width)]
+    field_counts = [len(row) for row in rows]
+    if any(n != width for n in field_counts):
+        rows = [row + [""] * (width - len(row)) for row in rows]
+    return names, field_counts, list(zip(*rows)) if rows else [()] * width
+
+
+def write_snapshot(csv_path: Path, snapshot_path: Path) -> dict:
+    """Grava o snapshot do CSV; retorna o cabeçalho (linhas, colunas e tipos, sha256 do CSV)"""
+    sha256 = file_sha256(csv_path)
+    inline = csv_path.stat().st_size < INLINE_MAX_BYTES
+    delimiter = detect_delimiter(csv_path)
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, [])
+        rows = list(reader)
+
+    names, field_counts, columns_values = table_columns(header, rows)
+    del rows   # uma lista por coluna; cada uma é liberada assim que é codificada
+
+    blobs = []
+    position = 0
+
+    def add_buffer(raw: bytes) -> List[int]:
+        nonlocal position
+        blob = zlib.compress(raw, COMPRESSION_LEVEL)
+        if len(blob) >= len(raw):
+            blob = raw   # não comprimiu (colunas pequenas): grava como está
+        blobs.append(blob)
+        entry = [position, len(blob), len(raw)]
+        position += len(blob)
+        return entry
+
+    info = {
+        "versao": 1,
+        "arquivo": csv_path.name,
+        "csv_sha256": sha256,
+        "linhas": len(field_counts),
+        "cabecalho": len(header),
+        "delimitador": delimiter,
+    }
+    if inline:
+        info["csv"] = add_buffer(csv_path.read_bytes())
+    else:
+        columns = []
+        for i, name in enumerate(names):
+            kind, meta, buffers = encode_column(columns_values[i])
+            columns_values[i] = None
+            columns.append({"nome": name, "tipo": kind, "meta": meta,
+                            "buffers": {key: add_buffer(raw) for key, raw in buffers.items()}})
+        info["colunas"] = columns
+        if any(n != len(names) for n in field_counts):
+            info["campos"] = add_buffer(little_endian(array.array("H", field_counts)))
+
+    header_json = json.dumps(info, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_json)))
+        f.write(header_json)
+        for blob in blobs:
+            f.write(blob)
+    tmp.replace(snapshot_path)
+    return info
+
+
+def read_header(f) -> Tuple[dict, int]:
+    """(cabeçalho, posição onde começam os buffers)"""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{getattr(f, 'name', 'arquivo')} não é um snapshot colunar")
+    (size,) = struct.unpack("<I", f.read(4))
+    return json.loads(f.read(size).decode("utf-8")), len(MAGIC) + 4 + size
+
+
+def snapshot_info(snapshot_path: Path) -> dict:
+    with open(snapshot_path, "rb") as f:
+        return read_header(f)[0]
+
+
+def read_buffer(f, base: int, entry: List[int]) -> bytes:
+    offset, size, raw_size = entry
+    f.seek(base + offset)
+    raw = f.read(size)
+    if size < raw_size:
+        raw = zlib.decompress(raw)
+    if len(raw) != raw_size:
+        raise ValueError(f"buffer corrompido em {getattr(f, 'name', 'arquivo')}")
+    return raw
+
+
+def decode_column(f, base: int, column: dict) -> SnapshotColumn:
+    buffers = {key: read_buffer(f, base, entry) for key, entry in column["buffers"].items()}
+    return make_column(column["nome"], column["tipo"], column["meta"], buffers)
+
+
+def make_column(name: str, kind: str, meta: dict, buffers: Dict[str, bytes]) -> SnapshotColumn:
+    """SnapshotColumn a partir dos buffers de encode_column (lidos do arquivo ou não)"""
+    values = buffers["values"]
+    if kind == "text":
+        lengths = from_little_endian("I", buffers["lengths"])
+        strings = []
+        position = 0
+        for length in lengths:
+            strings.append(values[position:position + length].decode("utf-8"))
+            position += length
+        values = strings
+    elif kind == "dict":
+        values = from_little_endian(meta["typecode"], values)
+    elif kind in ("int", "timestamp"):
+        values = from_little_endian("q", values)
+    elif kind == "decimal":
+        values = from_little_endian("d", values)
+    elif kind == "date":
+        values = from_little_endian("i", values)
+    return SnapshotColumn(name, kind, values, buffers.get("valid"), meta.get("dictionary"), meta,
+                          buffers.get("scales"))
+
+
+def load_columns(snapshot_path: Path, columns: Optional[Sequence[str]] = None) -> Dict[str, SnapshotColumn]:
+    """
+    Carrega as colunas pedidas (padrão: todas), sem descomprimir as outras.
+    Coluna inexistente → KeyError.
+    """
+    with open(snapshot_path, "rb") as f:
+        info, base = read_header(f)
+        if "csv" in info:
+            rows = inline_rows(f, base, info)
+            all_names, _, columns_values = table_columns(rows[0], rows[1:])
+            by_name = dict(zip(all_names, columns_values))
+        else:
+            by_name = {column["nome"]: column for column in info["colunas"]}
+        names = list(by_name) if columns is None else list(columns)
+        missing = [name for name in names if name not in by_name]
+        if missing:
+            raise KeyError(f"{snapshot_path.name}: coluna(s) inexistente(s): {', '.join(missing)}")
+        if "csv" in info:
+            return {name: make_column(name, *encode_column(by_name[name])) for name in names}
+        return {name: decode_column(f, base, by_name[name]) for name in names}
+
+
+def inline_rows(f, base: int, info: dict) -> List[List[str]]:
+    """Linhas do CSV guardado inteiro num snapshot pequeno (cabeçalho incluído)"""
+    text = read_buffer(f, base, info["csv"]).decode("utf-8")
+    return list(csv.reader(io.StringIO(text, newline=""), delimiter=snapshot_delimiter(info))) or [[]]
+
+
+def snapshot_delimiter(info: dict) -> str:
+    """Separador do CSV de origem (snapshots anteriores ao campo: vírgula)"""
+    return info.get("delimitador", DELIMITERS[0])
+
+
+def read_csv_columns(csv_path: Path, columns: Sequence[str]) -> Tuple[Dict[str, SnapshotColumn], int]:
+    """
+    As colunas pedidas (as que existem no cabeçalho) direto do CSV, nos mesmos
+    tipos do snapshot, sem gravá-lo; retorna (colunas, linhas).
+    """
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=detect_delimiter(csv_path))
+        header = next(reader, [])
+        names = [name for name in columns if name in header]
+        if not names:
+            return {}, sum(1 for _ in reader)
+        indexes = [header.index(name) for name in names]
+        width = max(indexes) + 1
+        picked = []
+        for row in reader:
+            if len(row) < width:   # linha curta (exportação feita à mão)
+                row = row + [""] * (width - len(row))
+            picked.append([row[i] for i in indexes])
+    values = list(zip(*picked)) if picked else [()] * len(names)
+    del picked
+    data = {}
+    for name, column_values in zip(names, values):
+        kind, meta, buffers = encode_column(column_values)
+        data[name] = make_column(name, kind, meta, buffers)
+    return data, len(values[0])
+
+
+def iter_rows(snapshot_path: Path) -> Iterator[List[str]]:
+    """
+    As linhas do CSV original (cabeçalho incluído), como o csv.reader as leria
+    com o separador do arquivo (snapshot_delimiter, para regravá-lo igual)
+    """
+    with open(snapshot_path, "rb") as f:
+        info, base = read_header(f)
+        if "csv" in info:
+            yield from inline_rows(f, base, info)
+            return
+        columns = [decode_column(f, base, column).to_strings() for column in info["colunas"]]
+        field_counts = (from_little_endian("H", read_buffer(f, base, info["campos"]))
+                        if "campos" in info else None)
+
+    yield [column["nome"] for column in info["colunas"][:info["cabecalho"]]]
+    for i, row in enumerate(zip(*columns)):
+        yield list(row if field_counts is None else row[:field_counts[i]])
+
+
+def check_snapshot(csv_path: Path, snapshot_path: Path) -> bool:
+    """O snapshot reconstrói exatamente as linhas do CSV?"""
+    delimiter = detect_delimiter(csv_path)
+    if snapshot_delimiter(snapshot_info(snapshot_path)) != delimiter:
+        return False
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        expected = list(csv.reader(f, delimiter=delimiter))
+    if not expected:
+        expected = [[]]
+    return list(iter_rows(snapshot_path)) == expected
+
+
+# ========== CLI ==========
+
+def index_files(export_dir: Path) -> List[Tuple[str, str]]:
+    """[(arquivo, tabela)] na ordem do índice"""
+    with open(export_dir / INDEX_FILE, "r", encoding="utf-8", newline="") as f:
+        return [(row["arquivo"], row["tabela"]) for row in csv.DictReader(f)]
+
+
+def snapshot_path_for(snapshot_dir: Path, arquivo: str) -> Path:
+    return snapshot_dir / (Path(arquivo).stem + SNAPSHOT_SUFFIX)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot colunar comprimido dos CSVs de public/exports/dados")
+    parser.add_argument("--input", type=Path, default=EXPORT_DIR,
+                        help=f"pasta dos CSVs e do {INDEX_FILE} (padrão: {EXPORT_DIR})")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="pasta dos snapshots (padrão: colunar/ dentro de --input)")
+    parser.add_argument("--tables", default=None,
+                        help="só estas tabelas, separadas por vírgula (padrão: todas do índice)")
+    parser.add_argument("--check", action="store_true",
+                        help="não grava: confere se os snapshots reconstroem os CSVs")
+    args = parser.parse_args(argv)
+    if args.output is None:
+        args.output = args.input / SNAPSHOT_DIR.name
+    if args.tables:
+        args.tables = {name.strip() for name in args.tables.split(",") if name.strip()}
+    return args
+
+
+def main(argv=None) -> bool:
+    args = parse_args(argv)
+    files = [(arquivo, tabela) for arquivo, tabela in index_files(args.input)
+             if args.tables is None or tabela.split(" ")[0] in args.tables or Path(arquivo).stem in args.tables]
+    if args.tables is not None and not files:
+        print(f"❌ Nenhuma tabela do índice em --tables: {', '.join(sorted(args.tables))}")
+        return False
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    falhas = 0
+    total_csv = total_snapshot = 0
+    start = time.perf_counter()
+    for arquivo, tabela in files:
+        csv_path = args.input / arquivo
+        snapshot_path = snapshot_path_for(args.output, arquivo)
+        if not csv_path.exists():
+            print(f"⚠️  {arquivo}: arquivo não encontrado")
+            continue
+        if args.check:
+            if not snapshot_path.exists():
+                falhas += 1
+                print(f"❌ {snapshot_path.name}: não existe")
+            elif snapshot_info(snapshot_path)["csv_sha256"] != file_sha256(csv_path):
+                falhas += 1
+                print(f"❌ {snapshot_path.name}: desatualizado (o CSV mudou)")
+            elif not check_snapshot(csv_path, snapshot_path):
+                falhas += 1
+                print(f"❌ {snapshot_path.name}: não reconstrói {arquivo}")
+            else:
+                print(f"✅ {snapshot_path.name}")
+            continue
+
+        info = write_snapshot(csv_path, snapshot_path)
+        csv_size, snapshot_size = csv_path.stat().st_size, snapshot_path.stat().st_size
+        total_csv += csv_size
+        total_snapshot += snapshot_size
+        tipos = ("CSV inteiro, comprimido" if "csv" in info
+                 else ", ".join(f"{c['nome']}:{c['tipo']}" for c in info["colunas"]))
+        print(f"✅ {snapshot_path.name}: {info['linhas']} linhas, {csv_size:,} → {snapshot_size:,} bytes ({tipos})")
+
+    if not args.check and total_csv:
+        print(f"\n🗂️  {len(files)} snapshots em {args.output}: {total_csv:,} → {total_snapshot:,} bytes "
+              f"({total_snapshot / total_csv:.0%}) em {time.perf_counter() - start:.2f} s")
+    return not falhas
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,13 @@
+-- Chave única para o upsert da migração Trello → Supabase (scripts/migrate_trello_to_supabase.py)
+-- Data: 2026-10-18
+--
+-- O script grava com ON CONFLICT (trello_card_id): rodar a migração de novo
+-- atualiza as OS em vez de duplicá-las. OS sem card do Trello (NULL) não
+-- conflitam entre si.
+--
+-- Se uma migração antiga já deixou duplicatas, remova-as antes:
+--   SELECT trello_card_id, COUNT(*) FROM public.ordens_servico
+--   WHERE trello_card_id IS NOT NULL GROUP BY 1 HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ordens_servico_trello_card_id
+ON public.ordens_servico(trello_card_id);
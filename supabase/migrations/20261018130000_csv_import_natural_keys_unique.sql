@@ -0,0 +1,45 @@
+-- Chaves únicas para a conversão incremental dos CSVs
+-- Data: 2026-10-18
+-- Dependência: templates_csv/csv_to_sql.py --incremental / --incremental-rows
+--   grava clientes, veículos e OS com
+--   INSERT ... ON CONFLICT (<chave>) WHERE <chave> <> '' DO UPDATE
+--   e precisa destes índices; sem eles, o Postgres recusa o ON CONFLICT.
+--   As outras conversões (sem --incremental) não dependem deles.
+--
+-- Os índices são parciais: só as chaves preenchidas (cpf, plate, numero_os
+-- diferentes de '' e de NULL) precisam ser únicas, que é o que o upsert usa
+-- para achar a linha já carregada. Perfis sem CPF não conflitam entre si.
+--
+-- Se já houver duplicatas numa tabela, o índice dela não é criado (a
+-- migration segue, com um WARNING) e o --incremental falha só para essa
+-- tabela até as duplicatas serem resolvidas e esta migration rodar de novo:
+--   SELECT cpf, COUNT(*) FROM public.profiles WHERE cpf <> '' GROUP BY 1 HAVING COUNT(*) > 1;
+--   SELECT plate, COUNT(*) FROM public.vehicles WHERE plate <> '' GROUP BY 1 HAVING COUNT(*) > 1;
+--   SELECT numero_os, COUNT(*) FROM public.ordens_servico WHERE numero_os <> '' GROUP BY 1 HAVING COUNT(*) > 1;
+
+DO $$
+DECLARE
+  alvo RECORD;
+  duplicadas BIGINT;
+BEGIN
+  FOR alvo IN
+    SELECT * FROM (VALUES
+      ('idx_profiles_cpf_unique', 'profiles', 'cpf'),
+      ('idx_vehicles_plate_unique', 'vehicles', 'plate'),
+      ('idx_ordens_servico_numero_os_unique', 'ordens_servico', 'numero_os')
+    ) AS t(indice, tabela, coluna)
+  LOOP
+    EXECUTE format(
+      'SELECT COUNT(*) FROM (SELECT 1 FROM public.%I WHERE %I <> '''' GROUP BY %I HAVING COUNT(*) > 1) d',
+      alvo.tabela, alvo.coluna, alvo.coluna)
+    INTO duplicadas;
+
+    IF duplicadas > 0 THEN
+      RAISE WARNING '%: % valor(es) de % repetido(s); índice % não criado',
+        alvo.tabela, duplicadas, alvo.coluna, alvo.indice;
+    ELSE
+      EXECUTE format('CREATE UNIQUE INDEX IF NOT EXISTS %I ON public.%I (%I) WHERE %I <> ''''',
+        alvo.indice, alvo.tabela, alvo.coluna, alvo.coluna);
+    END IF;
+  END LOOP;
+END $$;
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK DO CONVERSOR CSV → SQL
+===================================
+
+Gera CSVs sintéticos com os mesmos cabeçalhos dos templates (CPFs com dígitos
+verificadores válidos, placas antigas e Mercosul, referências consistentes
+entre as tabelas) e mede cada process_* de csv_to_sql.py: tempo, pico de
+memória (RSS) e bytes gerados. Cada medição roda num processo novo, para o
+pico de memória ser só daquela tabela.
+
+COMO USAR:
+    python benchmark_csv_to_sql.py                          # 10k, 100k e 1M linhas
+    python benchmark_csv_to_sql.py --sizes 10k,100k --batch-size 500
+    python benchmark_csv_to_sql.py --save antes.json --rev HEAD~1   # mede o conversor de outro commit
+    python benchmark_csv_to_sql.py --compare antes.json     # compara com uma rodada salva
+
+Os CSVs gerados ficam em cache na pasta temporária do sistema (mesmo tamanho e
+semente = mesmos arquivos), então só a primeira rodada de cada tamanho paga a geração.
+"""
+
+import argparse
+import contextlib
+import csv
+import importlib.util
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+CONVERTER = BASE_DIR / "csv_to_sql.py"
+
+# Tamanhos padrão (linhas por tabela)
+DEFAULT_SIZES = "10k,100k,1M"
+
+# Onde ficam os CSVs sintéticos (cache entre rodadas)
+DATA_DIR = Path(tempfile.gettempdir()) / "csv_to_sql_benchmark"
+
+# Variação (em %) a partir da qual --compare marca a medição
+LIMIAR_REGRESSAO = 10
+
+# CSV de cada tabela → função do conversor
+TABLES = {
+    '01_clientes.csv': 'process_clientes',
+    '02_veiculos.csv': 'process_veiculos',
+    '03_ordens_servico.csv': 'process_ordens_servico',
+    '04_itens_os.csv': 'process_itens_os',
+    '05_agendamentos.csv': 'process_agendamentos',
+    '06_pecas_estoque.csv': 'process_pecas_estoque',
+    '07_patio_kanban.csv': 'process_patio_kanban',
+    '08_pagamentos.csv': 'process_pagamentos',
+}
+
+# ========== DADOS SINTÉTICOS ==========
+
+NOMES = ["João", "Maria", "Pedro", "Ana", "Carlos", "Juliana", "Rafael", "Fernanda", "Lucas", "Beatriz"]
+SOBRENOMES = ["Silva", "Santos", "Oliveira", "Costa", "Souza", "Lima", "Pereira", "Almeida", "Ferreira", "Rocha"]
+CIDADES = [("São Paulo", "SP"), ("Campinas", "SP"), ("Rio de Janeiro", "RJ"), ("Belo Horizonte", "MG"), ("Curitiba", "PR")]
+RUAS = ["Rua das Flores", "Av. Paulista", "Rua Augusta", "Av. Brasil", "Rua XV de Novembro"]
+VEICULOS = [("Honda", "Civic EXL 2.0"), ("Toyota", "Corolla XEI"), ("Volkswagen", "Gol 1.0"),
+            ("Chevrolet", "Onix LT"), ("Hyundai", "HB20 Comfort"), ("Fiat", "Strada Freedom")]
+CORES = ["Preto", "Prata", "Branco", "Vermelho", "Cinza", "Azul"]
+MECANICOS = ["João Mecânico", "Pedro Mecânico", "Carlos Elétrica", "Marcos Funilaria"]
+PROBLEMAS = ["Barulho no motor ao acelerar", "Revisão dos 40 mil km", "Freio rangendo",
+             "Ar-condicionado não gela", "Luz da injeção acesa"]
+STATUS_OS = ["orcamento", "aprovado", "em_execucao", "concluido", "entregue", "cancelado"]
+PRIORIDADES = ["verde", "amarelo", "vermelho"]
+TIERS = ["bronze", "prata", "ouro", "platina"]
+ESTAGIOS = ["entrada", "diagnostico", "aguardando_aprovacao", "aguardando_pecas", "em_execucao", "pronto"]
+FORMAS_PAGAMENTO = ["pix", "dinheiro", "cartao_credito", "cartao_debito", "transferencia"]
+CATEGORIAS = ["Lubrificantes", "Filtros", "Freios", "Suspensão", "Elétrica"]
+
+
+def cpf(i):
+    """CPF formatado e válido, único para cada i < 10^9"""
+    base = [int(d) for d in f"{(i * 7919 + 10_000_019) % 1_000_000_000:09d}"]
+    for size in (9, 10):
+        soma = sum(d * (size + 1 - k) for k, d in enumerate(base))
+        base.append((soma * 10 % 11) % 10)
+    d = ''.join(map(str, base))
+    return f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}"
+
+
+def placa(i):
+    """Placa única para cada i: antiga (ABC-1234) nos pares, Mercosul (ABC1D23) nos ímpares"""
+    n, numero = divmod(i, 10000)
+    letras = ''.join(chr(65 + (n // 26 ** k) % 26) for k in (2, 1, 0))
+    digitos = f"{numero:04d}"
+    if i % 2 == 0:
+        return f"{letras}-{digitos}"
+    return f"{letras}{digitos[0]}{chr(65 + int(digitos[1]))}{digitos[2:]}"
+
+
+def numero_os(i):
+    return f"OS-{2020 + i // 1_000_000}-{i % 1_000_000:06d}"
+
+
+def data(rng, ano=2026):
+    return f"{ano}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def valor(rng, minimo, maximo):
+    return f"{rng.uniform(minimo, maximo):.2f}"
+
+
+def clientes_row(i, rng):
+    nome = f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}"
+    cidade, estado = rng.choice(CIDADES)
+    return {
+        'nome_completo': nome,
+        'cpf': cpf(i),
+        'email': f"cliente{i}@email.com",
+        'telefone': f"(11) 9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        'data_nascimento': data(rng, rng.randint(1950, 2005)),
+        'endereco_completo': f"{rng.choice(RUAS)}, {rng.randint(1, 3000)} - Centro",
+        'cep': f"{rng.randint(1000, 99999):05d}-{rng.randint(0, 999):03d}",
+        'cidade': cidade,
+        'estado': estado,
+        'tier_fidelidade': rng.choice(TIERS),
+        'pontos_fidelidade': str(rng.randint(0, 10000)),
+        'empresa_id': '1',
+        'observacoes': "Cliente VIP - prefere atendimento pela manhã" if i % 7 == 0 else '',
+    }
+
+
+def veiculos_row(i, rng):
+    marca, modelo = rng.choice(VEICULOS)
+    return {
+        'placa': placa(i),
+        'marca': marca,
+        'modelo': modelo,
+        'ano': str(rng.randint(2005, 2026)),
+        'cor': rng.choice(CORES),
+        'cpf_cliente': cpf(i // 2),
+        'quilometragem': str(rng.randint(0, 250000)),
+        'chassi': f"9BW{rng.randint(10 ** 13, 10 ** 14 - 1)}",
+        'renavam': f"{rng.randint(0, 10 ** 11 - 1):011d}",
+        'observacoes': "Veículo em excelente estado" if i % 5 == 0 else '',
+    }
+
+
+def ordens_servico_row(i, rng):
+    aprovado = valor(rng, 100, 5000)
+    return {
+        'numero_os': numero_os(i),
+        'placa_veiculo': placa(i),
+        'cpf_cliente': cpf(i // 2),
+        'status': rng.choice(STATUS_OS),
+        'descricao_problema': rng.choice(PROBLEMAS),
+        'diagnostico': "Necessário trocar correia dentada e tensor" if i % 3 else '',
+        'mecanico_responsavel': rng.choice(MECANICOS),
+        'data_entrada': data(rng),
+        'data_prevista_conclusao': data(rng),
+        'valor_orcado': aprovado,
+        'valor_aprovado': aprovado if i % 2 else '',
+        'empresa_id': '1',
+        'prioridade': rng.choice(PRIORIDADES),
+        'observacoes': "Cliente aguardando aprovação" if i % 4 == 0 else '',
+    }
+
+
+def itens_os_row(i, rng):
+    tipo = 'peca' if i % 2 else 'mao_de_obra'
+    return {
+        'numero_os': numero_os(i),
+        'tipo': tipo,
+        'descricao': "Correia dentada Gates" if tipo == 'peca' else "Troca de correia dentada",
+        'quantidade': str(rng.randint(1, 4)),
+        'valor_unitario': valor(rng, 20, 900),
+        'status': 'pendente',
+        'observacoes': "Código: 5521XS" if tipo == 'peca' else '',
+    }
+
+
+def agendamentos_row(i, rng):
+    return {
+        'placa_veiculo': placa(i),
+        'cpf_cliente': cpf(i // 2),
+        'data_agendamento': data(rng),
+        'hora_agendamento': f"{rng.randint(8, 17):02d}:{rng.choice(['00', '30'])}",
+        'servico_solicitado': rng.choice(PROBLEMAS),
+        'status': rng.choice(['pendente', 'confirmado']),
+        'observacoes_cliente': "Preferência: período da manhã" if i % 3 == 0 else '',
+        'empresa_id': '1',
+    }
+
+
+def pecas_estoque_row(i, rng):
+    custo = rng.uniform(5, 900)
+    return {
+        'codigo_peca': f"PECA-{i:07d}",
+        'nome': f"Peça {i}",
+        'categoria': rng.choice(CATEGORIAS),
+        'fabricante': rng.choice(["Mobil", "Tecfil", "Bosch", "Gates", "Cofap"]),
+        'preco_custo': f"{custo:.2f}",
+        'preco_venda': f"{custo * 1.3:.2f}",
+        'estoque_atual': str(rng.randint(0, 100)),
+        'estoque_minimo': str(rng.randint(1, 15)),
+        'localizacao': f"Prateleira {rng.choice('ABCDE')}{rng.randint(1, 9)}",
+        'empresa_id': '1',
+        'observacoes': '',
+    }
+
+
+def patio_kanban_row(i, rng):
+    return {
+        'numero_os': numero_os(i),
+        'placa_veiculo': placa(i),
+        'estagio_atual': rng.choice(ESTAGIOS),
+        'data_entrada_patio': f"{data(rng)} {rng.randint(8, 17):02d}:{rng.randint(0, 59):02d}:00",
+        'mecanico_responsavel': rng.choice(MECANICOS),
+        'observacoes_patio': "Aguardando cliente aprovar orçamento de R$ 850" if i % 5 == 0 else '',
+    }
+
+
+def pagamentos_row(i, rng):
+    total = valor(rng, 100, 5000)
+    return {
+        'numero_os': numero_os(i),
+        'cpf_cliente': cpf(i // 2),
+        'data_pagamento': data(rng),
+        'forma_pagamento': rng.choice(FORMAS_PAGAMENTO),
+        'valor_total': total,
+        'valor_pago': total if i % 3 else '0.00',
+        'status_pagamento': rng.choice(['pago', 'pendente']),
+        'numero_parcelas': str(rng.randint(1, 10)),
+        'observacoes': "Parcelado sem juros" if i % 6 == 0 else '',
+    }
+
+
+ROW_GENERATORS = {
+    '01_clientes.csv': clientes_row,
+    '02_veiculos.csv': veiculos_row,
+    '03_ordens_servico.csv': ordens_servico_row,
+    '04_itens_os.csv': itens_os_row,
+    '05_agendamentos.csv': agendamentos_row,
+    '06_pecas_estoque.csv': pecas_estoque_row,
+    '07_patio_kanban.csv': patio_kanban_row,
+    '08_pagamentos.csv': pagamentos_row,
+}
+
+
+def template_header(csv_name):
+    """Cabeçalho do template original (a fonte da verdade das colunas)"""
+    with open(BASE_DIR / csv_name, 'r', encoding='utf-8', newline='') as f:
+        return next(csv.reader(f))
+
+
+def generate_dataset(rows, seed):
+    """Gera (ou reaproveita do cache) os 8 CSVs com `rows` linhas cada; retorna a pasta"""
+    folder = DATA_DIR / f"{rows}_linhas_semente{seed}"
+    folder.mkdir(parents=True, exist_ok=True)
+    for csv_name, make_row in ROW_GENERATORS.items():
+        path = folder / csv_name
+        if path.exists():
+            continue
+        header = template_header(csv_name)
+        rng = random.Random(f"{seed}-{csv_name}")
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for i in range(rows):
+                row = make_row(i, rng)
+                writer.writerow([row.get(column, '') for column in header])
+        os.replace(tmp, path)
+    return folder
+
+# ========== MEDIÇÃO ==========
+
+def load_converter(path):
+    """Importa um csv_to_sql.py qualquer (da árvore atual ou extraído de um commit)"""
+    spec = importlib.util.spec_from_file_location('csv_to_sql_benchmark', path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        spec.loader.exec_module(module)
+    return module
+
+
+def measure(converter, function, csv_path, options):
+    """Roda uma conversão neste processo (chamado via --medir) e devolve as medidas"""
+    module = load_converter(converter)
+    with tempfile.TemporaryDirectory() as out:
+        module.SQL_OUTPUT_DIR = Path(out)
+        process = getattr(module, function)
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            start = time.perf_counter()
+            # versões antigas do conversor não aceitam opções
+            process(csv_path, **options) if options else process(csv_path)
+            elapsed = time.perf_counter() - start
+        output_bytes = sum(p.stat().st_size for p in Path(out).iterdir() if p.is_file())
+    return {
+        'tempo_s': round(elapsed, 4),
+        'pico_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'bytes_saida': output_bytes,
+    }
+
+
+def run_isolated(converter, function, csv_path, options):
+    """Roda measure() num processo novo (pico de RSS só desta conversão)"""
+    result = subprocess.run(
+        [sys.executable, __file__, '--medir', json.dumps([str(converter), function, str(csv_path), options])],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else
+                           f"código de saída {result.returncode}")
+    return json.loads(result.stdout)
+
+
+def converter_at(rev, folder):
+    """Extrai csv_to_sql.py do commit `rev` para `folder`"""
+    root = subprocess.run(['git', 'rev-parse', '--show-toplevel'], cwd=BASE_DIR,
+                          capture_output=True, text=True, check=True).stdout.strip()
+    relative = CONVERTER.resolve().relative_to(root).as_posix()
+    source = subprocess.run(['git', 'show', f"{rev}:{relative}"], cwd=root,
+                            capture_output=True, text=True, check=True).stdout
+    path = Path(folder) / 'csv_to_sql.py'
+    path.write_text(source, encoding='utf-8')
+    return path
+
+
+def revision_name(rev):
+    """Hash curto do commit medido (ou da árvore atual, com '+' se houver alterações)"""
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=BASE_DIR, capture_output=True, text=True).stdout.strip()
+    if rev:
+        return git('rev-parse', '--short', rev)
+    dirty = git('status', '--porcelain', '--', CONVERTER.name)
+    return git('rev-parse', '--short', 'HEAD') + ('+' if dirty else '')
+
+# ========== RELATÓRIO ==========
+
+def parse_size(text):
+    """'10k' → 10000, '1M' → 1000000"""
+    text = text.strip().lower()
+    factor = {'k': 1000, 'm': 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * factor)
+
+
+def compare(report, baseline):
+    """Imprime a variação de cada medição em relação a uma rodada salva"""
+    antes = {(r['linhas'], r['tabela']): r for r in baseline['resultados']}
+    print(f"\n📊 Comparação com {baseline['commit']} (variação ≥ {LIMIAR_REGRESSAO}% marcada)")
+    print(f"{'tabela':<24}{'linhas':>9}{'tempo':>18}{'pico RSS':>18}{'saída':>18}")
+    regressoes = 0
+    for r in report['resultados']:
+        b = antes.get((r['linhas'], r['tabela']))
+        if b is None or 'erro' in r or 'erro' in b:
+            continue
+        cells = []
+        for field in ('tempo_s', 'pico_rss_mb', 'bytes_saida'):
+            delta = (r[field] - b[field]) / b[field] * 100 if b[field] else 0
+            marca = '🔺' if delta >= LIMIAR_REGRESSAO else ('🔻' if delta <= -LIMIAR_REGRESSAO else '  ')
+            regressoes += field == 'tempo_s' and delta >= LIMIAR_REGRESSAO
+            cells.append(f"{delta:+8.1f}% {marca}")
+        print(f"{r['tabela']:<24}{r['linhas']:>9}" + ''.join(f"{c:>18}" for c in cells))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do csv_to_sql.py com CSVs sintéticos")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f"linhas por tabela, separadas por vírgula (padrão: {DEFAULT_SIZES})")
+    parser.add_argument('--tables', default='',
+                        help="só estas tabelas, ex: clientes,itens_os (padrão: todas)")
+    parser.add_argument('--seed', type=int, default=42, help="semente dos dados (padrão: 42)")
+    parser.add_argument('--repeat', type=int, default=1, metavar='N',
+                        help="repetições por medição, vale o menor tempo (padrão: 1)")
+    parser.add_argument('--rev', metavar='COMMIT', help="mede o csv_to_sql.py deste commit em vez da árvore atual")
+    parser.add_argument('--batch-size', type=int, default=0, metavar='N', help="repassado ao conversor")
+    parser.add_argument('--format', dest='fmt', default='sql', help="repassado ao conversor (sql, copy, tsv)")
+    parser.add_argument('--staging', action='store_true', help="repassado ao conversor")
+    parser.add_argument('--save', type=Path, metavar='ARQUIVO', help="salva os resultados em JSON")
+    parser.add_argument('--compare', type=Path, metavar='ARQUIVO', help="compara com resultados salvos por --save")
+    parser.add_argument('--medir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        print(json.dumps(measure(*json.loads(args.medir))))
+        return 0
+
+    options = {}
+    if args.batch_size:
+        options['batch_size'] = args.batch_size
+    if args.fmt != 'sql':
+        options['fmt'] = args.fmt
+    if args.staging:
+        options['staging'] = True
+    sizes = [parse_size(s) for s in args.sizes.split(',') if s.strip()]
+    wanted = {t.strip() for t in args.tables.split(',') if t.strip()}
+    tables = {csv_name: function for csv_name, function in TABLES.items()
+              if not wanted or csv_name[3:-4] in wanted}
+
+    report = {
+        'commit': revision_name(args.rev),
+        'gerado_em': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': sys.version.split()[0],
+        'opcoes': options,
+        'resultados': [],
+    }
+    print(f"\n⏱️  BENCHMARK csv_to_sql.py @ {report['commit']} {options or ''}")
+    print("=" * 72)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        converter = converter_at(args.rev, tmp) if args.rev else CONVERTER
+        for rows in sizes:
+            start = time.perf_counter()
+            folder = generate_dataset(rows, args.seed)
+            print(f"\n📁 {rows:,} linhas por tabela ({folder}, {time.perf_counter() - start:.1f} s)")
+            print(f"{'tabela':<24}{'tempo (s)':>11}{'linhas/s':>13}{'pico RSS (MB)':>15}{'saída (MB)':>12}")
+            for csv_name, function in tables.items():
+                result = {'linhas': rows, 'tabela': csv_name[3:-4]}
+                try:
+                    runs = [run_isolated(converter, function, folder / csv_name, options)
+                            for _ in range(max(args.repeat, 1))]
+                except RuntimeError as e:
+                    result['erro'] = str(e)
+                    print(f"{result['tabela']:<24}❌ {e}")
+                    report['resultados'].append(result)
+                    continue
+                result.update(min(runs, key=lambda r: r['tempo_s']))
+                result['pico_rss_mb'] = max(r['pico_rss_mb'] for r in runs)
+                report['resultados'].append(result)
+                print(f"{result['tabela']:<24}{result['tempo_s']:>11.2f}{rows / result['tempo_s']:>13,.0f}"
+                      f"{result['pico_rss_mb']:>15.1f}{result['bytes_saida'] / 1e6:>12.1f}")
+
+    if args.save:
+        args.save.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 Resultados salvos em {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        if compare(report, baseline):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
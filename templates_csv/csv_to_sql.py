@@ -11,12 +11,58 @@ COMO USAR:
 3. Scripts SQL serão gerados na pasta 'sql_gerado/'
 4. Execute os SQLs no Supabase na ordem numérica
 
+OPÇÕES:
+  --batch-size N   Agrupa N linhas por INSERT multi-linha, cada lote numa
+                   transação (bem mais rápido para arquivos grandes)
+  --format copy    Gera blocos COPY ... FROM STDIN (executar com psql -f)
+  --format tsv     Gera arquivos .tsv + script \\copy correspondente
+                   (executar com psql -f de dentro de 'sql_gerado/')
+  --staging        Carrega as linhas num staging temporário e resolve as FKs
+                   com JOINs, em vez de um subselect por linha
+  --resolve        Confere as referências entre os CSVs (CPF, placa, OS) e já
+                   grava veículo/nome/telefone do cliente como valores literais
+  --jobs N         Converte as tabelas, e blocos de arquivos grandes, em
+                   paralelo com N processos (saída idêntica à sequencial)
+  --incremental    Pula as tabelas cujo CSV não mudou desde a última carga
+                   confirmada (--confirm); clientes/veículos/OS alterados
+                   saem como upsert pela chave natural
+  --incremental-rows
+                   Como --incremental, e em clientes/veículos/OS grava só as
+                   linhas novas ou alteradas
+  --confirm        Confirma que os SQLs da última conversão incremental foram
+                   executados (até lá, ela não conta como base da próxima)
+  --validate       Confere CPF, placa, datas, valores, status e as referências
+                   entre os CSVs antes de gerar o SQL; as linhas inválidas vão
+                   para 'sql_gerado/rejeitados/' e ficam fora da conversão
+  --strict         Como --validate, mas para no primeiro arquivo com erro
+  --check          Confere se o SQL gerado para 'verificacao/entrada/' continua
+                   idêntico, byte a byte, ao de 'verificacao/esperado/'
+  --load [DSN]     Carrega direto no Postgres (DSN ou $DATABASE_URL), sem gerar
+                   arquivos: uma transação por tabela, na ordem das dependências
+                   e com as tabelas independentes em paralelo (--load-method
+                   copy|insert; precisa do psycopg: pip install "psycopg[binary,pool]")
+
 """
 
+import argparse
+import collections
+import contextlib
 import csv
+import functools
+import hashlib
+import io
+import itertools
+import json
+import operator
 import os
-from datetime import datetime
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import date, datetime
 from pathlib import Path
+from typing import Callable, NamedTuple, Optional, Tuple, Union
 
 # Diretório base
 BASE_DIR = Path(__file__).parent
@@ -25,428 +71,1788 @@ SQL_OUTPUT_DIR = BASE_DIR / "sql_gerado"
 # Criar diretório de saída
 SQL_OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Formatos de saída suportados
+OUTPUT_FORMATS = ('sql', 'copy', 'tsv')
+
+# Linhas por INSERT no staging quando --batch-size não é informado
+STAGING_BATCH_SIZE = 1000
+
+# Linhas por bloco enviado ao pool de processos (--jobs)
+CHUNK_ROWS = 10000
+
+# Conversão incremental: hashes dos CSVs e das linhas já carregadas no banco
+# (confirmadas com --confirm) e os da última conversão, ainda pendentes
+MANIFEST_FILE = SQL_OUTPUT_DIR / ".manifest.json"
+PENDING_MANIFEST_FILE = SQL_OUTPUT_DIR / ".manifest.pendente.json"
+ROW_STATE_DIR = SQL_OUTPUT_DIR / ".estado"
+PENDING_SUFFIX = ".pendente.json"
+
+# ========== MAPEAMENTO DAS TABELAS ==========
+
+class Lookup(NamedTuple):
+    """Valor buscado em outra tabela a partir de uma chave do CSV (FK ou campo desnormalizado)"""
+    key: str            # coluna do CSV que serve de chave (ex: cpf_cliente)
+    table: str          # tabela consultada (ex: public.profiles)
+    column: str         # coluna comparada com a chave (ex: cpf)
+    expr: str = 'id'    # o que é retornado (ex: id, full_name)
+    local: Optional[Callable] = None  # mesmo valor calculado a partir do registro do CSV (--resolve)
+
+class Column(NamedTuple):
+    """Coluna de destino no banco e de onde o valor dela vem no CSV"""
+    name: str
+    numeric: bool = False             # valor vai sem aspas no SQL
+    lookup: Optional[Lookup] = None   # valor da linha é a chave da busca
+    default: Optional[str] = None     # expressão SQL usada quando o valor vem vazio
+    source: Union[str, Tuple[str, ...], None] = None  # coluna(s) do CSV (padrão: lookup.key)
+    transform: Optional[Callable] = None  # valor(es) do CSV → valor bruto (ex: strip_cpf)
+    if_empty: Optional[str] = None    # valor usado quando o campo do CSV vem vazio (ex: '0')
+    missing: Optional[str] = None     # coluna opcional no CSV: valor usado quando ela não existe
+
+class TableSpec(NamedTuple):
+    """Como um CSV vira uma tabela do banco"""
+    prefix: str                       # ordem de execução (01, 02...)
+    nome: str                         # usado nos nomes dos arquivos gerados
+    titulo: str
+    descricao: str
+    table: str
+    columns: Tuple[Column, ...]
+    row_to_values: Callable           # linha do CSV → valores brutos, na ordem de columns (table_spec)
+    natural_key: Optional[str] = None # coluna única usada no modo incremental por linha
+    upsert: bool = False              # grava ON CONFLICT (natural_key) WHERE ... DO UPDATE
+
+PROFILE_BY_CPF = Lookup('cpf_cliente', 'public.profiles', 'cpf')
+VEHICLE_BY_PLATE = Lookup('placa_veiculo', 'public.vehicles', 'plate')
+OS_BY_NUMERO = Lookup('numero_os', 'public.ordens_servico', 'numero_os')
+
+# ========== CÓDIGO GERADO ==========
+#
+# A leitura das linhas (CSV → valores) e a escrita dos valores (INSERT,
+# staging e COPY) são geradas a partir das colunas da spec: uma função por
+# tabela e formato, compilada uma única vez, com uma expressão fixa por
+# coluna em vez de laços e testes a cada valor. Numéricos não passam pelo
+# escape. Uma tabela nova só precisa da spec (table_spec) em TABLES.
+
+# Expressões geradas equivalentes a escape_sql_string e escape_copy_value
+SQL_TEXT_EXPR = """("'" + {v}.replace("'", "''") + "'" if {v} else {fallback})"""
+COPY_TEXT_EXPR = r"""({v}.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r') if {v} else '\\N')"""
+
+def compile_function(name, args, lines, namespace=None):
+    """Compila o corpo gerado (lista de linhas) e devolve a função"""
+    source = f"def {name}({args}):\n" + ''.join(f"    {line}\n" for line in lines)
+    namespace = {'__name__': __name__, **(namespace or {})}
+    exec(compile(source, f"<{name}>", 'exec'), namespace)
+    return namespace[name]
+
+def source_expr(col, namespace):
+    """Expressão que lê o valor bruto da coluna no registro do CSV (row)"""
+    sources = col.source or col.lookup.key
+    if isinstance(sources, str):
+        sources = (sources,)
+    reads = []
+    for source in sources:
+        if col.missing is None:
+            read = f"row[{source!r}]"
+        else:
+            read = f"row.get({source!r}, {col.missing!r})"
+        if col.if_empty is not None:
+            read = f"({read} or {col.if_empty!r})"
+        reads.append(read)
+    if col.transform is None:
+        return reads[0]
+    name = next((n for n, f in namespace.items() if f is col.transform),
+                f"_{col.transform.__name__}_{len(namespace)}")
+    namespace[name] = col.transform
+    return f"{name}({', '.join(reads)})"
+
+def compile_row_reader(nome, columns):
+    """
+    Gera `<nome>_values(row)`: linha do CSV (dict) → valores brutos na ordem
+    das colunas. Uma expressão que se repete (ex: o CPF de duas buscas) é
+    calculada uma vez só.
+    """
+    namespace = {}
+    exprs = [source_expr(col, namespace) for col in columns]
+    repeated = [expr for expr, n in collections.Counter(exprs).items() if n > 1]
+    local = {expr: f"v{i}" for i, expr in enumerate(repeated)}
+    lines = [f"{name} = {expr}" for expr, name in local.items()]
+    lines.append(f"return [{', '.join(local.get(expr, expr) for expr in exprs)}]")
+    return compile_function(f"{nome}_values", 'row', lines, namespace)
+
+def table_spec(prefix, nome, titulo, descricao, table, columns, **options):
+    """
+    TableSpec com o row_to_values gerado a partir das colunas. A função fica
+    no módulo com o nome de sempre (ex: clientes_values), para a spec poder
+    ir para os processos do pool (--jobs) por pickle.
+    """
+    row_to_values = compile_row_reader(nome, columns)
+    globals()[row_to_values.__name__] = row_to_values
+    return TableSpec(prefix, nome, titulo, descricao, table, tuple(columns),
+                     row_to_values, **options)
+
+def compile_encoder(name, columns, positions, value_expr, result):
+    """Gera `name(values)` aplicando value_expr(col, variável) nos valores das posições dadas"""
+    names = [f"v{i}" for i in range(len(columns))]
+    exprs = ', '.join(value_expr(columns[i], names[i]) for i in positions)
+    return compile_function(name, 'values', [
+        f"{', '.join(names)}, = values",
+        f"return {result.format(exprs)}",
+    ])
+
+def sql_expr(col, v):
+    """Busca vira subselect; vazio vira o default da coluna (ou NULL); numérico vai sem aspas"""
+    if col.lookup:
+        lookup = col.lookup
+        prefix = f"(SELECT {lookup.expr} FROM {lookup.table} WHERE {lookup.column} = "
+        return f"{prefix!r} + {SQL_TEXT_EXPR.format(v=v, fallback=repr('NULL'))} + ' LIMIT 1)'"
+    fallback = repr(col.default or 'NULL')
+    if col.numeric:
+        return f"({v} or {fallback})"
+    return SQL_TEXT_EXPR.format(v=v, fallback=fallback)
+
+def staging_expr(col, v):
+    """Valor bruto no INSERT do staging: sem buscas nem defaults"""
+    if col.numeric:
+        return f"({v} or 'NULL')"
+    return SQL_TEXT_EXPR.format(v=v, fallback=repr('NULL'))
+
+def copy_expr(col, v):
+    """Mesmo resultado de escape_copy_value(v)"""
+    if col.numeric and not col.lookup:
+        return rf"({v} or '\\N')"
+    return COPY_TEXT_EXPR.format(v=v)
+
+def compile_sql_encoder(spec):
+    """valores → lista de expressões SQL, uma por coluna (INSERT direto)"""
+    return compile_encoder(f"{spec.nome}_sql", spec.columns, range(len(spec.columns)),
+                           sql_expr, "[{}]")
+
+def compile_staging_encoder(spec):
+    """valores → lista de literais SQL, um por coluna do staging"""
+    return compile_encoder(f"{spec.nome}_staging", spec.columns,
+                           [i for _, i in staging_fields(spec)], staging_expr, "[{}]")
+
+def compile_copy_encoder(spec):
+    """
+    valores → linha no formato texto do COPY (tabela de destino ou staging).
+    Os textos são conferidos juntos: sem \\, tab ou quebra de linha (quase
+    sempre), a linha sai numa única f-string, sem escape valor a valor.
+    """
+    if needs_staging(spec):
+        positions = [i for _, i in staging_fields(spec)]
+    else:
+        positions = range(len(spec.columns))
+    names = [f"v{i}" for i in range(len(spec.columns))]
+    texts = [names[i] for i in positions
+             if spec.columns[i].lookup or not spec.columns[i].numeric]
+    escaped = ', '.join(copy_expr(spec.columns[i], names[i]) for i in positions)
+    fast = r'\t'.join(f"{{{names[i]} or NULL}}" for i in positions)
+
+    lines = [f"{', '.join(names)}, = values"]
+    if texts:
+        lines += [
+            f"""probe = f"{''.join(f'{{{v}}}' for v in texts)}\"""",
+            r"if '\\' in probe or '\t' in probe or '\n' in probe or '\r' in probe:",
+            rf"    return '\t'.join([{escaped}]) + '\n'",
+        ]
+    lines.append(f'return f"{fast}\\n"')
+    return compile_function(f"{spec.nome}_copy", 'values', lines, {'NULL': '\\N'})
+
+# ========== ESCRITA ==========
+
 def escape_sql_string(value):
     """Escapa strings para SQL"""
     if value is None or value == '':
         return 'NULL'
     return f"'{str(value).replace(chr(39), chr(39)+chr(39))}'"
 
-def process_clientes(csv_file):
-    """Processa 01_clientes.csv"""
-    output_file = SQL_OUTPUT_DIR / "01_insert_clientes.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  01_clientes.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE CLIENTES",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        # Limpar CPF (remover pontos e traços)
-        cpf_limpo = row['cpf'].replace('.', '').replace('-', '')
-        
-        sql = f"""
-INSERT INTO public.profiles (
-    full_name, cpf, email, phone, birth_date,
-    address, zip_code, city, state,
-    loyalty_tier, loyalty_points, company_id,
-    notes
-) VALUES (
-    {escape_sql_string(row['nome_completo'])},
-    {escape_sql_string(cpf_limpo)},
-    {escape_sql_string(row['email'])},
-    {escape_sql_string(row['telefone'])},
-    {escape_sql_string(row['data_nascimento']) if row['data_nascimento'] else 'NULL'},
-    {escape_sql_string(row['endereco_completo'])},
-    {escape_sql_string(row['cep'].replace('-', ''))},
-    {escape_sql_string(row['cidade'])},
-    {escape_sql_string(row['estado'])},
-    {escape_sql_string(row['tier_fidelidade'])},
-    {row['pontos_fidelidade'] if row['pontos_fidelidade'] else '0'},
-    {row['empresa_id']},
-    {escape_sql_string(row.get('observacoes', ''))}
-);
-"""
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} clientes)")
-
-def process_veiculos(csv_file):
-    """Processa 02_veiculos.csv"""
-    output_file = SQL_OUTPUT_DIR / "02_insert_veiculos.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  02_veiculos.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE VEÍCULOS",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        cpf_limpo = row['cpf_cliente'].replace('.', '').replace('-', '')
-        
-        sql = f"""
-INSERT INTO public.vehicles (
-    plate, brand, model, year, color,
-    user_id, mileage, chassis, renavam,
-    notes
-) VALUES (
-    {escape_sql_string(row['placa'])},
-    {escape_sql_string(row['marca'])},
-    {escape_sql_string(row['modelo'])},
-    {row['ano']},
-    {escape_sql_string(row['cor'])},
-    (SELECT id FROM public.profiles WHERE cpf = {escape_sql_string(cpf_limpo)} LIMIT 1),
-    {row['quilometragem'] if row['quilometragem'] else 'NULL'},
-    {escape_sql_string(row.get('chassi', ''))},
-    {escape_sql_string(row.get('renavam', ''))},
-    {escape_sql_string(row.get('observacoes', ''))}
-);
-"""
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} veículos)")
-
-def process_ordens_servico(csv_file):
-    """Processa 03_ordens_servico.csv"""
-    output_file = SQL_OUTPUT_DIR / "03_insert_ordens_servico.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  03_ordens_servico.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE ORDENS DE SERVIÇO",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        cpf_limpo = row['cpf_cliente'].replace('.', '').replace('-', '')
-        
-        sql = f"""
-INSERT INTO public.ordens_servico (
-    numero_os, plate, vehicle, client_name, client_phone,
-    status, descricao_problema, diagnostico,
-    mechanic_id, data_entrada, data_orcamento,
-    valor_orcado, valor_aprovado,
-    empresa_id, prioridade, observacoes
-) VALUES (
-    {escape_sql_string(row['numero_os'])},
-    {escape_sql_string(row['placa_veiculo'])},
-    (SELECT CONCAT(brand, ' ', model) FROM public.vehicles WHERE plate = {escape_sql_string(row['placa_veiculo'])} LIMIT 1),
-    (SELECT full_name FROM public.profiles WHERE cpf = {escape_sql_string(cpf_limpo)} LIMIT 1),
-    (SELECT phone FROM public.profiles WHERE cpf = {escape_sql_string(cpf_limpo)} LIMIT 1),
-    {escape_sql_string(row['status'])},
-    {escape_sql_string(row['descricao_problema'])},
-    {escape_sql_string(row.get('diagnostico', ''))},
-    {escape_sql_string(row.get('mecanico_responsavel', ''))},
-    {escape_sql_string(row['data_entrada']) if row['data_entrada'] else 'NOW()'},
-    {escape_sql_string(row.get('data_prevista_conclusao', '')) if row.get('data_prevista_conclusao') else 'NULL'},
-    {row['valor_orcado'] if row['valor_orcado'] else '0'},
-    {row['valor_aprovado'] if row['valor_aprovado'] else 'NULL'},
-    {row['empresa_id']},
-    {escape_sql_string(row.get('prioridade', 'verde'))},
-    {escape_sql_string(row.get('observacoes', ''))}
-);
-"""
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} ordens de serviço)")
-
-def process_itens_os(csv_file):
-    """Processa 04_itens_os.csv"""
-    output_file = SQL_OUTPUT_DIR / "04_insert_itens_os.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  04_itens_os.csv está vazio!")
-        return
-    
-    sql_lines = [
+def escape_copy_value(value):
+    """Escapa um valor no formato texto do COPY (tab como separador, \\N para NULL)"""
+    if value is None or value == '':
+        return '\\N'
+    return (str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r'))
+
+def iter_rows(csv_file):
+    """Lê o CSV linha a linha (gerador), sem carregar o arquivo inteiro na memória"""
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+def format_header(titulo, gerado_em=None):
+    """Cabeçalho comentado dos arquivos gerados"""
+    gerado_em = gerado_em or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return '\n'.join([
         "-- =============================================",
-        "-- INSERÇÃO DE ITENS DE OS",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
+        f"-- {titulo}",
+        f"-- Gerado em: {gerado_em}",
         "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        valor_unit = float(row['valor_unitario']) if row['valor_unitario'] else 0
-        qtd = float(row['quantidade']) if row['quantidade'] else 1
-        valor_total = valor_unit * qtd
-        
-        sql = f"""
-INSERT INTO public.ordem_servico_items (
-    ordem_servico_id, tipo, descricao,
-    quantidade, valor_unitario, valor_total,
-    status, observacoes
+    ])
+
+def format_on_conflict(spec):
+    """
+    Cláusula de upsert pela chave natural (só no modo incremental). O WHERE
+    é o predicado dos índices únicos parciais da migration
+    20261018130000_csv_import_natural_keys_unique.sql.
+    """
+    if not spec.upsert:
+        return ''
+    key = spec.natural_key
+    updates = ',\n    '.join(f"{col.name} = EXCLUDED.{col.name}"
+                              for col in spec.columns if col.name != key)
+    return f"\nON CONFLICT ({key}) WHERE {key} <> '' DO UPDATE SET\n    {updates}"
+
+def format_insert(table, columns, values, on_conflict=''):
+    """Monta um INSERT de uma linha"""
+    cols = ', '.join(columns)
+    vals = ',\n    '.join(values)
+    return f"""
+INSERT INTO {table} (
+    {cols}
 ) VALUES (
-    (SELECT id FROM public.ordens_servico WHERE numero_os = {escape_sql_string(row['numero_os'])} LIMIT 1),
-    {escape_sql_string(row['tipo'])},
-    {escape_sql_string(row['descricao'])},
-    {qtd},
-    {valor_unit},
-    {valor_total},
-    {escape_sql_string(row.get('status', 'pendente'))},
-    {escape_sql_string(row.get('observacoes', ''))}
-);
+    {vals}
+){on_conflict};
 """
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} itens)")
-
-def process_agendamentos(csv_file):
-    """Processa 05_agendamentos.csv"""
-    output_file = SQL_OUTPUT_DIR / "05_insert_agendamentos.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  05_agendamentos.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE AGENDAMENTOS",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        cpf_limpo = row['cpf_cliente'].replace('.', '').replace('-', '')
-        datetime_agendamento = f"{row['data_agendamento']} {row['hora_agendamento']}:00"
-        
-        sql = f"""
-INSERT INTO public.appointments (
-    vehicle_id, user_id, company_id,
-    scheduled_date, service_type,
-    status, notes
-) VALUES (
-    (SELECT id FROM public.vehicles WHERE plate = {escape_sql_string(row['placa_veiculo'])} LIMIT 1),
-    (SELECT id FROM public.profiles WHERE cpf = {escape_sql_string(cpf_limpo)} LIMIT 1),
-    {row['empresa_id']},
-    {escape_sql_string(datetime_agendamento)},
-    {escape_sql_string(row['servico_solicitado'])},
-    {escape_sql_string(row.get('status', 'pendente'))},
-    {escape_sql_string(row.get('observacoes_cliente', ''))}
-);
+
+def format_values_insert(table, columns, values_rows, on_conflict=''):
+    """Monta um INSERT multi-linha (sem controle de transação)"""
+    cols = ', '.join(columns)
+    tuples = ',\n'.join(f"    ({', '.join(values)})" for values in values_rows)
+    return f"""INSERT INTO {table} (
+    {cols}
+) VALUES
+{tuples}{on_conflict};
 """
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} agendamentos)")
-
-def process_pecas_estoque(csv_file):
-    """Processa 06_pecas_estoque.csv"""
-    output_file = SQL_OUTPUT_DIR / "06_insert_pecas_estoque.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  06_pecas_estoque.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE PEÇAS (ESTOQUE)",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        sql = f"""
-INSERT INTO public.parts (
-    code, name, category_id,
-    manufacturer, cost_price, sale_price,
-    current_stock, minimum_stock,
-    location, company_id, notes
-) VALUES (
-    {escape_sql_string(row['codigo_peca'])},
-    {escape_sql_string(row['nome'])},
-    (SELECT id FROM public.parts_categories WHERE name = {escape_sql_string(row['categoria'])} LIMIT 1),
-    {escape_sql_string(row['fabricante'])},
-    {row['preco_custo'] if row['preco_custo'] else '0'},
-    {row['preco_venda'] if row['preco_venda'] else '0'},
-    {row['estoque_atual'] if row['estoque_atual'] else '0'},
-    {row['estoque_minimo'] if row['estoque_minimo'] else '0'},
-    {escape_sql_string(row.get('localizacao', ''))},
-    {row['empresa_id']},
-    {escape_sql_string(row.get('observacoes', ''))}
-);
+
+def format_batch_insert(table, columns, values_rows, on_conflict=''):
+    """Monta um INSERT multi-linha, numa transação própria"""
+    insert = format_values_insert(table, columns, values_rows, on_conflict)
+    return f"\nBEGIN;\n{insert}COMMIT;\n"
+
+def write_inserts(f, spec, values_rows, batch_size=0):
+    """Grava os INSERTs (um por linha ou em lotes); retorna o total de registros"""
+    columns = [col.name for col in spec.columns]
+    on_conflict = format_on_conflict(spec)
+    to_sql = compile_sql_encoder(spec)
+
+    total = 0
+    batch = []
+    for values in values_rows:
+        total += 1
+        if batch_size <= 1:
+            f.write('\n')
+            f.write(format_insert(spec.table, columns, to_sql(values), on_conflict))
+            continue
+        batch.append(to_sql(values))
+        if len(batch) == batch_size:
+            f.write('\n')
+            f.write(format_batch_insert(spec.table, columns, batch, on_conflict))
+            batch = []
+    if batch:
+        f.write('\n')
+        f.write(format_batch_insert(spec.table, columns, batch, on_conflict))
+    return total
+
+# ========== STAGING ==========
+#
+# Tabelas com buscas (FK por CPF, placa, numero_os...) ou defaults (NOW())
+# podem ser carregadas num staging temporário, com os valores brutos do CSV,
+# e movidas para a tabela de destino com um único INSERT ... SELECT. As
+# buscas viram LEFT JOINs contra a tabela referenciada (uma por chave), ou
+# seja, alguns hash joins no lugar de um subselect por linha.
+
+def needs_staging(spec):
+    """Só vale a pena (e só é necessário no COPY) quando há buscas, defaults ou upsert"""
+    return spec.upsert or any(col.lookup or col.default for col in spec.columns)
+
+def staging_fields(spec):
+    """Colunas do staging: literais da tabela + chaves de busca (sem repetir), com o índice do valor"""
+    fields = []
+    seen = set()
+    for i, col in enumerate(spec.columns):
+        name = col.lookup.key if col.lookup else col.name
+        if name not in seen:
+            seen.add(name)
+            fields.append((name, i))
+    return fields
+
+def staging_joins(spec):
+    """
+    Agrupa as buscas por (tabela, coluna, chave): cada grupo vira um único
+    LEFT JOIN. Retorna {(table, column, key): (alias, {expr: apelido})}.
+    """
+    joins = {}
+    for col in spec.columns:
+        if col.lookup is None:
+            continue
+        lookup = col.lookup
+        source = (lookup.table, lookup.column, lookup.key)
+        if source not in joins:
+            joins[source] = (f"j{len(joins) + 1}", {})
+        exprs = joins[source][1]
+        if lookup.expr not in exprs:
+            exprs[lookup.expr] = f"v{len(exprs) + 1}"
+    return joins
+
+def copy_target(spec):
+    """Tabela e colunas que recebem o COPY"""
+    if not needs_staging(spec):
+        return spec.table, [col.name for col in spec.columns]
+    return f"_stg_{spec.nome}", [name for name, _ in staging_fields(spec)]
+
+def write_copy_rows(f, spec, values_rows):
+    """Grava as linhas no formato texto do COPY; retorna o total de registros"""
+    to_copy = compile_copy_encoder(spec)
+    total = 0
+    for values in values_rows:
+        f.write(to_copy(values))
+        total += 1
+    return total
+
+def write_staging_inserts(f, spec, values_rows, batch_size):
+    """Carrega os valores brutos no staging com INSERTs multi-linha; retorna o total"""
+    target = f"_stg_{spec.nome}"
+    columns = [name for name, _ in staging_fields(spec)]
+    to_sql = compile_staging_encoder(spec)
+
+    total = 0
+    batch = []
+    for values in values_rows:
+        total += 1
+        batch.append(to_sql(values))
+        if len(batch) == batch_size:
+            f.write(format_values_insert(target, columns, batch))
+            batch = []
+    if batch:
+        f.write(format_values_insert(target, columns, batch))
+    return total
+
+def format_staging_prologue(spec):
+    """Abre a transação e, se preciso, cria o staging com os tipos da tabela de destino"""
+    if not needs_staging(spec):
+        return "\nBEGIN;\n"
+    return "\nBEGIN;\n" + format_staging_create(spec)
+
+def format_staging_create(spec):
+    """CREATE do staging temporário, com os tipos da tabela de destino (some no COMMIT)"""
+    select = []
+    for col in spec.columns:
+        if col.lookup is None:
+            select.append(f"t.{col.name}")
+    for name, i in staging_fields(spec):
+        if spec.columns[i].lookup:
+            select.append(f"NULL::text AS {name}")
+    select = ',\n    '.join(select)
+    return f"""CREATE TEMP TABLE _stg_{spec.nome} ON COMMIT DROP AS
+SELECT
+    {select}
+FROM {spec.table} t WITH NO DATA;
 """
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} peças)")
-
-def process_patio_kanban(csv_file):
-    """Processa 07_patio_kanban.csv"""
-    output_file = SQL_OUTPUT_DIR / "07_insert_patio_kanban.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  07_patio_kanban.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE MOVIMENTOS DO PÁTIO",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        sql = f"""
-INSERT INTO public.patio_movements (
-    ordem_servico_id, vehicle_plate,
-    stage_id, moved_at,
-    responsible, notes
-) VALUES (
-    (SELECT id FROM public.ordens_servico WHERE numero_os = {escape_sql_string(row['numero_os'])} LIMIT 1),
-    {escape_sql_string(row['placa_veiculo'])},
-    (SELECT id FROM public.patio_stages WHERE name = {escape_sql_string(row['estagio_atual'])} LIMIT 1),
-    {escape_sql_string(row['data_entrada_patio']) if row['data_entrada_patio'] else 'NOW()'},
-    {escape_sql_string(row.get('mecanico_responsavel', ''))},
-    {escape_sql_string(row.get('observacoes_patio', ''))}
-);
+
+def format_staging_epilogue(spec):
+    """Move o staging para a tabela de destino, resolvendo as buscas com JOINs, e fecha a transação"""
+    if not needs_staging(spec):
+        return "COMMIT;\n"
+    return format_staging_insert(spec) + "COMMIT;\n"
+
+def format_staging_insert(spec):
+    """INSERT ... SELECT do staging para a tabela de destino, com as buscas como JOINs"""
+    joins = staging_joins(spec)
+    select = []
+    for col in spec.columns:
+        if col.lookup:
+            lookup = col.lookup
+            alias, exprs = joins[(lookup.table, lookup.column, lookup.key)]
+            select.append(f"{alias}.{exprs[lookup.expr]}")
+        elif col.default:
+            select.append(f"COALESCE(s.{col.name}, {col.default})")
+        else:
+            select.append(f"s.{col.name}")
+
+    # DISTINCT ON mantém a semântica do antigo "LIMIT 1" quando a chave se repete
+    join_sql = []
+    for (table, column, key), (alias, exprs) in joins.items():
+        values = ', '.join(f"{expr} AS {name}" for expr, name in exprs.items())
+        join_sql.append(f"""LEFT JOIN (
+    SELECT DISTINCT ON ({column}) {column}, {values}
+    FROM {table}
+    WHERE {column} IN (SELECT {key} FROM _stg_{spec.nome})
+) {alias} ON {alias}.{column} = s.{key}""")
+
+    cols = ', '.join(col.name for col in spec.columns)
+    select = ',\n    '.join(select)
+    join_sql = ''.join(f"\n{join}" for join in join_sql)
+    return f"""INSERT INTO {spec.table} (
+    {cols}
+)
+SELECT
+    {select}
+FROM _stg_{spec.nome} s{join_sql}{format_on_conflict(spec)};
 """
-        sql_lines.append(sql)
-    
+
+def effective_batch_size(spec, fmt, staging, batch_size):
+    """Quantas linhas cada instrução agrupa no formato escolhido"""
+    if fmt != 'sql':
+        return 1
+    if staging and needs_staging(spec):
+        return batch_size if batch_size > 1 else STAGING_BATCH_SIZE
+    return max(batch_size, 1)
+
+def write_body(f, spec, values_rows, fmt='sql', staging=False, batch_size=0):
+    """Grava as linhas no formato escolhido; retorna o total de registros"""
+    if fmt != 'sql':
+        return write_copy_rows(f, spec, values_rows)
+    if staging and needs_staging(spec):
+        return write_staging_inserts(
+            f, spec, values_rows, effective_batch_size(spec, fmt, staging, batch_size)
+        )
+    return write_inserts(f, spec, values_rows, batch_size)
+
+# ========== PARALELISMO (--jobs) ==========
+#
+# As tabelas são convertidas em paralelo (uma thread por arquivo) e, dentro
+# de cada arquivo, blocos de CHUNK_ROWS linhas vão para um pool de processos
+# compartilhado. Os blocos voltam na ordem em que foram lidos e começam
+# sempre numa fronteira de lote, então a saída é byte a byte igual à da
+# execução sequencial.
+
+_WORKER_INDEX = None
+
+def init_worker(index):
+    """Inicializa o processo do pool com o índice local (--resolve), enviado uma única vez"""
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+def iter_raw_chunks(csv_file, rows_per_chunk):
+    """
+    Divide o CSV em blocos de registros completos sem parsear os campos.
+
+    Um registro termina numa quebra de linha fora de aspas, ou seja, quando o
+    total de aspas lidas até ali é par. Linhas em branco não contam (o
+    DictReader as ignora). Gera (cabeçalho, texto do bloco).
+    """
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        fieldnames = next(csv.reader(f), None)
+        if fieldnames is None:
+            return
+        chunk = []
+        rows = 0
+        quotes = 0
+        for line in f:
+            chunk.append(line)
+            quotes += line.count('"')
+            if quotes % 2 or line in ('\n', '\r\n', '\r'):
+                continue
+            rows += 1
+            if rows == rows_per_chunk:
+                yield fieldnames, ''.join(chunk)
+                chunk = []
+                rows = 0
+        if rows:
+            yield fieldnames, ''.join(chunk)
+
+def encode_chunk(spec, resolved, fieldnames, text, fmt, staging, batch_size):
+    """Converte um bloco do CSV dentro do pool; retorna (texto gerado, total de registros)"""
+    if resolved:
+        spec = apply_resolution(spec, _WORKER_INDEX, resolved)
+    rows = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)
+    out = io.StringIO()
+    total = write_body(out, spec, map(spec.row_to_values, rows), fmt, staging, batch_size)
+    return out.getvalue(), total
+
+def write_body_parallel(f, pool, jobs, spec, resolved, chunks, fmt, staging, batch_size):
+    """Como write_body, mas convertendo os blocos no pool (no máximo 2 por processo em voo)"""
+    pending = collections.deque()
+    total = 0
+    for fieldnames, text in chunks:
+        pending.append(pool.submit(
+            encode_chunk, spec, resolved, fieldnames, text, fmt, staging, batch_size
+        ))
+        if len(pending) >= jobs * 2:
+            text, count = pending.popleft().result()
+            f.write(text)
+            total += count
+    while pending:
+        text, count = pending.popleft().result()
+        f.write(text)
+        total += count
+    return total
+
+# ========== CONVERSÃO INCREMENTAL ==========
+#
+# --incremental: o manifesto guarda o hash de cada CSV convertido e o de tudo
+# que influencia a saída (conversor, opções e, com --resolve, os CSVs do
+# índice). Tabela cujo CSV não mudou desde a última carga confirmada é pulada
+# e a saída dela vira um script vazio (rodar a pasta inteira não repete nada).
+# As tabelas com chave natural que mudaram são gravadas inteiras, como upsert
+# pela chave: as linhas já carregadas são atualizadas, não duplicadas.
+# --incremental-rows: nessas tabelas, guarda também o hash de cada linha e só
+# grava as novas ou alteradas.
+#
+# A conversão só grava o estado pendente (.manifest.pendente.json e
+# .estado/*.pendente.json); ele vira a base da próxima conversão quando o
+# usuário confirma, com --confirm, que executou os SQLs. Sem confirmação, a
+# próxima conversão gera de novo as mesmas linhas.
+
+def file_sha256(path):
+    """Hash SHA-256 do arquivo, lido em blocos"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def write_json(path, data):
+    """Grava o JSON num temporário e troca de uma vez (não deixa arquivo pela metade)"""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+def run_config(options, resolve):
+    """Hash de tudo, além do próprio CSV, que muda a saída de uma tabela"""
+    config = {
+        'conversor': file_sha256(__file__),
+        'opcoes': {name: options[name] for name in ('batch_size', 'fmt', 'staging')},
+        'linhas': options['incremental_rows'],
+    }
+    if resolve:
+        config['indice'] = {
+            csv_name: file_sha256(BASE_DIR / csv_name)
+            for csv_name, *_ in INDEX_SOURCES.values() if (BASE_DIR / csv_name).exists()
+        }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+def load_manifest(config):
+    """
+    Lê o manifesto confirmado; se a configuração mudou, todas as tabelas são
+    refeitas. As tabelas convertidas agora vão em 'pendentes'.
+    """
+    manifest = {'config': config, 'tabelas': {}}
+    if MANIFEST_FILE.exists():
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            confirmed = json.load(f)
+        if confirmed.get('config') == config:
+            manifest = confirmed
+    manifest['pendentes'] = {}
+    return manifest
+
+def pending_files():
+    files = list(ROW_STATE_DIR.glob(f"*{PENDING_SUFFIX}")) if ROW_STATE_DIR.exists() else []
+    if PENDING_MANIFEST_FILE.exists():
+        files.append(PENDING_MANIFEST_FILE)
+    return files
+
+def discard_pending():
+    """Descarta o estado de uma conversão anterior que não foi confirmada"""
+    for path in pending_files():
+        path.unlink()
+
+def save_pending(manifest):
+    """Manifesto pendente: as tabelas confirmadas mais as convertidas agora"""
+    tabelas = dict(manifest['tabelas'], **manifest['pendentes'])
+    write_json(PENDING_MANIFEST_FILE, {'config': manifest['config'], 'tabelas': tabelas})
+
+def confirm_pending():
+    """--confirm: o estado da última conversão vira a base da próxima; retorna quantos arquivos"""
+    if not PENDING_MANIFEST_FILE.exists():
+        return 0
+    files = pending_files()
+    for path in files:
+        if path != PENDING_MANIFEST_FILE:
+            os.replace(path, path.with_name(path.name[:-len(PENDING_SUFFIX)] + '.json'))
+    os.replace(PENDING_MANIFEST_FILE, MANIFEST_FILE)
+    return len(files)
+
+def row_state_file(spec, pending=False):
+    return ROW_STATE_DIR / f"{spec.prefix}_{spec.nome}{PENDING_SUFFIX if pending else '.json'}"
+
+def load_row_state(spec):
+    """{chave natural: hash da linha} da última carga confirmada da tabela"""
+    path = row_state_file(spec)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def row_hash(values):
+    return hashlib.blake2b(json.dumps(values, ensure_ascii=False).encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+def changed_rows(name, spec, values_rows, previous, current):
+    """
+    Filtra as linhas novas ou alteradas em relação ao estado anterior
+    (previous=None: todas, só sem as chaves repetidas).
+
+    Preenche `current` com o hash de cada chave. Se a chave se repete no CSV,
+    vale a primeira ocorrência (um upsert não pode tocar a mesma linha duas
+    vezes no mesmo comando).
+    """
+    key_pos = [col.name for col in spec.columns].index(spec.natural_key)
+    lidas = emitidas = 0
+    repetidas = []
+    for values in values_rows:
+        lidas += 1
+        key = values[key_pos]
+        if key in current:
+            repetidas.append(key or '(vazio)')
+            continue
+        current[key] = row_hash(values)
+        if previous is None or previous.get(key) != current[key]:
+            emitidas += 1
+            yield values
+    if repetidas:
+        print(f"⚠️  {name}: {len(repetidas)} {spec.natural_key} repetido(s), mantida a "
+              f"primeira ocorrência — {', '.join(repetidas[:MAX_EXEMPLOS])}")
+    if previous is not None:
+        print(f"🔁 {name}: {emitidas} de {lidas} linhas novas ou alteradas")
+
+def convert_table(csv_file, spec, batch_size=0, fmt='sql', staging=False, index=None,
+                  gerado_em=None, pool=None, jobs=1, manifest=None, incremental_rows=False,
+                  output_dir=SQL_OUTPUT_DIR):
+    """
+    Pipeline leitor → transformação → gravação, com memória constante por tabela.
+
+    Cada linha do CSV é convertida e gravada direto no arquivo; o total de
+    registros vai num trailer no fim, então nada precisa ficar em buffer.
+    Com batch_size > 1, as linhas são agrupadas em INSERTs multi-linha de até
+    batch_size tuplas, cada um na sua própria transação. Os formatos 'copy' e
+    'tsv' usam COPY no lugar de INSERT; eles e a opção staging passam pelo
+    staging temporário quando a tabela tem buscas (ver format_staging_epilogue).
+    Com um índice local (build_index), as buscas desnormalizadas viram valores
+    literais antes da gravação (ver check_references). Com um pool, a
+    conversão das linhas é feita em blocos nos processos do pool.
+    Com um manifesto (load_manifest), pula a tabela se o CSV não mudou desde
+    a última carga confirmada e grava as tabelas com chave natural como
+    upsert; com incremental_rows, só as linhas novas ou alteradas delas (ver
+    changed_rows).
+    """
+    name = Path(csv_file).name
+    if fmt == 'sql':
+        output_file = output_dir / f"{spec.prefix}_insert_{spec.nome}.sql"
+    else:
+        output_file = output_dir / f"{spec.prefix}_copy_{spec.nome}.sql"
+    data_file = output_dir / f"{spec.prefix}_{spec.nome}.tsv"
+
+    if manifest is not None:
+        csv_hash = file_sha256(csv_file)
+        if manifest['tabelas'].get(spec.nome) == csv_hash:
+            # a saída anterior já foi carregada: não pode ficar na pasta para rodar de novo
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(format_header(spec.titulo, gerado_em))
+                f.write("\n-- Sem alterações desde a última carga confirmada: nada a executar\n")
+                f.write("\n-- Total de registros: 0\n")
+            if data_file.exists():
+                data_file.unlink()
+            print(f"⏭️  {name} sem alterações desde a última carga confirmada")
+            return None
+
+    row_state = None
+    if manifest is not None and spec.natural_key:
+        # a tabela pode já estar no banco: upsert pela chave, cada chave uma vez
+        # só; o filtro depende da ordem do arquivo: conversão sequencial
+        spec = spec._replace(upsert=True)
+        pool = None
+        row_state = (load_row_state(spec) if incremental_rows else None, {})
+    elif manifest is not None and spec.nome in manifest['tabelas']:
+        print(f"⚠️  {name} mudou desde a última carga e não tem chave natural: todas as "
+              f"linhas vão ser inseridas de novo (apague as já carregadas antes de executar)")
+
+    if pool is None:
+        rows = iter_rows(csv_file)
+        first = next(rows, None)
+        if first is not None:
+            rows = itertools.chain([first], rows)
+    else:
+        step = effective_batch_size(spec, fmt, staging, batch_size)
+        chunks = iter_raw_chunks(csv_file, -(-CHUNK_ROWS // step) * step)
+        first = next(chunks, None)
+        if first is not None:
+            chunks = itertools.chain([first], chunks)
+    if first is None:
+        print(f"⚠️  {name} está vazio!")
+        return 0
+
+    resolved = []
+    if index is not None:
+        resolved = check_references(csv_file, spec, index)
+    resolved_spec = apply_resolution(spec, index, resolved)
+
+    def body(out):
+        if pool is not None:
+            # os processos recebem a spec original e refazem a resolução com o próprio índice
+            return write_body_parallel(out, pool, jobs, spec, resolved, chunks,
+                                       fmt, staging, batch_size)
+        values_rows = map(resolved_spec.row_to_values, rows)
+        if row_state is not None:
+            values_rows = changed_rows(name, resolved_spec, values_rows, *row_state)
+        return write_body(out, resolved_spec, values_rows, fmt, staging, batch_size)
+
+    wrap = fmt != 'sql' or (staging and needs_staging(resolved_spec))
+
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} movimentos)")
-
-def process_pagamentos(csv_file):
-    """Processa 08_pagamentos.csv"""
-    output_file = SQL_OUTPUT_DIR / "08_insert_pagamentos.sql"
-    
-    with open(csv_file, 'r', encoding='utf-8') as f:
+        f.write(format_header(spec.titulo, gerado_em))
+        if wrap:
+            f.write(format_staging_prologue(resolved_spec))
+        if fmt != 'sql':
+            target, columns = copy_target(resolved_spec)
+            columns = ', '.join(columns)
+        if fmt == 'copy':
+            f.write(f"COPY {target} ({columns}) FROM STDIN;\n")
+            total = body(f)
+            f.write("\\.\n")
+        elif fmt == 'tsv':
+            with open(data_file, 'w', encoding='utf-8', newline='\n') as data:
+                total = body(data)
+            f.write(f"\\copy {target} ({columns}) FROM '{data_file.name}'\n")
+        else:
+            total = body(f)
+        if wrap:
+            f.write(format_staging_epilogue(resolved_spec))
+        f.write(f"\n-- Total de registros: {total}\n")
+
+    if row_state is not None and incremental_rows:
+        ROW_STATE_DIR.mkdir(exist_ok=True)
+        write_json(row_state_file(spec, pending=True), row_state[1])
+    if manifest is not None:
+        manifest['pendentes'][spec.nome] = csv_hash
+
+    print(f"✅ Gerado: {output_file} ({total} {spec.descricao})")
+    return total
+
+# ========== TABELAS ==========
+
+def strip_cpf(cpf):
+    """Limpa o CPF (remove pontos e traços)"""
+    return cpf.replace('.', '').replace('-', '')
+
+def strip_cep(cep):
+    return cep.replace('-', '')
+
+def item_quantidade(quantidade):
+    return str(float(quantidade) if quantidade else 1)
+
+def item_valor_unitario(valor_unitario):
+    return str(float(valor_unitario) if valor_unitario else 0)
+
+def item_valor_total(valor_unitario, quantidade):
+    """valor_unitario × quantidade (1 quando a quantidade vem vazia)"""
+    return str((float(valor_unitario) if valor_unitario else 0)
+               * (float(quantidade) if quantidade else 1))
+
+def data_hora(data, hora):
+    """data_agendamento + hora_agendamento → timestamp"""
+    return f"{data} {hora}:00"
+
+def vehicle_label(record):
+    """Equivalente local de CONCAT(brand, ' ', model)"""
+    return f"{record['brand'] or ''} {record['model'] or ''}"
+
+CLIENTES = table_spec(
+    '01', 'clientes', "INSERÇÃO DE CLIENTES", "clientes", "public.profiles",
+    [
+        Column('full_name', source='nome_completo'),
+        Column('cpf', source='cpf', transform=strip_cpf),
+        Column('email', source='email'),
+        Column('phone', source='telefone'),
+        Column('birth_date', source='data_nascimento'),
+        Column('address', source='endereco_completo'),
+        Column('zip_code', source='cep', transform=strip_cep),
+        Column('city', source='cidade'),
+        Column('state', source='estado'),
+        Column('loyalty_tier', source='tier_fidelidade'),
+        Column('loyalty_points', numeric=True, source='pontos_fidelidade', if_empty='0'),
+        Column('company_id', numeric=True, source='empresa_id'),
+        Column('notes', source='observacoes', missing=''),
+    ],
+    natural_key='cpf',
+)
+
+VEICULOS = table_spec(
+    '02', 'veiculos', "INSERÇÃO DE VEÍCULOS", "veículos", "public.vehicles",
+    [
+        Column('plate', source='placa'),
+        Column('brand', source='marca'),
+        Column('model', source='modelo'),
+        Column('year', numeric=True, source='ano'),
+        Column('color', source='cor'),
+        Column('user_id', lookup=PROFILE_BY_CPF, transform=strip_cpf),
+        Column('mileage', numeric=True, source='quilometragem'),
+        Column('chassis', source='chassi', missing=''),
+        Column('renavam', source='renavam', missing=''),
+        Column('notes', source='observacoes', missing=''),
+    ],
+    natural_key='plate',
+)
+
+ORDENS_SERVICO = table_spec(
+    '03', 'ordens_servico', "INSERÇÃO DE ORDENS DE SERVIÇO", "ordens de serviço",
+    "public.ordens_servico",
+    [
+        Column('numero_os', source='numero_os'),
+        Column('plate', source='placa_veiculo'),
+        Column('vehicle', lookup=VEHICLE_BY_PLATE._replace(
+            expr="CONCAT(brand, ' ', model)", local=vehicle_label)),
+        Column('client_name', lookup=PROFILE_BY_CPF._replace(
+            expr='full_name', local=operator.itemgetter('full_name')), transform=strip_cpf),
+        Column('client_phone', lookup=PROFILE_BY_CPF._replace(
+            expr='phone', local=operator.itemgetter('phone')), transform=strip_cpf),
+        Column('status', source='status'),
+        Column('descricao_problema', source='descricao_problema'),
+        Column('diagnostico', source='diagnostico', missing=''),
+        Column('mechanic_id', source='mecanico_responsavel', missing=''),
+        Column('data_entrada', default='NOW()', source='data_entrada'),
+        Column('data_orcamento', source='data_prevista_conclusao', missing=''),
+        Column('valor_orcado', numeric=True, source='valor_orcado', if_empty='0'),
+        Column('valor_aprovado', numeric=True, source='valor_aprovado'),
+        Column('empresa_id', numeric=True, source='empresa_id'),
+        Column('prioridade', source='prioridade', missing='verde'),
+        Column('observacoes', source='observacoes', missing=''),
+    ],
+    natural_key='numero_os',
+)
+
+ITENS_OS = table_spec(
+    '04', 'itens_os', "INSERÇÃO DE ITENS DE OS", "itens", "public.ordem_servico_items",
+    [
+        Column('ordem_servico_id', lookup=OS_BY_NUMERO),
+        Column('tipo', source='tipo'),
+        Column('descricao', source='descricao'),
+        Column('quantidade', numeric=True, source='quantidade', transform=item_quantidade),
+        Column('valor_unitario', numeric=True, source='valor_unitario',
+               transform=item_valor_unitario),
+        Column('valor_total', numeric=True, source=('valor_unitario', 'quantidade'),
+               transform=item_valor_total),
+        Column('status', source='status', missing='pendente'),
+        Column('observacoes', source='observacoes', missing=''),
+    ],
+)
+
+AGENDAMENTOS = table_spec(
+    '05', 'agendamentos', "INSERÇÃO DE AGENDAMENTOS", "agendamentos", "public.appointments",
+    [
+        Column('vehicle_id', lookup=VEHICLE_BY_PLATE),
+        Column('user_id', lookup=PROFILE_BY_CPF, transform=strip_cpf),
+        Column('company_id', numeric=True, source='empresa_id'),
+        Column('scheduled_date', source=('data_agendamento', 'hora_agendamento'),
+               transform=data_hora),
+        Column('service_type', source='servico_solicitado'),
+        Column('status', source='status', missing='pendente'),
+        Column('notes', source='observacoes_cliente', missing=''),
+    ],
+)
+
+PECAS_ESTOQUE = table_spec(
+    '06', 'pecas_estoque', "INSERÇÃO DE PEÇAS (ESTOQUE)", "peças", "public.parts",
+    [
+        Column('code', source='codigo_peca'),
+        Column('name', source='nome'),
+        Column('category_id', lookup=Lookup('categoria', 'public.parts_categories', 'name')),
+        Column('manufacturer', source='fabricante'),
+        Column('cost_price', numeric=True, source='preco_custo', if_empty='0'),
+        Column('sale_price', numeric=True, source='preco_venda', if_empty='0'),
+        Column('current_stock', numeric=True, source='estoque_atual', if_empty='0'),
+        Column('minimum_stock', numeric=True, source='estoque_minimo', if_empty='0'),
+        Column('location', source='localizacao', missing=''),
+        Column('company_id', numeric=True, source='empresa_id'),
+        Column('notes', source='observacoes', missing=''),
+    ],
+)
+
+PATIO_KANBAN = table_spec(
+    '07', 'patio_kanban', "INSERÇÃO DE MOVIMENTOS DO PÁTIO", "movimentos",
+    "public.patio_movements",
+    [
+        Column('ordem_servico_id', lookup=OS_BY_NUMERO),
+        Column('vehicle_plate', source='placa_veiculo'),
+        Column('stage_id', lookup=Lookup('estagio_atual', 'public.patio_stages', 'name')),
+        Column('moved_at', default='NOW()', source='data_entrada_patio'),
+        Column('responsible', source='mecanico_responsavel', missing=''),
+        Column('notes', source='observacoes_patio', missing=''),
+    ],
+)
+
+PAGAMENTOS = table_spec(
+    '08', 'pagamentos', "INSERÇÃO DE PAGAMENTOS", "pagamentos", "public.payments",
+    [
+        Column('ordem_servico_id', lookup=OS_BY_NUMERO),
+        Column('client_id', lookup=PROFILE_BY_CPF, transform=strip_cpf),
+        Column('payment_method_id',
+               lookup=Lookup('forma_pagamento', 'public.payment_methods', 'name')),
+        Column('payment_date', default='NOW()', source='data_pagamento'),
+        Column('amount', numeric=True, source='valor_total', if_empty='0'),
+        Column('amount_paid', numeric=True, source='valor_pago', if_empty='0'),
+        Column('status', source='status_pagamento', missing='pendente'),
+        Column('installments', numeric=True, source='numero_parcelas', if_empty='1'),
+        Column('notes', source='observacoes', missing=''),
+    ],
+)
+
+# Ordem de execução (01, 02...); o CSV de cada tabela é <prefix>_<nome>.csv
+TABLES = (CLIENTES, VEICULOS, ORDENS_SERVICO, ITENS_OS, AGENDAMENTOS, PECAS_ESTOQUE,
+          PATIO_KANBAN, PAGAMENTOS)
+
+TABLE_SPECS = {f"{spec.prefix}_{spec.nome}.csv": spec for spec in TABLES}
+
+def table_processor(spec):
+    """process_<nome>(csv_file, **options): converte o CSV da tabela (ver convert_table)"""
+    def process(csv_file, **options):
+        return convert_table(csv_file, spec, **options)
+    process.__name__ = process.__qualname__ = f"process_{spec.nome}"
+    process.__doc__ = f"Processa {spec.prefix}_{spec.nome}.csv"
+    return process
+
+# process_clientes, process_veiculos... um por tabela
+PROCESSORS = {csv_file: table_processor(spec) for csv_file, spec in TABLE_SPECS.items()}
+globals().update((process.__name__, process) for process in PROCESSORS.values())
+
+# ========== RESOLUÇÃO LOCAL ==========
+#
+# Quando clientes, veículos e OS são convertidos na mesma rodada, o script já
+# tem em mãos todo CPF, placa e numero_os. Com --resolve, um índice em memória
+# (só com as chaves e os campos usados nas buscas) permite:
+#   - trocar as buscas desnormalizadas (vehicle, client_name, client_phone)
+#     por valores literais, sem CONCAT/subselect no banco;
+#   - apontar referências que não existem nos CSVs antes de rodar qualquer SQL.
+
+# tabela → (CSV de origem, spec, coluna-chave, campos guardados no índice)
+INDEX_SOURCES = {
+    'public.profiles': ('01_clientes.csv', CLIENTES, 'cpf', ('full_name', 'phone')),
+    'public.vehicles': ('02_veiculos.csv', VEICULOS, 'plate', ('brand', 'model')),
+    'public.ordens_servico': ('03_ordens_servico.csv', ORDENS_SERVICO, 'numero_os', ()),
+}
+
+# Quantos exemplos de referência quebrada mostrar por coluna
+MAX_EXEMPLOS = 5
+
+class ResolvedValues:
+    """row_to_values com as chaves das buscas locais trocadas pelo valor resolvido"""
+
+    def __init__(self, row_to_values, resolved):
+        self.row_to_values = row_to_values
+        self.resolved = resolved    # [(índice do valor, registros da tabela, Lookup.local)]
+
+    def __call__(self, row):
+        values = self.row_to_values(row)
+        for i, records, local in self.resolved:
+            values[i] = local(records[values[i]])
+        return values
+
+def build_index(base_dir=BASE_DIR, csv_paths=None):
+    """
+    Monta {tabela: {chave: {campo: valor}}} a partir dos CSVs de origem presentes.
+    Com --validate, `csv_paths` são os arquivos validados (validate_all): o
+    índice não resolve referências para linhas que a validação rejeitou.
+    """
+    index = {}
+    for table, (csv_name, spec, key, fields) in INDEX_SOURCES.items():
+        csv_path = Path(csv_paths[csv_name]) if csv_paths and csv_name in csv_paths else Path(base_dir) / csv_name
+        if not csv_path.exists():
+            continue
+        names = [col.name for col in spec.columns]
+        key_pos = names.index(key)
+        positions = [(field, names.index(field)) for field in fields]
+        records = {}
+        for row in iter_rows(csv_path):
+            values = spec.row_to_values(row)
+            records[values[key_pos]] = {field: values[i] for field, i in positions}
+        index[table] = records
+    return index
+
+def check_references(csv_file, spec, index):
+    """
+    Confere as referências do CSV contra o índice e imprime as quebradas.
+
+    Retorna os índices das colunas com Lookup.local cujas chaves foram todas
+    encontradas: essas viram literais (apply_resolution). Se alguma chave
+    faltar, a coluna continua sendo resolvida no banco.
+    """
+    checks = [(i, col) for i, col in enumerate(spec.columns)
+              if col.lookup and col.lookup.table in index]
+    externos = {col.lookup.key: (col.lookup, set()) for col in spec.columns
+                if col.lookup and col.lookup.table not in index}
+    missing = {i: [] for i, _ in checks}
+    counts = dict.fromkeys(missing, 0)
+
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
         reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    if not rows:
-        print("⚠️  08_pagamentos.csv está vazio!")
-        return
-    
-    sql_lines = [
-        "-- =============================================",
-        "-- INSERÇÃO DE PAGAMENTOS",
-        f"-- Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"-- Total de registros: {len(rows)}",
-        "-- =============================================\n"
-    ]
-    
-    for row in rows:
-        cpf_limpo = row['cpf_cliente'].replace('.', '').replace('-', '')
-        
-        sql = f"""
-INSERT INTO public.payments (
-    ordem_servico_id, client_id,
-    payment_method_id, payment_date,
-    amount, amount_paid,
-    status, installments, notes
-) VALUES (
-    (SELECT id FROM public.ordens_servico WHERE numero_os = {escape_sql_string(row['numero_os'])} LIMIT 1),
-    (SELECT id FROM public.profiles WHERE cpf = {escape_sql_string(cpf_limpo)} LIMIT 1),
-    (SELECT id FROM public.payment_methods WHERE name = {escape_sql_string(row['forma_pagamento'])} LIMIT 1),
-    {escape_sql_string(row['data_pagamento']) if row['data_pagamento'] else 'NOW()'},
-    {row['valor_total'] if row['valor_total'] else '0'},
-    {row['valor_pago'] if row['valor_pago'] else '0'},
-    {escape_sql_string(row.get('status_pagamento', 'pendente'))},
-    {row['numero_parcelas'] if row['numero_parcelas'] else '1'},
-    {escape_sql_string(row.get('observacoes', ''))}
-);
-"""
-        sql_lines.append(sql)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
-    
-    print(f"✅ Gerado: {output_file} ({len(rows)} pagamentos)")
+        reader.fieldnames   # lê o cabeçalho antes: line_num conta as linhas físicas do arquivo
+        for line, row in iter_records(reader):
+            values = spec.row_to_values(row)
+            for i, col in checks:
+                if values[i] not in index[col.lookup.table]:
+                    counts[i] += 1
+                    if len(missing[i]) < MAX_EXEMPLOS:
+                        missing[i].append(f"linha {line}: {values[i] or '(vazio)'}")
+            for i, col in enumerate(spec.columns):
+                if col.lookup and col.lookup.key in externos:
+                    externos[col.lookup.key][1].add(values[i])
 
-def main():
-    """Função principal"""
-    print("\n🎯 CONVERSOR CSV → SQL - DOCTOR AUTO PRIME")
-    print("=" * 60)
-    print()
-    
-    csv_files = {
-        '01_clientes.csv': process_clientes,
-        '02_veiculos.csv': process_veiculos,
-        '03_ordens_servico.csv': process_ordens_servico,
-        '04_itens_os.csv': process_itens_os,
-        '05_agendamentos.csv': process_agendamentos,
-        '06_pecas_estoque.csv': process_pecas_estoque,
-        '07_patio_kanban.csv': process_patio_kanban,
-        '08_pagamentos.csv': process_pagamentos,
+    name = Path(csv_file).name
+    reported = set()
+    for i, col in checks:
+        lookup = col.lookup
+        if counts[i] and (lookup.key, lookup.table) not in reported:
+            reported.add((lookup.key, lookup.table))
+            print(f"⚠️  {name}: {counts[i]} {lookup.key} sem registro em {lookup.table} "
+                  f"nos CSVs (precisa já existir no banco) — {'; '.join(missing[i])}")
+    for key, (lookup, usados) in externos.items():
+        usados = sorted(v for v in usados if v)
+        print(f"ℹ️  {name}: valores de {key} ({len(usados)}): {', '.join(usados[:10])}"
+              f"{' ...' if len(usados) > 10 else ''} — precisam existir em "
+              f"{lookup.table}.{lookup.column}")
+
+    return [i for i, col in checks if col.lookup.local and not counts[i]]
+
+def apply_resolution(spec, index, resolved):
+    """Troca as colunas resolvidas localmente (check_references) por literais"""
+    if not resolved:
+        return spec
+    columns = list(spec.columns)
+    replacements = []
+    for i in resolved:
+        lookup = columns[i].lookup
+        replacements.append((i, index[lookup.table], lookup.local))
+        columns[i] = Column(columns[i].name)
+    return spec._replace(columns=tuple(columns),
+                         row_to_values=ResolvedValues(spec.row_to_values, replacements))
+
+# ========== VALIDAÇÃO (--validate) ==========
+#
+# Antes de gerar qualquer SQL, cada CSV é conferido coluna a coluna, em
+# blocos de CHUNK_ROWS linhas: cada regra roda uma vez por valor distinto da
+# coluna (status, datas e empresa_id se repetem muito) e marca as linhas com
+# os valores inválidos. As referências (CPF, placa, numero_os) são conferidas
+# contra as chaves das linhas válidas dos CSVs anteriores, então uma linha
+# que aponta para outra rejeitada também é rejeitada.
+#
+# As linhas inválidas vão para sql_gerado/rejeitados/, com o número da linha
+# e os erros; as válidas seguem para a conversão. Com --strict, o script para
+# no primeiro arquivo com erro, sem gerar nada.
+
+REJECT_DIR = SQL_OUTPUT_DIR / "rejeitados"
+VALID_DIR = SQL_OUTPUT_DIR / ".validados"
+
+CPF_RE = re.compile(r'\d{3}\.?\d{3}\.?\d{3}-?\d{2}')
+PLACA_RE = re.compile(r'[A-Z]{3}-?\d[A-Z\d]\d{2}')
+DATA_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+DATA_HORA_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}(:\d{2})?')
+HORA_RE = re.compile(r'([01]\d|2[0-3]):[0-5]\d')
+VALOR_RE = re.compile(r'\d+(\.\d{1,2})?')
+INTEIRO_RE = re.compile(r'\d+')
+
+# empresa_id aceitos quando --empresas não é informado (ver README)
+EMPRESAS = frozenset({'1', '2', '3', '4'})
+STATUS_OS = frozenset({'orcamento', 'aprovado', 'parcial', 'recusado', 'em_execucao',
+                       'concluido', 'entregue', 'cancelado'})
+STATUS_ITEM = frozenset({'pendente', 'em_andamento', 'concluido'})
+STATUS_AGENDAMENTO = frozenset({'pendente', 'confirmado', 'cancelado', 'concluido'})
+STATUS_PAGAMENTO = frozenset({'pendente', 'pago', 'parcial', 'atrasado'})
+PRIORIDADES = frozenset({'verde', 'amarelo', 'vermelho'})
+TIERS = frozenset({'platina', 'ouro', 'prata', 'bronze'})
+TIPOS_ITEM = frozenset({'mao_de_obra', 'peca'})
+FORMAS_PAGAMENTO = frozenset({'dinheiro', 'pix', 'cartao_debito', 'cartao_credito', 'transferencia'})
+
+def only_digits(value):
+    return value.replace('.', '').replace('-', '')
+
+CPF_PESOS = (range(10, 1, -1), range(11, 1, -1))
+
+@functools.lru_cache(maxsize=1 << 17)
+def valid_cpf(value):
+    """
+    Formato (com ou sem pontuação) e os dois dígitos verificadores.
+    Em cache: o mesmo CPF aparece em clientes, veículos, OS, agendamentos e pagamentos.
+    """
+    if not CPF_RE.fullmatch(value):
+        return False
+    text = only_digits(value)
+    if text == text[0] * 11:
+        return False
+    digits = list(map(int, text))
+    for size, pesos in zip((9, 10), CPF_PESOS):
+        if sum(map(operator.mul, digits, pesos)) * 10 % 11 % 10 != digits[size]:
+            return False
+    return True
+
+def valid_date(value):
+    try:
+        return bool(DATA_RE.fullmatch(value)) and bool(date.fromisoformat(value))
+    except ValueError:
+        return False
+
+def valid_datetime(value):
+    try:
+        return bool(DATA_HORA_RE.fullmatch(value)) and bool(datetime.fromisoformat(value))
+    except ValueError:
+        return False
+
+class Check(NamedTuple):
+    """Regra de uma coluna do CSV; `valid` só recebe valores não vazios"""
+    column: str
+    valid: Callable[[str], bool]
+    message: str
+    required: bool = False
+
+def one_of(values):
+    return values.__contains__
+
+CPF = ('CPF inválido', valid_cpf)
+PLACA = ('placa inválida (ABC-1234 ou ABC1D23)', PLACA_RE.fullmatch)
+DATA = ('data inválida (YYYY-MM-DD)', valid_date)
+VALOR = ('valor inválido (ex: 850.00)', VALOR_RE.fullmatch)
+INTEIRO = ('número inteiro inválido', INTEIRO_RE.fullmatch)
+def empresa_rule(empresas):
+    ordered = sorted(empresas, key=lambda value: (len(value), value))
+    return (f"deve ser um de: {', '.join(ordered)}", one_of(frozenset(empresas)))
+
+EMPRESA = empresa_rule(EMPRESAS)
+
+def check(column, rule, required=False):
+    message, valid = rule
+    return Check(column, valid, message, required)
+
+def enum(column, values, required=False):
+    return Check(column, one_of(values), f"deve ser um de: {', '.join(sorted(values))}", required)
+
+# CSV → (spec, regras das colunas)
+VALIDATION = {
+    '01_clientes.csv': (CLIENTES, [
+        Check('nome_completo', bool, 'obrigatório', required=True),
+        check('cpf', CPF, required=True),
+        check('data_nascimento', DATA),
+        enum('tier_fidelidade', TIERS),
+        check('pontos_fidelidade', INTEIRO),
+        check('empresa_id', EMPRESA),
+    ]),
+    '02_veiculos.csv': (VEICULOS, [
+        check('placa', PLACA, required=True),
+        check('ano', INTEIRO),
+        check('cpf_cliente', CPF, required=True),
+        check('quilometragem', INTEIRO),
+    ]),
+    '03_ordens_servico.csv': (ORDENS_SERVICO, [
+        Check('numero_os', bool, 'obrigatório', required=True),
+        check('placa_veiculo', PLACA, required=True),
+        check('cpf_cliente', CPF, required=True),
+        enum('status', STATUS_OS, required=True),
+        check('data_entrada', DATA),
+        check('data_prevista_conclusao', DATA),
+        check('valor_orcado', VALOR),
+        check('valor_aprovado', VALOR),
+        check('empresa_id', EMPRESA),
+        enum('prioridade', PRIORIDADES),
+    ]),
+    '04_itens_os.csv': (ITENS_OS, [
+        Check('numero_os', bool, 'obrigatório', required=True),
+        enum('tipo', TIPOS_ITEM, required=True),
+        check('quantidade', VALOR),
+        check('valor_unitario', VALOR),
+        enum('status', STATUS_ITEM),
+    ]),
+    '05_agendamentos.csv': (AGENDAMENTOS, [
+        check('placa_veiculo', PLACA, required=True),
+        check('cpf_cliente', CPF, required=True),
+        check('data_agendamento', DATA, required=True),
+        Check('hora_agendamento', HORA_RE.fullmatch, 'hora inválida (HH:MM)', required=True),
+        enum('status', STATUS_AGENDAMENTO),
+        check('empresa_id', EMPRESA),
+    ]),
+    '06_pecas_estoque.csv': (PECAS_ESTOQUE, [
+        Check('codigo_peca', bool, 'obrigatório', required=True),
+        check('preco_custo', VALOR),
+        check('preco_venda', VALOR),
+        check('estoque_atual', INTEIRO),
+        check('estoque_minimo', INTEIRO),
+        check('empresa_id', EMPRESA),
+    ]),
+    '07_patio_kanban.csv': (PATIO_KANBAN, [
+        Check('numero_os', bool, 'obrigatório', required=True),
+        check('placa_veiculo', PLACA),
+        Check('data_entrada_patio', valid_datetime, 'data e hora inválidas (YYYY-MM-DD HH:MM:SS)'),
+    ]),
+    '08_pagamentos.csv': (PAGAMENTOS, [
+        Check('numero_os', bool, 'obrigatório', required=True),
+        check('cpf_cliente', CPF),
+        check('data_pagamento', DATA),
+        enum('forma_pagamento', FORMAS_PAGAMENTO),
+        check('valor_total', VALOR),
+        check('valor_pago', VALOR),
+        enum('status_pagamento', STATUS_PAGAMENTO),
+        check('numero_parcelas', INTEIRO),
+    ]),
+}
+
+# tabela referenciada → (CSV de origem, coluna com a chave, normalização da chave)
+REFERENCE_KEYS = {
+    'public.profiles': ('01_clientes.csv', 'cpf', only_digits),
+    'public.vehicles': ('02_veiculos.csv', 'placa', str),
+    'public.ordens_servico': ('03_ordens_servico.csv', 'numero_os', str),
+}
+
+def iter_records(reader):
+    """(linha onde o registro começa no arquivo, campos), pulando linhas em branco"""
+    last = reader.line_num
+    for row in reader:
+        start, last = last + 1, reader.line_num
+        if row:
+            yield start, row
+
+def iter_column_blocks(csv_file, rows_per_block=CHUNK_ROWS):
+    """
+    Lê o CSV em blocos e entrega cada um em colunas.
+    Gera (cabeçalho, números das linhas no arquivo, {coluna: valores}).
+    """
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        records = iter_records(reader)
+        while True:
+            lines, rows = [], []
+            for line, row in records:
+                if len(row) != width:
+                    # colunas a menos viram vazias, como no DictReader; a mais, são descartadas
+                    row = row[:width] + [''] * (width - len(row))
+                lines.append(line)
+                rows.append(row)
+                if len(rows) == rows_per_block:
+                    break
+            if not rows:
+                return
+            yield header, lines, dict(zip(header, zip(*rows)))
+
+def column_errors(values, valid, required=False):
+    """
+    Posições dos valores inválidos da coluna: cada valor distinto é testado
+    uma vez; vazio só é inválido se a coluna for obrigatória.
+    """
+    distinct = set(values)
+    bad = {value for value in distinct if value and not valid(value)}
+    if required and '' in distinct:
+        bad.add('')
+    if not bad:
+        return []
+    return [i for i, value in enumerate(values) if value in bad]
+
+def validate_block(columns, checks, references, keys):
+    """{posição da linha no bloco: [erros]} de um bloco em colunas"""
+    errors = collections.defaultdict(list)
+    invalid = set()     # (linha, coluna) já com erro de formato: não repete como referência
+    for rule in checks:
+        values = columns[rule.column]
+        for i in column_errors(values, rule.valid, rule.required):
+            invalid.add((i, rule.column))
+            errors[i].append(f"{rule.column}: {rule.message if values[i] else 'obrigatório'} "
+                             f"({values[i] or 'vazio'})")
+    for column, table in references:
+        _, _, normalize = REFERENCE_KEYS[table]
+        values = columns[column]
+        known = keys[table]
+        for i in column_errors(values, lambda v: normalize(v) in known):
+            if (i, column) not in invalid:
+                errors[i].append(f"{column}: {values[i]} não existe em {REFERENCE_KEYS[table][0]} "
+                             f"(ou a linha de lá foi rejeitada)")
+    return errors
+
+def validate_csv(csv_file, spec, checks, keys):
+    """
+    Confere um CSV inteiro. Grava as linhas inválidas em REJECT_DIR e, se houver
+    alguma, uma cópia só com as válidas em VALID_DIR. Registra em `keys` as
+    chaves das linhas válidas (se o CSV for origem de referências).
+    Retorna (arquivo a converter, linhas lidas, [(linha, erros)] rejeitadas).
+    """
+    name = Path(csv_file).name
+    references = list(dict.fromkeys((col.lookup.key, col.lookup.table) for col in spec.columns
+                                    if col.lookup and col.lookup.table in keys))
+    own_key = next(((table, column, normalize) for table, (csv_name, column, normalize)
+                    in REFERENCE_KEYS.items() if csv_name == name), None)
+    if own_key is not None:
+        keys[own_key[0]] = set()
+
+    reject_file = REJECT_DIR / name
+    rejected = []
+    lidas = 0
+    writer = None
+    with contextlib.ExitStack() as stack:
+        for header, lines, columns in iter_column_blocks(csv_file):
+            faltando = [c for c in [r.column for r in checks] + [c for c, _ in references]
+                        if c not in columns]
+            if faltando:
+                raise ValueError(f"{name}: coluna(s) ausente(s) no cabeçalho: {', '.join(faltando)}")
+            errors = validate_block(columns, checks, references, keys)
+            lidas += len(lines)
+            if own_key is not None:
+                table, column, normalize = own_key
+                keys[table].update(normalize(value) for i, value in enumerate(columns[column])
+                                   if i not in errors)
+            if not errors:
+                continue
+            if writer is None:
+                REJECT_DIR.mkdir(exist_ok=True)
+                writer = csv.writer(stack.enter_context(
+                    open(reject_file, 'w', encoding='utf-8', newline='')))
+                writer.writerow(['linha', 'erros'] + header)
+            for i in sorted(errors):
+                rejected.append((lines[i], errors[i]))
+                writer.writerow([lines[i], '; '.join(errors[i])] + [columns[c][i] for c in header])
+
+    valid_file = VALID_DIR / name
+    if not rejected:
+        for stale in (reject_file, valid_file):
+            if stale.exists():
+                stale.unlink()
+        return csv_file, lidas, rejected
+
+    # segunda passada, só quando há rejeitadas: copia as válidas
+    VALID_DIR.mkdir(exist_ok=True)
+    skip = {line for line, _ in rejected}
+    with open(csv_file, 'r', encoding='utf-8', newline='') as src, \
+            open(valid_file, 'w', encoding='utf-8', newline='') as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        writer.writerow(next(reader))
+        for line, row in iter_records(reader):
+            if line not in skip:
+                writer.writerow(row)
+    return valid_file, lidas, rejected
+
+def parse_empresas(text):
+    """--empresas: ids separados por vírgula (ex: 1,2,3,4)"""
+    empresas = frozenset(value.strip() for value in text.split(',') if value.strip())
+    if not empresas:
+        raise argparse.ArgumentTypeError("informe ao menos um empresa_id (ex: 1,2,3,4)")
+    return empresas
+
+def with_empresas(checks, empresas):
+    """Troca a regra de empresa_id pela lista de --empresas"""
+    message, valid = empresa_rule(empresas)
+    return [c._replace(valid=valid, message=message) if c.column == 'empresa_id' else c
+            for c in checks]
+
+def validate_all(csv_paths, strict=False, empresas=EMPRESAS):
+    """
+    Valida os CSVs na ordem (as referências dependem dos anteriores).
+    Retorna {CSV: arquivo a converter}, ou None se strict e algum tiver erro.
+    """
+    keys = {}
+    validated = {}
+    for csv_file, csv_path in csv_paths.items():
+        if csv_file not in VALIDATION:
+            validated[csv_file] = csv_path
+            continue
+        spec, checks = VALIDATION[csv_file]
+        if empresas != EMPRESAS:
+            checks = with_empresas(checks, empresas)
+        path, lidas, rejected = validate_csv(csv_path, spec, checks, keys)
+        validated[csv_file] = path
+        if not rejected:
+            print(f"✅ {csv_file}: {lidas} linhas válidas")
+            continue
+        print(f"⚠️  {csv_file}: {len(rejected)} de {lidas} linhas rejeitadas → {REJECT_DIR / csv_file}")
+        for line, errors in rejected[:MAX_EXEMPLOS]:
+            print(f"   linha {line}: {'; '.join(errors)}")
+        if len(rejected) > MAX_EXEMPLOS:
+            print(f"   ... e mais {len(rejected) - MAX_EXEMPLOS} linhas")
+        if strict:
+            return None
+    return validated
+
+# ========== CARGA DIRETA (--load) ==========
+#
+# Em vez de gerar arquivos para colar no SQL Editor, conecta direto no
+# Postgres e carrega cada tabela numa única transação: COPY (ou INSERTs em
+# lote com executemany) no staging ou direto na tabela, seguido do mesmo
+# INSERT ... SELECT do --staging. As dependências saem das buscas de cada
+# spec: uma tabela só começa quando as que ela consulta terminaram, e as
+# independentes (ex: 06_pecas_estoque) rodam em paralelo, cada uma numa
+# conexão do pool. Precisa do psycopg 3: pip install "psycopg[binary,pool]"
+
+LOAD_METHODS = ('copy', 'insert')
+
+# Conexões do pool (= tabelas carregadas ao mesmo tempo) quando --jobs não é informado
+LOAD_CONNECTIONS = 4
+
+# Bytes acumulados antes de cada envio ao COPY
+COPY_BUFFER_SIZE = 1 << 20
+
+class CopyBuffer:
+    """Recebe os pedaços de write_copy_rows e os envia ao COPY em blocos de COPY_BUFFER_SIZE"""
+
+    def __init__(self, copy, size=COPY_BUFFER_SIZE):
+        self.copy = copy
+        self.size = size
+        self.parts = []
+        self.buffered = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.copy.write(''.join(self.parts))
+            self.parts = []
+            self.buffered = 0
+
+def load_dependencies(specs):
+    """{CSV: CSVs das tabelas que ele consulta, entre os que serão carregados}"""
+    by_table = {spec.table: csv_file for csv_file, spec in specs.items()}
+    return {
+        csv_file: {by_table[col.lookup.table] for col in spec.columns
+                   if col.lookup and by_table.get(col.lookup.table, csv_file) != csv_file}
+        for csv_file, spec in specs.items()
     }
-    
-    for csv_file, processor in csv_files.items():
-        csv_path = BASE_DIR / csv_file
-        if csv_path.exists():
+
+def insert_rows(cur, spec, values_rows, batch_size):
+    """Carrega as linhas com INSERTs parametrizados, batch_size por executemany; retorna o total"""
+    target, columns = copy_target(spec)
+    if needs_staging(spec):
+        indexes = [i for _, i in staging_fields(spec)]
+    else:
+        indexes = range(len(spec.columns))
+    sql = f"INSERT INTO {target} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+    total = 0
+    while True:
+        batch = [[values[i] if values[i] != '' else None for i in indexes]
+                 for values in itertools.islice(values_rows, batch_size)]
+        if not batch:
+            return total
+        cur.executemany(sql, batch)
+        total += len(batch)
+
+def load_table(pool, csv_file, spec, method='copy', batch_size=0):
+    """Carrega um CSV numa transação; retorna (registros, segundos)"""
+    start = time.perf_counter()
+    values_rows = map(spec.row_to_values, iter_rows(csv_file))
+
+    with pool.connection() as conn, conn.transaction(), conn.cursor() as cur:
+        if needs_staging(spec):
+            cur.execute(format_staging_create(spec))
+        if method == 'copy':
+            target, columns = copy_target(spec)
+            with cur.copy(f"COPY {target} ({', '.join(columns)}) FROM STDIN") as copy:
+                buffer = CopyBuffer(copy)
+                total = write_copy_rows(buffer, spec, values_rows)
+                buffer.flush()
+        else:
+            total = insert_rows(cur, spec, values_rows, batch_size or STAGING_BATCH_SIZE)
+        if needs_staging(spec):
+            cur.execute(format_staging_insert(spec))
+    return total, time.perf_counter() - start
+
+def load_all(dsn, csv_paths, method='copy', batch_size=0, index=None, connections=LOAD_CONNECTIONS):
+    """
+    Carrega os CSVs respeitando as dependências, com até `connections` tabelas
+    ao mesmo tempo. Se uma tabela falha, as que dependem dela são puladas.
+    Retorna True se todas foram carregadas.
+    """
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError:
+        print('❌ --load precisa do psycopg 3 com o pool: pip install "psycopg[binary,pool]"')
+        return False
+
+    specs = {}
+    for csv_file, csv_path in csv_paths.items():
+        spec = TABLE_SPECS[csv_file]
+        # --resolve: a checagem imprime avisos, então roda antes das threads
+        resolved = check_references(csv_path, spec, index) if index is not None else []
+        specs[csv_file] = apply_resolution(spec, index, resolved)
+    # a ordem vem das specs originais: com --resolve a busca vira literal, mas a FK continua lá
+    pending = load_dependencies({csv_file: TABLE_SPECS[csv_file] for csv_file in specs})
+    done, failed = set(), set()
+    running = {}
+    start = time.perf_counter()
+
+    with ConnectionPool(dsn, min_size=1, max_size=connections, kwargs={'autocommit': True},
+                        open=True) as pool, ThreadPoolExecutor(connections) as executor:
+        while pending or running:
+            blocked = [csv_file for csv_file, deps in pending.items() if deps & failed]
+            while blocked:
+                for csv_file in blocked:
+                    print(f"⏭️  {csv_file}: pulado (depende de "
+                          f"{', '.join(sorted(pending[csv_file] & failed))}, que falhou)")
+                    failed.add(csv_file)
+                    del pending[csv_file]
+                blocked = [csv_file for csv_file, deps in pending.items() if deps & failed]
+
+            for csv_file in [f for f, deps in pending.items() if deps <= done]:
+                del pending[csv_file]
+                running[executor.submit(load_table, pool, csv_paths[csv_file], specs[csv_file],
+                                        method, batch_size)] = csv_file
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                csv_file = running.pop(future)
+                spec = specs[csv_file]
+                try:
+                    total, elapsed = future.result()
+                except Exception as e:
+                    failed.add(csv_file)
+                    print(f"❌ {csv_file} → {spec.table}: {' | '.join(str(e).strip().splitlines())} (transação desfeita)")
+                    continue
+                done.add(csv_file)
+                print(f"✅ {csv_file} → {spec.table}: {total} {spec.descricao} em {elapsed:.2f} s"
+                      f" ({total / elapsed if elapsed else 0:,.0f}/s)")
+
+    print(f"\n⏱️  {len(done)} tabelas carregadas em {time.perf_counter() - start:.2f} s"
+          + (f", {len(failed)} com erro ou puladas" if failed else ""))
+    return not failed
+
+# ========== VERIFICAÇÃO (--check) ==========
+#
+# Os leitores e encoders de cada tabela são gerados a partir das specs
+# (compile_function), então uma mudança numa spec pode mudar o SQL sem que
+# nada acuse. --check converte os CSVs de verificacao/entrada/ (os modelos
+# mais linhas com aspas, apóstrofos, campos vazios, decimais, tab, quebra de
+# linha e barra invertida) em cada combinação de opções abaixo e compara,
+# byte a byte, com verificacao/esperado/<modo>/. Os arquivos esperados foram
+# gerados pelo conversor de antes das specs (process_* escritos à mão).
+# Mudança intencional na saída: gere de novo a pasta do modo e revise o diff.
+
+CHECK_DIR = BASE_DIR / "verificacao"
+CHECK_GERADO_EM = '2026-01-01 00:00:00'
+CHECK_MODES = {
+    'sql': {},
+    'lotes': dict(batch_size=2),
+    'copy': dict(fmt='copy'),
+    'tsv': dict(fmt='tsv'),
+    'staging': dict(staging=True),
+    'resolve': dict(resolve=True),
+    'paralelo': dict(batch_size=2, jobs=2),
+    'copy_staging_resolve': dict(fmt='copy', staging=True, resolve=True),
+}
+
+def first_difference(expected, actual):
+    """Número da primeira linha diferente entre os dois conteúdos"""
+    pairs = itertools.zip_longest(expected.splitlines(), actual.splitlines())
+    return next((i for i, (a, b) in enumerate(pairs, start=1) if a != b),
+                len(expected.splitlines()) + 1)   # só o fim do arquivo difere
+
+def compare_outputs(expected_dir, output_dir):
+    """Diferenças entre a pasta esperada e a gerada: [(arquivo, motivo)]"""
+    expected = {p.name for p in expected_dir.iterdir()} if expected_dir.exists() else set()
+    generated = {p.name for p in output_dir.iterdir()}
+    diffs = [(name, 'não foi gerado') for name in sorted(expected - generated)]
+    diffs += [(name, 'gerado a mais') for name in sorted(generated - expected)]
+    for name in sorted(expected & generated):
+        want, got = (expected_dir / name).read_bytes(), (output_dir / name).read_bytes()
+        if want != got:
+            diffs.append((name, f"difere na linha {first_difference(want, got)}"))
+    return diffs
+
+def check_outputs(modes=CHECK_MODES):
+    """--check: converte verificacao/entrada/ em cada modo e compara com o esperado"""
+    input_dir = CHECK_DIR / "entrada"
+    csv_paths = {csv_file: input_dir / csv_file for csv_file in PROCESSORS}
+    failed = 0
+    for mode, settings in modes.items():
+        index = build_index(input_dir) if settings.get('resolve') else None
+        jobs = settings.get('jobs', 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            options = dict(
+                batch_size=settings.get('batch_size', 0), fmt=settings.get('fmt', 'sql'),
+                staging=settings.get('staging', False), index=index,
+                gerado_em=CHECK_GERADO_EM, output_dir=Path(tmp),
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                if jobs > 1:
+                    run_parallel(PROCESSORS, csv_paths, options, jobs)
+                else:
+                    for csv_file, processor in PROCESSORS.items():
+                        processor(csv_paths[csv_file], **options)
+            diffs = compare_outputs(CHECK_DIR / "esperado" / mode, Path(tmp))
+        if not diffs:
+            print(f"✅ {mode}")
+            continue
+        failed += 1
+        print(f"❌ {mode}")
+        for name, motivo in diffs:
+            print(f"   {name}: {motivo}")
+    return not failed
+
+# ========== MAIN ==========
+
+def parse_args(argv=None):
+    """Lê as opções de linha de comando"""
+    parser = argparse.ArgumentParser(description="Converte os CSVs em scripts SQL para o Supabase")
+    parser.add_argument(
+        '--batch-size', type=int, default=0, metavar='N',
+        help="agrupa N linhas por INSERT (cada lote numa transação); 0 = um INSERT por linha",
+    )
+    parser.add_argument(
+        '--format', dest='fmt', choices=OUTPUT_FORMATS, default='sql',
+        help="sql = INSERTs (padrão); copy = blocos COPY FROM STDIN; tsv = arquivos .tsv + \\copy",
+    )
+    parser.add_argument(
+        '--staging', action='store_true',
+        help="carrega as linhas brutas num staging temporário e resolve as FKs com JOINs (um INSERT ... SELECT por tabela)",
+    )
+    parser.add_argument(
+        '--resolve', action='store_true',
+        help="indexa clientes/veículos/OS em memória, confere as referências entre os CSVs "
+             "e grava vehicle/client_name/client_phone já resolvidos",
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=1, metavar='N',
+        help="converte as tabelas (e blocos de cada arquivo) em paralelo com N processos",
+    )
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="pula as tabelas cujo CSV não mudou desde a última conversão (manifesto em sql_gerado/); "
+             "clientes/veículos/OS alterados saem como upsert pela chave natural (cpf, placa, numero_os)",
+    )
+    parser.add_argument(
+        '--incremental-rows', action='store_true',
+        help="como --incremental, e em clientes/veículos/OS grava só as linhas novas ou "
+             "alteradas, com upsert pela chave natural (cpf, placa, numero_os)",
+    )
+    parser.add_argument(
+        '--confirm', action='store_true',
+        help="confirma que os SQLs da última conversão incremental foram executados: "
+             "a próxima conversão parte deles",
+    )
+    parser.add_argument(
+        '--validate', action='store_true',
+        help="valida os CSVs (CPF, placa, datas, valores, status, referências) antes da conversão; "
+             "as linhas inválidas vão para sql_gerado/rejeitados/ e ficam de fora",
+    )
+    parser.add_argument(
+        '--strict', action='store_true',
+        help="como --validate, mas para no primeiro arquivo com erro, sem gerar nenhum SQL",
+    )
+    parser.add_argument(
+        '--empresas', type=parse_empresas, default=EMPRESAS, metavar='IDS',
+        help="com --validate: empresa_id aceitos, separados por vírgula "
+             f"(padrão: {','.join(sorted(EMPRESAS))})",
+    )
+    parser.add_argument(
+        '--load', nargs='?', const='', metavar='DSN',
+        help="carrega direto no Postgres (DSN ou $DATABASE_URL) em vez de gerar arquivos: "
+             "uma transação por tabela, as independentes em paralelo",
+    )
+    parser.add_argument(
+        '--check', action='store_true',
+        help="não converte os seus CSVs: confere se a saída para verificacao/entrada/ "
+             "continua idêntica a verificacao/esperado/ em todos os modos",
+    )
+    parser.add_argument(
+        '--load-method', choices=LOAD_METHODS, default='copy',
+        help="com --load: copy = COPY FROM STDIN (padrão); insert = INSERTs em lote de --batch-size",
+    )
+    args = parser.parse_args(argv)
+    if args.load is not None and (args.incremental or args.incremental_rows or args.confirm):
+        parser.error("--load não combina com --incremental/--incremental-rows/--confirm")
+    return args
+
+def run_parallel(csv_files, csv_paths, options, jobs):
+    """Uma thread por tabela, todas dividindo um pool de `jobs` processos"""
+    with ProcessPoolExecutor(jobs, initializer=init_worker,
+                             initargs=(options['index'],)) as pool, \
+            ThreadPoolExecutor(len(csv_files)) as threads:
+        futures = []
+        for csv_file, processor in csv_files.items():
+            csv_path = csv_paths[csv_file]
+            if csv_path.exists():
+                futures.append((csv_file, threads.submit(
+                    processor, csv_path, pool=pool, jobs=jobs, **options
+                )))
+            else:
+                print(f"⚠️  Arquivo não encontrado: {csv_file}")
+        for csv_file, future in futures:
             try:
-                processor(csv_path)
+                future.result()
             except Exception as e:
                 print(f"❌ Erro ao processar {csv_file}: {str(e)}")
-        else:
-            print(f"⚠️  Arquivo não encontrado: {csv_file}")
-    
+
+def main(argv=None):
+    """Função principal"""
+    args = parse_args(argv)
+
+    print("\n🎯 CONVERSOR CSV → SQL - DOCTOR AUTO PRIME")
+    print("=" * 60)
+    print()
+
+    if args.check:
+        print("🔎 Conferindo a saída do conversor contra verificacao/esperado/...")
+        ok = check_outputs()
+        print("\n✅ Saída idêntica em todos os modos" if ok
+              else "\n❌ A saída mudou: revise as diferenças acima")
+        sys.exit(0 if ok else 1)
+
+    if args.confirm:
+        if confirm_pending():
+            print("✅ Conversão incremental confirmada: a próxima parte do que já está no banco")
+            sys.exit(0)
+        print("❌ Nenhuma conversão incremental pendente para confirmar")
+        sys.exit(1)
+
+    csv_files = PROCESSORS
+
+    csv_paths = {csv_file: BASE_DIR / csv_file for csv_file in csv_files}
+    if args.validate or args.strict:
+        print("🔎 Validando os CSVs...")
+        validated = validate_all({f: p for f, p in csv_paths.items() if p.exists()},
+                                 args.strict, args.empresas)
+        if validated is None:
+            print("\n❌ Validação falhou (--strict): nenhum SQL foi gerado. "
+                  "Corrija as linhas acima e rode de novo.")
+            sys.exit(1)
+        csv_paths.update(validated)
+        print()
+
+    # Depois da validação: o índice só tem as linhas que vão ser convertidas
+    index = None
+    if args.resolve:
+        index = build_index(BASE_DIR, csv_paths)
+        print(f"🔗 Índice local: {', '.join(f'{t} ({len(r)})' for t, r in index.items())}")
+        print()
+
+    options = dict(
+        batch_size=args.batch_size, fmt=args.fmt, staging=args.staging, index=index,
+        gerado_em=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        incremental_rows=args.incremental_rows,
+    )
+
+    if args.load is not None:
+        dsn = args.load or os.getenv('DATABASE_URL')
+        if not dsn:
+            print("❌ Informe a conexão: --load postgresql://... ou a variável DATABASE_URL")
+            sys.exit(1)
+        print(f"🔌 Carregando direto no banco ({args.load_method})...")
+        ok = load_all(dsn, {f: p for f, p in csv_paths.items() if p.exists()}, args.load_method,
+                      args.batch_size, index, args.jobs if args.jobs > 1 else LOAD_CONNECTIONS)
+        sys.exit(0 if ok else 1)
+
+    if args.incremental or args.incremental_rows:
+        discard_pending()
+        options['manifest'] = load_manifest(run_config(options, args.resolve))
+
+    if args.jobs > 1:
+        run_parallel(csv_files, csv_paths, options, args.jobs)
+    else:
+        for csv_file, processor in csv_files.items():
+            csv_path = csv_paths[csv_file]
+            if csv_path.exists():
+                try:
+                    processor(csv_path, **options)
+                except Exception as e:
+                    print(f"❌ Erro ao processar {csv_file}: {str(e)}")
+            else:
+                print(f"⚠️  Arquivo não encontrado: {csv_file}")
+
+    if 'manifest' in options:
+        save_pending(options['manifest'])
+
     print()
     print("=" * 60)
     print("✅ CONVERSÃO CONCLUÍDA!")
@@ -454,10 +1860,18 @@ def main():
     print(f"📁 Scripts SQL gerados em: {SQL_OUTPUT_DIR}")
     print()
     print("🚀 PRÓXIMOS PASSOS:")
-    print("1. Abra o Supabase Dashboard")
-    print("2. Vá em SQL Editor → New Query")
-    print("3. Execute os scripts na ordem numérica (01, 02, 03...)")
+    if args.fmt == 'sql':
+        print("1. Abra o Supabase Dashboard")
+        print("2. Vá em SQL Editor → New Query")
+        print("3. Execute os scripts na ordem numérica (01, 02, 03...)")
+    else:
+        print("1. Pegue a connection string em Supabase → Project Settings → Database")
+        print(f"2. Entre na pasta: cd {SQL_OUTPUT_DIR}")
+        print("3. Execute na ordem numérica: psql \"$DATABASE_URL\" -f 01_copy_clientes.sql (02, 03...)")
     print("4. Verifique os dados inseridos")
+    if 'manifest' in options:
+        print("5. Depois de executar todos os scripts: python csv_to_sql.py --confirm")
+        print("   (sem isso, a próxima conversão incremental gera as mesmas linhas de novo)")
     print()
 
 if __name__ == '__main__':
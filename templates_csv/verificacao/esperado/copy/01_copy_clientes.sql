@@ -0,0 +1,15 @@
+-- =============================================
+-- INSERÇÃO DE CLIENTES
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+COPY public.profiles (full_name, cpf, email, phone, birth_date, address, zip_code, city, state, loyalty_tier, loyalty_points, company_id, notes) FROM STDIN;
+João Silva Santos	12345678909	joao.silva@email.com	(11) 98765-4321	1985-03-15	Rua das Flores, 123 - Jardim Paulista	01234567	São Paulo	SP	platina	5000	1	Cliente VIP - prefere atendimento pela manhã
+Maria Oliveira Costa	98765432100	maria.costa@email.com	(11) 97654-3210	1990-07-22	Av. Paulista, 1500 - Bela Vista	01310100	São Paulo	SP	ouro	3000	1	\N
+Pedro Santos Lima	45678912364	pedro.lima@empresa.com	(11) 96543-2109	1978-11-08	Rua Augusta, 2500 - Consolação	01412100	São Paulo	SP	prata	1500	2	\N
+Ana D'Ávila	11144477735	\N	\N	\N	Rua O'Higgins, 10 - Vila "Nova"	\N	\N	\N	\N	0	3	linha 1\nlinha 2\tcom tab e barra \\ no fim
+\.
+COMMIT;
+
+-- Total de registros: 4
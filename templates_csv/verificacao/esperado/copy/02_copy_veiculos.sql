@@ -0,0 +1,48 @@
+-- =============================================
+-- INSERÇÃO DE VEÍCULOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_veiculos ON COMMIT DROP AS
+SELECT
+    t.plate,
+    t.brand,
+    t.model,
+    t.year,
+    t.color,
+    t.mileage,
+    t.chassis,
+    t.renavam,
+    t.notes,
+    NULL::text AS cpf_cliente
+FROM public.vehicles t WITH NO DATA;
+COPY _stg_veiculos (plate, brand, model, year, color, cpf_cliente, mileage, chassis, renavam, notes) FROM STDIN;
+ABC-1234	Honda	Civic EXL 2.0	2022	Preto	12345678909	45000	9BWZZZ377VT004251	00123456789	Veículo em excelente estado
+XYZ-5678	Toyota	Corolla XEI	2021	Prata	12345678909	38000	9BR53ZEC4L8123456	00987654321	\N
+DEF-9012	Volkswagen	Jetta TSI	2020	Branco	98765432100	52000	3VW2K7AJ8LM123456	00456789123	\N
+JKL-0A12	Fiat	Uno Mille 1.0 'Fire'	\N	\N	11144477735	\N	\N	\N	\N
+\.
+INSERT INTO public.vehicles (
+    plate, brand, model, year, color, user_id, mileage, chassis, renavam, notes
+)
+SELECT
+    s.plate,
+    s.brand,
+    s.model,
+    s.year,
+    s.color,
+    j1.v1,
+    s.mileage,
+    s.chassis,
+    s.renavam,
+    s.notes
+FROM _stg_veiculos s
+LEFT JOIN (
+    SELECT DISTINCT ON (cpf) cpf, id AS v1
+    FROM public.profiles
+    WHERE cpf IN (SELECT cpf_cliente FROM _stg_veiculos)
+) j1 ON j1.cpf = s.cpf_cliente;
+COMMIT;
+
+-- Total de registros: 4
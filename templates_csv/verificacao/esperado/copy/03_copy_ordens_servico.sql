@@ -0,0 +1,63 @@
+-- =============================================
+-- INSERÇÃO DE ORDENS DE SERVIÇO
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_ordens_servico ON COMMIT DROP AS
+SELECT
+    t.numero_os,
+    t.plate,
+    t.status,
+    t.descricao_problema,
+    t.diagnostico,
+    t.mechanic_id,
+    t.data_entrada,
+    t.data_orcamento,
+    t.valor_orcado,
+    t.valor_aprovado,
+    t.empresa_id,
+    t.prioridade,
+    t.observacoes,
+    NULL::text AS placa_veiculo,
+    NULL::text AS cpf_cliente
+FROM public.ordens_servico t WITH NO DATA;
+COPY _stg_ordens_servico (numero_os, plate, placa_veiculo, cpf_cliente, status, descricao_problema, diagnostico, mechanic_id, data_entrada, data_orcamento, valor_orcado, valor_aprovado, empresa_id, prioridade, observacoes) FROM STDIN;
+OS-2026-0001	ABC-1234	ABC-1234	12345678909	orcamento	Barulho no motor ao acelerar	Necessário trocar correia dentada e tensor	João Mecânico	2026-01-30	2026-02-02	850.00	\N	1	amarelo	Cliente aguardando aprovação
+OS-2026-0002	XYZ-5678	XYZ-5678	12345678909	em_execucao	Revisão dos 40 mil km	Troca de óleo + filtros + alinhamento	Pedro Mecânico	2026-01-28	2026-01-31	650.00	650.00	1	verde	\N
+OS-2026-0003	JKL-0A12	JKL-0A12	11144477735	orcamento	Porta não fecha; cliente diz "urgente"	\N	\N	\N	\N	0	\N	4	\N	O'Neil autorizou
+\.
+INSERT INTO public.ordens_servico (
+    numero_os, plate, vehicle, client_name, client_phone, status, descricao_problema, diagnostico, mechanic_id, data_entrada, data_orcamento, valor_orcado, valor_aprovado, empresa_id, prioridade, observacoes
+)
+SELECT
+    s.numero_os,
+    s.plate,
+    j1.v1,
+    j2.v1,
+    j2.v2,
+    s.status,
+    s.descricao_problema,
+    s.diagnostico,
+    s.mechanic_id,
+    COALESCE(s.data_entrada, NOW()),
+    s.data_orcamento,
+    s.valor_orcado,
+    s.valor_aprovado,
+    s.empresa_id,
+    s.prioridade,
+    s.observacoes
+FROM _stg_ordens_servico s
+LEFT JOIN (
+    SELECT DISTINCT ON (plate) plate, CONCAT(brand, ' ', model) AS v1
+    FROM public.vehicles
+    WHERE plate IN (SELECT placa_veiculo FROM _stg_ordens_servico)
+) j1 ON j1.plate = s.placa_veiculo
+LEFT JOIN (
+    SELECT DISTINCT ON (cpf) cpf, full_name AS v1, phone AS v2
+    FROM public.profiles
+    WHERE cpf IN (SELECT cpf_cliente FROM _stg_ordens_servico)
+) j2 ON j2.cpf = s.cpf_cliente;
+COMMIT;
+
+-- Total de registros: 3
@@ -0,0 +1,45 @@
+-- =============================================
+-- INSERÇÃO DE MOVIMENTOS DO PÁTIO
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_patio_kanban ON COMMIT DROP AS
+SELECT
+    t.vehicle_plate,
+    t.moved_at,
+    t.responsible,
+    t.notes,
+    NULL::text AS numero_os,
+    NULL::text AS estagio_atual
+FROM public.patio_movements t WITH NO DATA;
+COPY _stg_patio_kanban (numero_os, vehicle_plate, estagio_atual, moved_at, responsible, notes) FROM STDIN;
+OS-2026-0001	ABC-1234	aguardando_aprovacao	2026-01-30 08:30:00	João Mecânico	Aguardando cliente aprovar orçamento de R$ 850
+OS-2026-0002	XYZ-5678	em_execucao	2026-01-28 09:00:00	Pedro Mecânico	Revisão 40 mil - Faltando alinhamento
+OS-2026-0003	GHI-3456	diagnostico	2026-01-30 14:00:00	Carlos Mecânico	Investigando vazamento de óleo
+OS-2026-0003	JKL-0A12	diagnostico	\N	\N	\N
+\.
+INSERT INTO public.patio_movements (
+    ordem_servico_id, vehicle_plate, stage_id, moved_at, responsible, notes
+)
+SELECT
+    j1.v1,
+    s.vehicle_plate,
+    j2.v1,
+    COALESCE(s.moved_at, NOW()),
+    s.responsible,
+    s.notes
+FROM _stg_patio_kanban s
+LEFT JOIN (
+    SELECT DISTINCT ON (numero_os) numero_os, id AS v1
+    FROM public.ordens_servico
+    WHERE numero_os IN (SELECT numero_os FROM _stg_patio_kanban)
+) j1 ON j1.numero_os = s.numero_os
+LEFT JOIN (
+    SELECT DISTINCT ON (name) name, id AS v1
+    FROM public.patio_stages
+    WHERE name IN (SELECT estagio_atual FROM _stg_patio_kanban)
+) j2 ON j2.name = s.estagio_atual;
+COMMIT;
+
+-- Total de registros: 4
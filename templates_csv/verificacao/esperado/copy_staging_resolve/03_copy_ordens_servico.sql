@@ -0,0 +1,54 @@
+-- =============================================
+-- INSERÇÃO DE ORDENS DE SERVIÇO
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_ordens_servico ON COMMIT DROP AS
+SELECT
+    t.numero_os,
+    t.plate,
+    t.vehicle,
+    t.client_name,
+    t.client_phone,
+    t.status,
+    t.descricao_problema,
+    t.diagnostico,
+    t.mechanic_id,
+    t.data_entrada,
+    t.data_orcamento,
+    t.valor_orcado,
+    t.valor_aprovado,
+    t.empresa_id,
+    t.prioridade,
+    t.observacoes
+FROM public.ordens_servico t WITH NO DATA;
+COPY _stg_ordens_servico (numero_os, plate, vehicle, client_name, client_phone, status, descricao_problema, diagnostico, mechanic_id, data_entrada, data_orcamento, valor_orcado, valor_aprovado, empresa_id, prioridade, observacoes) FROM STDIN;
+OS-2026-0001	ABC-1234	Honda Civic EXL 2.0	João Silva Santos	(11) 98765-4321	orcamento	Barulho no motor ao acelerar	Necessário trocar correia dentada e tensor	João Mecânico	2026-01-30	2026-02-02	850.00	\N	1	amarelo	Cliente aguardando aprovação
+OS-2026-0002	XYZ-5678	Toyota Corolla XEI	João Silva Santos	(11) 98765-4321	em_execucao	Revisão dos 40 mil km	Troca de óleo + filtros + alinhamento	Pedro Mecânico	2026-01-28	2026-01-31	650.00	650.00	1	verde	\N
+OS-2026-0003	JKL-0A12	Fiat Uno Mille 1.0 'Fire'	Ana D'Ávila	\N	orcamento	Porta não fecha; cliente diz "urgente"	\N	\N	\N	\N	0	\N	4	\N	O'Neil autorizou
+\.
+INSERT INTO public.ordens_servico (
+    numero_os, plate, vehicle, client_name, client_phone, status, descricao_problema, diagnostico, mechanic_id, data_entrada, data_orcamento, valor_orcado, valor_aprovado, empresa_id, prioridade, observacoes
+)
+SELECT
+    s.numero_os,
+    s.plate,
+    s.vehicle,
+    s.client_name,
+    s.client_phone,
+    s.status,
+    s.descricao_problema,
+    s.diagnostico,
+    s.mechanic_id,
+    COALESCE(s.data_entrada, NOW()),
+    s.data_orcamento,
+    s.valor_orcado,
+    s.valor_aprovado,
+    s.empresa_id,
+    s.prioridade,
+    s.observacoes
+FROM _stg_ordens_servico s;
+COMMIT;
+
+-- Total de registros: 3
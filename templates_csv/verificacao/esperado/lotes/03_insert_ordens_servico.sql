@@ -0,0 +1,23 @@
+-- =============================================
+-- INSERÇÃO DE ORDENS DE SERVIÇO
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+BEGIN;
+INSERT INTO public.ordens_servico (
+    numero_os, plate, vehicle, client_name, client_phone, status, descricao_problema, diagnostico, mechanic_id, data_entrada, data_orcamento, valor_orcado, valor_aprovado, empresa_id, prioridade, observacoes
+) VALUES
+    ('OS-2026-0001', 'ABC-1234', (SELECT CONCAT(brand, ' ', model) FROM public.vehicles WHERE plate = 'ABC-1234' LIMIT 1), (SELECT full_name FROM public.profiles WHERE cpf = '12345678909' LIMIT 1), (SELECT phone FROM public.profiles WHERE cpf = '12345678909' LIMIT 1), 'orcamento', 'Barulho no motor ao acelerar', 'Necessário trocar correia dentada e tensor', 'João Mecânico', '2026-01-30', '2026-02-02', 850.00, NULL, 1, 'amarelo', 'Cliente aguardando aprovação'),
+    ('OS-2026-0002', 'XYZ-5678', (SELECT CONCAT(brand, ' ', model) FROM public.vehicles WHERE plate = 'XYZ-5678' LIMIT 1), (SELECT full_name FROM public.profiles WHERE cpf = '12345678909' LIMIT 1), (SELECT phone FROM public.profiles WHERE cpf = '12345678909' LIMIT 1), 'em_execucao', 'Revisão dos 40 mil km', 'Troca de óleo + filtros + alinhamento', 'Pedro Mecânico', '2026-01-28', '2026-01-31', 650.00, 650.00, 1, 'verde', NULL);
+COMMIT;
+
+
+BEGIN;
+INSERT INTO public.ordens_servico (
+    numero_os, plate, vehicle, client_name, client_phone, status, descricao_problema, diagnostico, mechanic_id, data_entrada, data_orcamento, valor_orcado, valor_aprovado, empresa_id, prioridade, observacoes
+) VALUES
+    ('OS-2026-0003', 'JKL-0A12', (SELECT CONCAT(brand, ' ', model) FROM public.vehicles WHERE plate = 'JKL-0A12' LIMIT 1), (SELECT full_name FROM public.profiles WHERE cpf = '11144477735' LIMIT 1), (SELECT phone FROM public.profiles WHERE cpf = '11144477735' LIMIT 1), 'orcamento', 'Porta não fecha; cliente diz "urgente"', NULL, NULL, NOW(), NULL, 0, NULL, 4, NULL, 'O''Neil autorizou');
+COMMIT;
+
+-- Total de registros: 3
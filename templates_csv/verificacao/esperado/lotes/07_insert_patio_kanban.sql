@@ -0,0 +1,24 @@
+-- =============================================
+-- INSERÇÃO DE MOVIMENTOS DO PÁTIO
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+BEGIN;
+INSERT INTO public.patio_movements (
+    ordem_servico_id, vehicle_plate, stage_id, moved_at, responsible, notes
+) VALUES
+    ((SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0001' LIMIT 1), 'ABC-1234', (SELECT id FROM public.patio_stages WHERE name = 'aguardando_aprovacao' LIMIT 1), '2026-01-30 08:30:00', 'João Mecânico', 'Aguardando cliente aprovar orçamento de R$ 850'),
+    ((SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0002' LIMIT 1), 'XYZ-5678', (SELECT id FROM public.patio_stages WHERE name = 'em_execucao' LIMIT 1), '2026-01-28 09:00:00', 'Pedro Mecânico', 'Revisão 40 mil - Faltando alinhamento');
+COMMIT;
+
+
+BEGIN;
+INSERT INTO public.patio_movements (
+    ordem_servico_id, vehicle_plate, stage_id, moved_at, responsible, notes
+) VALUES
+    ((SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0003' LIMIT 1), 'GHI-3456', (SELECT id FROM public.patio_stages WHERE name = 'diagnostico' LIMIT 1), '2026-01-30 14:00:00', 'Carlos Mecânico', 'Investigando vazamento de óleo'),
+    ((SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0003' LIMIT 1), 'JKL-0A12', (SELECT id FROM public.patio_stages WHERE name = 'diagnostico' LIMIT 1), NOW(), NULL, NULL);
+COMMIT;
+
+-- Total de registros: 4
@@ -0,0 +1,33 @@
+-- =============================================
+-- INSERÇÃO DE PEÇAS (ESTOQUE)
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+BEGIN;
+INSERT INTO public.parts (
+    code, name, category_id, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes
+) VALUES
+    ('OLEO-5W30-4L', 'Óleo Mobil Super 5W30 (4L)', (SELECT id FROM public.parts_categories WHERE name = 'Lubrificantes' LIMIT 1), 'Mobil', 145.00, 180.00, 24, 10, 'Prateleira A1', 1, NULL),
+    ('FILTRO-OLEO-123', 'Filtro de óleo universal', (SELECT id FROM public.parts_categories WHERE name = 'Filtros' LIMIT 1), 'Tecfil', 22.00, 35.00, 45, 15, 'Prateleira B2', 1, NULL);
+COMMIT;
+
+
+BEGIN;
+INSERT INTO public.parts (
+    code, name, category_id, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes
+) VALUES
+    ('CORREIA-5521XS', 'Correia dentada Gates 5521XS', (SELECT id FROM public.parts_categories WHERE name = 'Correias e Polias' LIMIT 1), 'Gates', 215.00, 280.00, 8, 5, 'Prateleira C3', 1, 'Original'),
+    ('PASTILHA-FREIO-D', 'Jogo de pastilhas freio dianteiro', (SELECT id FROM public.parts_categories WHERE name = 'Freios' LIMIT 1), 'Bosch', 185.00, 250.00, 12, 8, 'Prateleira D1', 1, NULL);
+COMMIT;
+
+
+BEGIN;
+INSERT INTO public.parts (
+    code, name, category_id, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes
+) VALUES
+    ('DISCO-FREIO-T', 'Disco de freio traseiro', (SELECT id FROM public.parts_categories WHERE name = 'Freios' LIMIT 1), 'TRW', 280.00, 380.00, 6, 4, 'Prateleira D2', 1, NULL),
+    ('COD''X', 'Peça com \ barra', (SELECT id FROM public.parts_categories WHERE name = NULL LIMIT 1), NULL, 0, 0, 0, 0, NULL, 4, NULL);
+COMMIT;
+
+-- Total de registros: 6
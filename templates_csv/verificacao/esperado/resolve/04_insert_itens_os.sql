@@ -0,0 +1,132 @@
+-- =============================================
+-- INSERÇÃO DE ITENS DE OS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0001' LIMIT 1),
+    'mao_de_obra',
+    'Troca de correia dentada',
+    1.0,
+    350.0,
+    350.0,
+    'pendente',
+    NULL
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0001' LIMIT 1),
+    'peca',
+    'Correia dentada Gates',
+    1.0,
+    280.0,
+    280.0,
+    'pendente',
+    'Código: 5521XS'
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0001' LIMIT 1),
+    'peca',
+    'Tensor de correia',
+    1.0,
+    220.0,
+    220.0,
+    'pendente',
+    'Código: T43089'
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0002' LIMIT 1),
+    'mao_de_obra',
+    'Troca de óleo e filtros',
+    1.0,
+    150.0,
+    150.0,
+    'concluido',
+    NULL
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0002' LIMIT 1),
+    'peca',
+    'Óleo Mobil Super 5W30 (4L)',
+    1.0,
+    180.0,
+    180.0,
+    'concluido',
+    NULL
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0002' LIMIT 1),
+    'peca',
+    'Filtro de óleo',
+    1.0,
+    35.0,
+    35.0,
+    'concluido',
+    NULL
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0002' LIMIT 1),
+    'mao_de_obra',
+    'Alinhamento e balanceamento',
+    1.0,
+    120.0,
+    120.0,
+    'em_andamento',
+    NULL
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0003' LIMIT 1),
+    'peca',
+    'Trava d''água 1/2"',
+    2.0,
+    0.5,
+    1.0,
+    'pendente',
+    NULL
+);
+
+
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0003' LIMIT 1),
+    'mao_de_obra',
+    'Ajuste',
+    1.0,
+    1234567.89,
+    1234567.89,
+    'pendente',
+    '\N literal'
+);
+
+-- Total de registros: 9
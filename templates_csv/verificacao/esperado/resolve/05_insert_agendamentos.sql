@@ -0,0 +1,58 @@
+-- =============================================
+-- INSERÇÃO DE AGENDAMENTOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+INSERT INTO public.appointments (
+    vehicle_id, user_id, company_id, scheduled_date, service_type, status, notes
+) VALUES (
+    (SELECT id FROM public.vehicles WHERE plate = 'ABC-1234' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '12345678909' LIMIT 1),
+    1,
+    '2026-02-05 09:00:00',
+    'Troca de pastilhas de freio',
+    'confirmado',
+    'Preferência: período da manhã'
+);
+
+
+INSERT INTO public.appointments (
+    vehicle_id, user_id, company_id, scheduled_date, service_type, status, notes
+) VALUES (
+    (SELECT id FROM public.vehicles WHERE plate = 'DEF-9012' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '98765432100' LIMIT 1),
+    1,
+    '2026-02-08 14:00:00',
+    'Revisão completa',
+    'pendente',
+    NULL
+);
+
+
+INSERT INTO public.appointments (
+    vehicle_id, user_id, company_id, scheduled_date, service_type, status, notes
+) VALUES (
+    (SELECT id FROM public.vehicles WHERE plate = 'XYZ-5678' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '12345678909' LIMIT 1),
+    2,
+    '2026-02-10 10:30:00',
+    'Alinhamento e balanceamento',
+    'confirmado',
+    NULL
+);
+
+
+INSERT INTO public.appointments (
+    vehicle_id, user_id, company_id, scheduled_date, service_type, status, notes
+) VALUES (
+    (SELECT id FROM public.vehicles WHERE plate = 'JKL-0A12' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '11144477735' LIMIT 1),
+    3,
+    '2026-03-01 07:45:00',
+    'Revisão d''óleo',
+    'pendente',
+    'tab	aqui'
+);
+
+-- Total de registros: 4
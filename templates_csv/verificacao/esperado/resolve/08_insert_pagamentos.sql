@@ -0,0 +1,51 @@
+-- =============================================
+-- INSERÇÃO DE PAGAMENTOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+INSERT INTO public.payments (
+    ordem_servico_id, client_id, payment_method_id, payment_date, amount, amount_paid, status, installments, notes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0002' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '12345678909' LIMIT 1),
+    (SELECT id FROM public.payment_methods WHERE name = 'pix' LIMIT 1),
+    '2026-01-31',
+    650.00,
+    650.00,
+    'pago',
+    1,
+    'Pagamento à vista com 5% desconto'
+);
+
+
+INSERT INTO public.payments (
+    ordem_servico_id, client_id, payment_method_id, payment_date, amount, amount_paid, status, installments, notes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0001' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '12345678909' LIMIT 1),
+    (SELECT id FROM public.payment_methods WHERE name = 'cartao_credito' LIMIT 1),
+    '2026-02-02',
+    850.00,
+    850.00,
+    'pendente',
+    3,
+    'Parcelado em 3x sem juros'
+);
+
+
+INSERT INTO public.payments (
+    ordem_servico_id, client_id, payment_method_id, payment_date, amount, amount_paid, status, installments, notes
+) VALUES (
+    (SELECT id FROM public.ordens_servico WHERE numero_os = 'OS-2026-0003' LIMIT 1),
+    (SELECT id FROM public.profiles WHERE cpf = '11144477735' LIMIT 1),
+    (SELECT id FROM public.payment_methods WHERE name = 'dinheiro' LIMIT 1),
+    NOW(),
+    0.10,
+    0,
+    'pendente',
+    1,
+    NULL
+);
+
+-- Total de registros: 3
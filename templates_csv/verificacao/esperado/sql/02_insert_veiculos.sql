@@ -0,0 +1,70 @@
+-- =============================================
+-- INSERÇÃO DE VEÍCULOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+
+INSERT INTO public.vehicles (
+    plate, brand, model, year, color, user_id, mileage, chassis, renavam, notes
+) VALUES (
+    'ABC-1234',
+    'Honda',
+    'Civic EXL 2.0',
+    2022,
+    'Preto',
+    (SELECT id FROM public.profiles WHERE cpf = '12345678909' LIMIT 1),
+    45000,
+    '9BWZZZ377VT004251',
+    '00123456789',
+    'Veículo em excelente estado'
+);
+
+
+INSERT INTO public.vehicles (
+    plate, brand, model, year, color, user_id, mileage, chassis, renavam, notes
+) VALUES (
+    'XYZ-5678',
+    'Toyota',
+    'Corolla XEI',
+    2021,
+    'Prata',
+    (SELECT id FROM public.profiles WHERE cpf = '12345678909' LIMIT 1),
+    38000,
+    '9BR53ZEC4L8123456',
+    '00987654321',
+    NULL
+);
+
+
+INSERT INTO public.vehicles (
+    plate, brand, model, year, color, user_id, mileage, chassis, renavam, notes
+) VALUES (
+    'DEF-9012',
+    'Volkswagen',
+    'Jetta TSI',
+    2020,
+    'Branco',
+    (SELECT id FROM public.profiles WHERE cpf = '98765432100' LIMIT 1),
+    52000,
+    '3VW2K7AJ8LM123456',
+    '00456789123',
+    NULL
+);
+
+
+INSERT INTO public.vehicles (
+    plate, brand, model, year, color, user_id, mileage, chassis, renavam, notes
+) VALUES (
+    'JKL-0A12',
+    'Fiat',
+    'Uno Mille 1.0 ''Fire''',
+    NULL,
+    NULL,
+    (SELECT id FROM public.profiles WHERE cpf = '11144477735' LIMIT 1),
+    NULL,
+    NULL,
+    NULL,
+    NULL
+);
+
+-- Total de registros: 4
@@ -0,0 +1,50 @@
+-- =============================================
+-- INSERÇÃO DE ITENS DE OS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_itens_os ON COMMIT DROP AS
+SELECT
+    t.tipo,
+    t.descricao,
+    t.quantidade,
+    t.valor_unitario,
+    t.valor_total,
+    t.status,
+    t.observacoes,
+    NULL::text AS numero_os
+FROM public.ordem_servico_items t WITH NO DATA;
+INSERT INTO _stg_itens_os (
+    numero_os, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+) VALUES
+    ('OS-2026-0001', 'mao_de_obra', 'Troca de correia dentada', 1.0, 350.0, 350.0, 'pendente', NULL),
+    ('OS-2026-0001', 'peca', 'Correia dentada Gates', 1.0, 280.0, 280.0, 'pendente', 'Código: 5521XS'),
+    ('OS-2026-0001', 'peca', 'Tensor de correia', 1.0, 220.0, 220.0, 'pendente', 'Código: T43089'),
+    ('OS-2026-0002', 'mao_de_obra', 'Troca de óleo e filtros', 1.0, 150.0, 150.0, 'concluido', NULL),
+    ('OS-2026-0002', 'peca', 'Óleo Mobil Super 5W30 (4L)', 1.0, 180.0, 180.0, 'concluido', NULL),
+    ('OS-2026-0002', 'peca', 'Filtro de óleo', 1.0, 35.0, 35.0, 'concluido', NULL),
+    ('OS-2026-0002', 'mao_de_obra', 'Alinhamento e balanceamento', 1.0, 120.0, 120.0, 'em_andamento', NULL),
+    ('OS-2026-0003', 'peca', 'Trava d''água 1/2"', 2.0, 0.5, 1.0, 'pendente', NULL),
+    ('OS-2026-0003', 'mao_de_obra', 'Ajuste', 1.0, 1234567.89, 1234567.89, 'pendente', '\N literal');
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+)
+SELECT
+    j1.v1,
+    s.tipo,
+    s.descricao,
+    s.quantidade,
+    s.valor_unitario,
+    s.valor_total,
+    s.status,
+    s.observacoes
+FROM _stg_itens_os s
+LEFT JOIN (
+    SELECT DISTINCT ON (numero_os) numero_os, id AS v1
+    FROM public.ordens_servico
+    WHERE numero_os IN (SELECT numero_os FROM _stg_itens_os)
+) j1 ON j1.numero_os = s.numero_os;
+COMMIT;
+
+-- Total de registros: 9
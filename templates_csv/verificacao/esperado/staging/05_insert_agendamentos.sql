@@ -0,0 +1,48 @@
+-- =============================================
+-- INSERÇÃO DE AGENDAMENTOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_agendamentos ON COMMIT DROP AS
+SELECT
+    t.company_id,
+    t.scheduled_date,
+    t.service_type,
+    t.status,
+    t.notes,
+    NULL::text AS placa_veiculo,
+    NULL::text AS cpf_cliente
+FROM public.appointments t WITH NO DATA;
+INSERT INTO _stg_agendamentos (
+    placa_veiculo, cpf_cliente, company_id, scheduled_date, service_type, status, notes
+) VALUES
+    ('ABC-1234', '12345678909', 1, '2026-02-05 09:00:00', 'Troca de pastilhas de freio', 'confirmado', 'Preferência: período da manhã'),
+    ('DEF-9012', '98765432100', 1, '2026-02-08 14:00:00', 'Revisão completa', 'pendente', NULL),
+    ('XYZ-5678', '12345678909', 2, '2026-02-10 10:30:00', 'Alinhamento e balanceamento', 'confirmado', NULL),
+    ('JKL-0A12', '11144477735', 3, '2026-03-01 07:45:00', 'Revisão d''óleo', 'pendente', 'tab	aqui');
+INSERT INTO public.appointments (
+    vehicle_id, user_id, company_id, scheduled_date, service_type, status, notes
+)
+SELECT
+    j1.v1,
+    j2.v1,
+    s.company_id,
+    s.scheduled_date,
+    s.service_type,
+    s.status,
+    s.notes
+FROM _stg_agendamentos s
+LEFT JOIN (
+    SELECT DISTINCT ON (plate) plate, id AS v1
+    FROM public.vehicles
+    WHERE plate IN (SELECT placa_veiculo FROM _stg_agendamentos)
+) j1 ON j1.plate = s.placa_veiculo
+LEFT JOIN (
+    SELECT DISTINCT ON (cpf) cpf, id AS v1
+    FROM public.profiles
+    WHERE cpf IN (SELECT cpf_cliente FROM _stg_agendamentos)
+) j2 ON j2.cpf = s.cpf_cliente;
+COMMIT;
+
+-- Total de registros: 4
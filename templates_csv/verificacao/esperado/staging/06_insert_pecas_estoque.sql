@@ -0,0 +1,53 @@
+-- =============================================
+-- INSERÇÃO DE PEÇAS (ESTOQUE)
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_pecas_estoque ON COMMIT DROP AS
+SELECT
+    t.code,
+    t.name,
+    t.manufacturer,
+    t.cost_price,
+    t.sale_price,
+    t.current_stock,
+    t.minimum_stock,
+    t.location,
+    t.company_id,
+    t.notes,
+    NULL::text AS categoria
+FROM public.parts t WITH NO DATA;
+INSERT INTO _stg_pecas_estoque (
+    code, name, categoria, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes
+) VALUES
+    ('OLEO-5W30-4L', 'Óleo Mobil Super 5W30 (4L)', 'Lubrificantes', 'Mobil', 145.00, 180.00, 24, 10, 'Prateleira A1', 1, NULL),
+    ('FILTRO-OLEO-123', 'Filtro de óleo universal', 'Filtros', 'Tecfil', 22.00, 35.00, 45, 15, 'Prateleira B2', 1, NULL),
+    ('CORREIA-5521XS', 'Correia dentada Gates 5521XS', 'Correias e Polias', 'Gates', 215.00, 280.00, 8, 5, 'Prateleira C3', 1, 'Original'),
+    ('PASTILHA-FREIO-D', 'Jogo de pastilhas freio dianteiro', 'Freios', 'Bosch', 185.00, 250.00, 12, 8, 'Prateleira D1', 1, NULL),
+    ('DISCO-FREIO-T', 'Disco de freio traseiro', 'Freios', 'TRW', 280.00, 380.00, 6, 4, 'Prateleira D2', 1, NULL),
+    ('COD''X', 'Peça com \ barra', NULL, NULL, 0, 0, 0, 0, NULL, 4, NULL);
+INSERT INTO public.parts (
+    code, name, category_id, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes
+)
+SELECT
+    s.code,
+    s.name,
+    j1.v1,
+    s.manufacturer,
+    s.cost_price,
+    s.sale_price,
+    s.current_stock,
+    s.minimum_stock,
+    s.location,
+    s.company_id,
+    s.notes
+FROM _stg_pecas_estoque s
+LEFT JOIN (
+    SELECT DISTINCT ON (name) name, id AS v1
+    FROM public.parts_categories
+    WHERE name IN (SELECT categoria FROM _stg_pecas_estoque)
+) j1 ON j1.name = s.categoria;
+COMMIT;
+
+-- Total de registros: 6
@@ -0,0 +1,10 @@
+-- =============================================
+-- INSERÇÃO DE CLIENTES
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+\copy public.profiles (full_name, cpf, email, phone, birth_date, address, zip_code, city, state, loyalty_tier, loyalty_points, company_id, notes) FROM '01_clientes.tsv'
+COMMIT;
+
+-- Total de registros: 4
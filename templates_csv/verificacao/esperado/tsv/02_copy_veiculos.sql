@@ -0,0 +1,43 @@
+-- =============================================
+-- INSERÇÃO DE VEÍCULOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_veiculos ON COMMIT DROP AS
+SELECT
+    t.plate,
+    t.brand,
+    t.model,
+    t.year,
+    t.color,
+    t.mileage,
+    t.chassis,
+    t.renavam,
+    t.notes,
+    NULL::text AS cpf_cliente
+FROM public.vehicles t WITH NO DATA;
+\copy _stg_veiculos (plate, brand, model, year, color, cpf_cliente, mileage, chassis, renavam, notes) FROM '02_veiculos.tsv'
+INSERT INTO public.vehicles (
+    plate, brand, model, year, color, user_id, mileage, chassis, renavam, notes
+)
+SELECT
+    s.plate,
+    s.brand,
+    s.model,
+    s.year,
+    s.color,
+    j1.v1,
+    s.mileage,
+    s.chassis,
+    s.renavam,
+    s.notes
+FROM _stg_veiculos s
+LEFT JOIN (
+    SELECT DISTINCT ON (cpf) cpf, id AS v1
+    FROM public.profiles
+    WHERE cpf IN (SELECT cpf_cliente FROM _stg_veiculos)
+) j1 ON j1.cpf = s.cpf_cliente;
+COMMIT;
+
+-- Total de registros: 4
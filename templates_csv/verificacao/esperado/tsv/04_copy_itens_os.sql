@@ -0,0 +1,39 @@
+-- =============================================
+-- INSERÇÃO DE ITENS DE OS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_itens_os ON COMMIT DROP AS
+SELECT
+    t.tipo,
+    t.descricao,
+    t.quantidade,
+    t.valor_unitario,
+    t.valor_total,
+    t.status,
+    t.observacoes,
+    NULL::text AS numero_os
+FROM public.ordem_servico_items t WITH NO DATA;
+\copy _stg_itens_os (numero_os, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes) FROM '04_itens_os.tsv'
+INSERT INTO public.ordem_servico_items (
+    ordem_servico_id, tipo, descricao, quantidade, valor_unitario, valor_total, status, observacoes
+)
+SELECT
+    j1.v1,
+    s.tipo,
+    s.descricao,
+    s.quantidade,
+    s.valor_unitario,
+    s.valor_total,
+    s.status,
+    s.observacoes
+FROM _stg_itens_os s
+LEFT JOIN (
+    SELECT DISTINCT ON (numero_os) numero_os, id AS v1
+    FROM public.ordens_servico
+    WHERE numero_os IN (SELECT numero_os FROM _stg_itens_os)
+) j1 ON j1.numero_os = s.numero_os;
+COMMIT;
+
+-- Total de registros: 9
@@ -0,0 +1,42 @@
+-- =============================================
+-- INSERÇÃO DE AGENDAMENTOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_agendamentos ON COMMIT DROP AS
+SELECT
+    t.company_id,
+    t.scheduled_date,
+    t.service_type,
+    t.status,
+    t.notes,
+    NULL::text AS placa_veiculo,
+    NULL::text AS cpf_cliente
+FROM public.appointments t WITH NO DATA;
+\copy _stg_agendamentos (placa_veiculo, cpf_cliente, company_id, scheduled_date, service_type, status, notes) FROM '05_agendamentos.tsv'
+INSERT INTO public.appointments (
+    vehicle_id, user_id, company_id, scheduled_date, service_type, status, notes
+)
+SELECT
+    j1.v1,
+    j2.v1,
+    s.company_id,
+    s.scheduled_date,
+    s.service_type,
+    s.status,
+    s.notes
+FROM _stg_agendamentos s
+LEFT JOIN (
+    SELECT DISTINCT ON (plate) plate, id AS v1
+    FROM public.vehicles
+    WHERE plate IN (SELECT placa_veiculo FROM _stg_agendamentos)
+) j1 ON j1.plate = s.placa_veiculo
+LEFT JOIN (
+    SELECT DISTINCT ON (cpf) cpf, id AS v1
+    FROM public.profiles
+    WHERE cpf IN (SELECT cpf_cliente FROM _stg_agendamentos)
+) j2 ON j2.cpf = s.cpf_cliente;
+COMMIT;
+
+-- Total de registros: 4
@@ -0,0 +1,45 @@
+-- =============================================
+-- INSERÇÃO DE PEÇAS (ESTOQUE)
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_pecas_estoque ON COMMIT DROP AS
+SELECT
+    t.code,
+    t.name,
+    t.manufacturer,
+    t.cost_price,
+    t.sale_price,
+    t.current_stock,
+    t.minimum_stock,
+    t.location,
+    t.company_id,
+    t.notes,
+    NULL::text AS categoria
+FROM public.parts t WITH NO DATA;
+\copy _stg_pecas_estoque (code, name, categoria, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes) FROM '06_pecas_estoque.tsv'
+INSERT INTO public.parts (
+    code, name, category_id, manufacturer, cost_price, sale_price, current_stock, minimum_stock, location, company_id, notes
+)
+SELECT
+    s.code,
+    s.name,
+    j1.v1,
+    s.manufacturer,
+    s.cost_price,
+    s.sale_price,
+    s.current_stock,
+    s.minimum_stock,
+    s.location,
+    s.company_id,
+    s.notes
+FROM _stg_pecas_estoque s
+LEFT JOIN (
+    SELECT DISTINCT ON (name) name, id AS v1
+    FROM public.parts_categories
+    WHERE name IN (SELECT categoria FROM _stg_pecas_estoque)
+) j1 ON j1.name = s.categoria;
+COMMIT;
+
+-- Total de registros: 6
@@ -0,0 +1,51 @@
+-- =============================================
+-- INSERÇÃO DE PAGAMENTOS
+-- Gerado em: 2026-01-01 00:00:00
+-- =============================================
+
+BEGIN;
+CREATE TEMP TABLE _stg_pagamentos ON COMMIT DROP AS
+SELECT
+    t.payment_date,
+    t.amount,
+    t.amount_paid,
+    t.status,
+    t.installments,
+    t.notes,
+    NULL::text AS numero_os,
+    NULL::text AS cpf_cliente,
+    NULL::text AS forma_pagamento
+FROM public.payments t WITH NO DATA;
+\copy _stg_pagamentos (numero_os, cpf_cliente, forma_pagamento, payment_date, amount, amount_paid, status, installments, notes) FROM '08_pagamentos.tsv'
+INSERT INTO public.payments (
+    ordem_servico_id, client_id, payment_method_id, payment_date, amount, amount_paid, status, installments, notes
+)
+SELECT
+    j1.v1,
+    j2.v1,
+    j3.v1,
+    COALESCE(s.payment_date, NOW()),
+    s.amount,
+    s.amount_paid,
+    s.status,
+    s.installments,
+    s.notes
+FROM _stg_pagamentos s
+LEFT JOIN (
+    SELECT DISTINCT ON (numero_os) numero_os, id AS v1
+    FROM public.ordens_servico
+    WHERE numero_os IN (SELECT numero_os FROM _stg_pagamentos)
+) j1 ON j1.numero_os = s.numero_os
+LEFT JOIN (
+    SELECT DISTINCT ON (cpf) cpf, id AS v1
+    FROM public.profiles
+    WHERE cpf IN (SELECT cpf_cliente FROM _stg_pagamentos)
+) j2 ON j2.cpf = s.cpf_cliente
+LEFT JOIN (
+    SELECT DISTINCT ON (name) name, id AS v1
+    FROM public.payment_methods
+    WHERE name IN (SELECT forma_pagamento FROM _stg_pagamentos)
+) j3 ON j3.name = s.forma_pagamento;
+COMMIT;
+
+-- Total de registros: 3